@@ -1,10 +1,19 @@
 import streamlit as st
 
+from core.dataset import render_memory_report
+from core.filters import HALAMAN, render_sidebar as render_filter
+from core.instrument import begin_rerun, end_rerun, render_sidebar
+from core.warmup import render_status, start_warmup
+
+# Warm-up cache di latar belakang (sekali per proses)
+start_warmup()
+
 pages = [
     st.Page(page="pages/page1.py", title="Beranda", icon="🏠"),
     st.Page(page="pages/page2.py", title="Data Interaktif", icon="📊"),
     st.Page(page="pages/page3.py", title="Analisis Data & Kesimpulan", icon="🔬"),
-    st.Page(page="pages/page4.py", title="Cara Mengunduh Data", icon="⬇️")
+    st.Page(page="pages/page4.py", title="Cara Mengunduh Data", icon="⬇️"),
+    st.Page(page="pages/page5.py", title="Statistik Cache", icon="🧰")
 ]
 
 pg = st.navigation(
@@ -12,7 +21,15 @@ pg = st.navigation(
     position="sidebar",
     expanded=True
 )
+# Filter provinsi & tahun dipakai bersama oleh halaman data dan analisis
+if pg.title in HALAMAN:
+    render_filter()
+
+begin_rerun()
 pg.run()
+render_sidebar(end_rerun(pg.title))
+render_status()
+render_memory_report()
 
 st.markdown(
     """
@@ -0,0 +1 @@
+# Benchmark rerun per halaman dengan data BPS sintetis.
@@ -0,0 +1,203 @@
+"""
+Benchmark rerun per halaman dengan AppTest (headless).
+
+Contoh:
+    python -m bench.run --size 34x10x11 --size 514x50x200 --format parquet
+    python -m bench.run --pages page2 page3 --output bench_output.json
+
+Setiap (ukuran, halaman) dijalankan di subprocess terpisah agar cache
+Streamlit dingin dan puncak memori (max RSS) tidak bercampur.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench.synthetic import write_datasets
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = {
+    "app": "app.py",
+    "page1": "pages/page1.py",
+    "page2": "pages/page2.py",
+    "page3": "pages/page3.py",
+    "page4": "pages/page4.py",
+}
+
+DEFAULT_SIZES = ["34x10x11", "154x20x50", "514x50x200"]
+
+
+# =====================================================
+# INTERAKSI PER HALAMAN
+# =====================================================
+def _filter(at, **ubah):
+    # Provinsi & tahun adalah filter bersama sesi (diatur app.py)
+    from dataclasses import replace
+
+    from core.filters import KEY_STATE
+
+    def action():
+        at.session_state[KEY_STATE] = replace(at.session_state[KEY_STATE], **ubah)
+    return action
+
+
+def _page2(at):
+    from core.filters import KEY_STATE
+
+    state = at.session_state[KEY_STATE]
+    lo, hi = state.tahun
+    return [
+        ("indikator", lambda: at.sidebar.selectbox[0].set_value("IPM")),
+        ("provinsi", _filter(at, provinsi=state.provinsi[:10])),
+        ("tahun", _filter(at, tahun=(lo + 1, hi))),
+    ]
+
+
+def _page3(at):
+    from core.filters import KEY_STATE
+
+    state = at.session_state[KEY_STATE]
+    lo, hi = state.tahun
+    indikator = at.sidebar.selectbox[0]
+    return [
+        ("indikator", lambda: indikator.set_value(indikator.options[1])),
+        ("tahun", _filter(at, tahun=(lo + 1, hi))),
+        ("provinsi", _filter(at, provinsi=state.provinsi[:10])),
+        ("sebab_akibat", lambda: at.multiselect[0].set_value(
+            at.multiselect[0].options[:3]
+        )),
+    ]
+
+
+INTERACTIONS = {"page2": _page2, "page3": _page3}
+
+
+def _maxrss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _errors(at):
+    return [e.value for e in at.exception]
+
+
+def measure_page(page, timeout):
+    """Jalankan satu halaman: cold load, rerun, lalu tiap interaksi."""
+    from streamlit.testing.v1 import AppTest
+
+    rss_start = _maxrss_kb()
+    at = AppTest.from_file(os.path.join(BASE_DIR, PAGES[page]), default_timeout=timeout)
+
+    t0 = time.perf_counter()
+    at.run()
+    result = {
+        "page": page,
+        "cold_load_s": time.perf_counter() - t0,
+        "errors": _errors(at),
+    }
+
+    t0 = time.perf_counter()
+    at.run()
+    result["rerun_s"] = time.perf_counter() - t0
+
+    interactions = {}
+    for name, action in INTERACTIONS.get(page, lambda at: [])(at):
+        action()
+        t0 = time.perf_counter()
+        at.run()
+        interactions[name] = time.perf_counter() - t0
+        result["errors"] += _errors(at)
+    result["interactions_s"] = interactions
+
+    result["rss_start_kb"] = rss_start
+    result["peak_rss_kb"] = _maxrss_kb()
+    return result
+
+
+# =====================================================
+# ORKESTRASI
+# =====================================================
+def parse_size(text):
+    regions, years, indicators = (int(x) for x in text.lower().split("x"))
+    return {"regions": regions, "years": years, "indicators": indicators}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_size(size, pages, fmt, timeout):
+    with tempfile.TemporaryDirectory(prefix="kelompok1-bench-") as tmp:
+        t0 = time.perf_counter()
+        interaktif, analisis = write_datasets(os.path.join(tmp, "data"), fmt=fmt, **size)
+        generate_s = time.perf_counter() - t0
+
+        results = []
+        for page in pages:
+            env = dict(
+                os.environ,
+                KELOMPOK1_DATA_INTERAKTIF=interaktif,
+                KELOMPOK1_DATA_ANALISIS=analisis,
+                KELOMPOK1_CACHE_DIR=os.path.join(tmp, "cache", page),
+            )
+            proc = subprocess.run(
+                [sys.executable, "-m", "bench.run", "--worker", page,
+                 "--timeout", str(timeout)],
+                cwd=BASE_DIR, env=env, capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                results.append({"page": page, "errors": [proc.stderr[-2000:]]})
+            else:
+                results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        return {**size, "rows": size["regions"] * size["years"],
+                "generate_s": generate_s, "pages": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", action="append",
+                        help="wilayah x tahun x indikator, mis. 34x10x11")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--format", choices=["xlsx", "csv", "parquet"], default="xlsx")
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", help="file JSON hasil (default: stdout)")
+    parser.add_argument("--worker", choices=list(PAGES), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        import logging
+        logging.disable(logging.WARNING)
+        print(json.dumps(measure_page(args.worker, args.timeout)))
+        return
+
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "format": args.format,
+        "sizes": [
+            run_size(parse_size(s), args.pages, args.format, args.timeout)
+            for s in (args.size or DEFAULT_SIZES)
+        ],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# =====================================================
+# SKEMA SAMA DENGAN Dataset.xlsx
+# =====================================================
+INDIKATOR = [
+    "AHH",
+    "AML",
+    "PPM",
+    "RLS",
+    "TPT",
+    "IPM",
+    "E_Growth",
+    "Laju_Pertumbuhan",
+    "PDRB_Kapita",
+    "Inflasi_(YoY)",
+    "Gini_Ratio",
+]
+
+PROVINSI = [
+    "Aceh", "Bali", "Banten", "Bengkulu", "Di Yogyakarta", "Dki Jakarta",
+    "Gorontalo", "Jambi", "Jawa Barat", "Jawa Tengah", "Jawa Timur",
+    "Kalimantan Barat", "Kalimantan Selatan", "Kalimantan Tengah",
+    "Kalimantan Timur", "Kalimantan Utara", "Kepulauan Bangka Belitung",
+    "Kepulauan Riau", "Lampung", "Maluku", "Maluku Utara",
+    "Nusa Tenggara Barat", "Nusa Tenggara Timur", "Papua", "Papua Barat",
+    "Riau", "Sulawesi Barat", "Sulawesi Selatan", "Sulawesi Tengah",
+    "Sulawesi Tenggara", "Sulawesi Utara", "Sumatera Barat",
+    "Sumatera Selatan", "Sumatera Utara",
+]
+
+# Kisaran nilai kasar per indikator (level awal, tren per tahun, noise)
+_PROFIL = {
+    "AHH": (70.0, 0.2, 0.1),
+    "AML": (95.0, 0.2, 0.3),
+    "PPM": (10.0, -0.3, 0.4),
+    "RLS": (8.5, 0.1, 0.05),
+    "TPT": (5.0, -0.1, 0.5),
+    "IPM": (70.0, 0.6, 0.2),
+    "E_Growth": (5.0, 0.0, 1.5),
+    "Laju_Pertumbuhan": (5.0, 0.0, 1.5),
+    "PDRB_Kapita": (40000.0, 1200.0, 800.0),
+    "Inflasi_(YoY)": (3.0, 0.0, 1.0),
+    "Gini_Ratio": (0.36, -0.001, 0.01),
+}
+
+
+def region_names(n):
+    """34 provinsi asli lalu wilayah sintetis (tingkat kabupaten/kota)."""
+    names = PROVINSI[:n]
+    names += [f"Kabupaten Sintetis {i:04d}" for i in range(1, n - len(names) + 1)]
+    return names
+
+
+def indicator_names(k):
+    names = INDIKATOR[:k]
+    names += [f"Indikator_{i:03d}" for i in range(len(names) + 1, k + 1)]
+    return names
+
+
+def generate(regions=34, years=10, indicators=11, start_year=2015, seed=0):
+    """DataFrame panjang Provinsi/Tahun/indikator berbentuk data BPS."""
+    rng = np.random.default_rng(seed)
+    wilayah = region_names(regions)
+    kolom = indicator_names(indicators)
+    tahun = np.arange(start_year, start_year + years)
+
+    # Semua kolom dikumpulkan dulu lalu dibuat satu DataFrame; menambah
+    # kolom satu per satu memecah blok pandas pada ratusan indikator
+    data = {
+        "Provinsi": np.repeat(wilayah, years),
+        "Tahun": np.tile(tahun, regions),
+    }
+    n = regions * years
+    t = np.tile(np.arange(years), regions)
+    for col in kolom:
+        level, tren, noise = _PROFIL.get(col, (50.0, 0.5, 2.0))
+        offset = np.repeat(rng.normal(0, abs(level) * 0.1, regions), years)
+        data[col] = np.round(
+            level + offset + tren * t + rng.normal(0, noise, n), 3
+        )
+    return pd.DataFrame(data)
+
+
+def write_datasets(out_dir, regions=34, years=10, indicators=11, fmt="xlsx", seed=0):
+    """
+    Tulis pasangan dataset sintetis untuk kedua halaman data.
+
+    Mengembalikan (path Data Interaktif, path Analisis). File Analisis
+    memakai nama provinsi huruf kapital seperti Dataset_prakbigdata.xlsx.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    df = generate(regions, years, indicators, seed=seed)
+    analisis = df.assign(Provinsi=df["Provinsi"].str.upper())
+
+    paths = []
+    for name, frame in (("Dataset", df), ("Dataset_prakbigdata", analisis)):
+        path = os.path.join(out_dir, f"{name}.{fmt}")
+        if fmt == "xlsx":
+            frame.to_excel(path, index=False)
+        elif fmt == "csv":
+            frame.to_csv(path, index=False)
+        else:
+            frame.to_parquet(path, index=False)
+        paths.append(path)
+    return tuple(paths)
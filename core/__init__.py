@@ -0,0 +1 @@
+# Modul bersama untuk halaman-halaman dashboard (pemuatan data, cache, analisis).
@@ -0,0 +1,243 @@
+import numpy as np
+import pandas as pd
+
+from core.cache import cached_result
+from core.derived import split_name
+
+ARAH_NAIK = "Meningkat 📈"
+ARAH_TURUN = "Menurun 📉"
+
+
+def label_indikator(col):
+    turunan = split_name(col)
+    if turunan:
+        return f"{label_indikator(turunan[0])} {turunan[1]}"
+    return col.replace("_", " ").title()
+
+
+# =====================================================
+# NARASI OTOMATIS
+# =====================================================
+def trend_narrative(mean_values, means):
+    """Kalimat ringkasan per indikator: rata-rata dan arah tren."""
+    if len(means) < 2:
+        return []
+    M = means.to_numpy(dtype=np.float64)
+    naik = M[-1] > M[0]
+    return [
+        f"Rata-rata {col.replace('_',' ').upper()} sebesar {mean_values[col]:.2f} "
+        f"dan secara umum {'meningkat 📈' if n else 'menurun 📉'} "
+        "selama periode pengamatan."
+        for col, n in zip(means.columns, naik)
+    ]
+
+
+# =====================================================
+# KORELASI BERPASANGAN (VEKTORISASI)
+# =====================================================
+def _pair_ranks(X):
+    # R[..., r, i, j]: ranking rata-rata x_i di baris r, dihitung hanya atas
+    # baris di mana x_i dan x_j sama-sama ada (pairwise-complete).
+    # Perbandingan berpasangan O(baris²) cukup murah karena baris = tahun.
+    W = (~np.isnan(X)).astype(np.float64)
+    a = X[..., :, None, :]
+    b = X[..., None, :, :]
+    # [..., r, i, s] @ [..., s, j]: hitung hanya baris s yang lengkap di j
+    lebih_kecil = np.swapaxes((b < a).astype(np.float64), -1, -2) @ W[..., None, :, :]
+    sama = np.swapaxes((b == a).astype(np.float64), -1, -2) @ W[..., None, :, :]
+    return lebih_kecil + (sama + 1) / 2.0, W
+
+
+def _pairwise_moments(X):
+    # Statistik cukup berpasangan (n, kovarians, varians x, varians y),
+    # semuanya dikalikan n, untuk matriks `[..., baris, kolom]` ber-NaN.
+    W = (~np.isnan(X)).astype(np.float64)
+    X0 = np.where(W > 0, X, 0.0)
+    Xt, Wt = np.swapaxes(X0, -1, -2), np.swapaxes(W, -1, -2)
+
+    n = Wt @ W
+    sx = Xt @ W                      # Σx_i atas baris di mana x_j juga ada
+    sy = np.swapaxes(sx, -1, -2)
+    sxx = (Xt * Xt) @ W
+    syy = np.swapaxes(sxx, -1, -2)
+    sxy = Xt @ X0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+    return n, cov, var_x, var_y
+
+
+def _rank_moments(X):
+    # Seperti `_pairwise_moments`, tetapi atas ranking per pasangan.
+    R, W = _pair_ranks(X)
+    w = W[..., :, :, None] * W[..., :, None, :]      # [..., baris, i, j]
+    x = np.where(w > 0, R, 0.0)
+    y = np.swapaxes(x, -1, -2)
+    n = w.sum(axis=-3)
+    sx, sy = x.sum(axis=-3), y.sum(axis=-3)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = (x * y).sum(axis=-3) - sx * sy / n
+        var_x = (x * x).sum(axis=-3) - sx * sx / n
+        var_y = (y * y).sum(axis=-3) - sy * sy / n
+    return n, cov, var_x, var_y
+
+
+def _column_ranks(X):
+    # Ranking rata-rata per kolom untuk data tanpa NaN: [..., baris, kolom].
+    # Tanpa nilai kembar cukup argsort; jika ada, ranking rata-rata lewat
+    # perbandingan antarbaris (murah karena baris = tahun).
+    urut = np.argsort(X, axis=-2)
+    if not (np.diff(np.take_along_axis(X, urut, axis=-2), axis=-2) == 0).any():
+        R = np.empty_like(X)
+        posisi = np.broadcast_to(
+            np.arange(1.0, X.shape[-2] + 1)[:, None], X.shape
+        )
+        np.put_along_axis(R, urut, posisi, axis=-2)
+        return R
+    kecil = (X[..., None, :, :] < X[..., :, None, :]).sum(axis=-2)
+    sama = (X[..., None, :, :] == X[..., :, None, :]).sum(axis=-2)
+    return kecil + (sama + 1) / 2.0
+
+
+def _take_pairs(M, pairs):
+    # M[..., I, J] lewat indeks datar; jauh lebih murah daripada indeks
+    # lanjutan dua sumbu untuk batch besar
+    if pairs is None:
+        return M
+    I, J = pairs
+    K = M.shape[-1]
+    return np.take(M.reshape(M.shape[:-2] + (K * K,)), I * K + J, axis=-1)
+
+
+def _complete_moments(X, pairs):
+    # Momen terpusat untuk data lengkap: satu perkalian matriks memberi
+    # kovarians semua pasangan, diagonalnya varians per kolom.
+    Xc = X - X.mean(axis=-2, keepdims=True)
+    cov = np.swapaxes(Xc, -1, -2) @ Xc
+    var = np.diagonal(cov, axis1=-2, axis2=-1)
+    if pairs is None:
+        return cov, var[..., :, None], var[..., None, :]
+    I, J = pairs
+    return _take_pairs(cov, pairs), np.take(var, I, axis=-1), np.take(var, J, axis=-1)
+
+
+def _stats_complete(X, method, pairs):
+    cov, var_x, var_y = _complete_moments(X, pairs)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        b = np.where(var_x > 0, cov / var_x, np.nan)
+        if method == "spearman":
+            cov, var_x, var_y = _complete_moments(_column_ranks(X), pairs)
+        r = cov / np.sqrt(var_x * var_y)
+    if X.shape[-2] < 2:
+        r[...] = np.nan
+        b[...] = np.nan
+    return r, b
+
+
+def _stats_pairwise(X, method, pairs):
+    n, cov, var_x, _ = (_take_pairs(m, pairs) for m in _pairwise_moments(X))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        b = np.where(var_x > 0, cov / var_x, np.nan)
+    moments = _rank_moments(X) if method == "spearman" else _pairwise_moments(X)
+    n, cov, var_x, var_y = (_take_pairs(m, pairs) for m in moments)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = cov / np.sqrt(var_x * var_y)
+    r[n < 2] = np.nan
+    b[n < 2] = np.nan
+    return r, b
+
+
+def pairwise_stats(X, method="pearson", pairs=None):
+    """
+    Korelasi dan kemiringan regresi semua pasangan kolom dari matriks
+    `[..., baris, kolom]`, dari momen yang dihitung sekali.
+
+    Matriks tanpa NaN memakai jalur cepat (kovarians terpusat lewat satu
+    perkalian matriks, ranking Spearman per kolom); sisanya jatuh ke
+    statistik cukup pairwise-complete. Untuk batch, keduanya dipilih per
+    matriks. Dengan `pairs=(I, J)` hasilnya hanya untuk pasangan itu,
+    berbentuk `[..., pasangan]`, bukan `[..., kolom, kolom]`.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    lengkap = ~np.isnan(X).any(axis=(-2, -1))
+    if lengkap.all():
+        r, b = _stats_complete(X, method, pairs)
+    elif not lengkap.any():
+        r, b = _stats_pairwise(X, method, pairs)
+    else:
+        K = X.shape[-1]
+        shape = (K, K) if pairs is None else np.shape(pairs[0])
+        r = np.empty(X.shape[:-2] + shape)
+        b = np.empty_like(r)
+        r[lengkap], b[lengkap] = _stats_complete(X[lengkap], method, pairs)
+        r[~lengkap], b[~lengkap] = _stats_pairwise(X[~lengkap], method, pairs)
+    return np.clip(r, -1.0, 1.0), b
+
+
+def pairwise_corr(X, method="pearson"):
+    """
+    Korelasi semua pasangan kolom dari matriks `[..., baris, kolom]`.
+
+    NaN ditangani secara pairwise-complete lewat statistik cukup
+    (n, Σx, Σy, Σx², Σy², Σxy) yang dihitung dengan perkalian matriks,
+    jadi tidak ada loop per pasangan. Untuk Spearman, ranking dihitung
+    ulang per pasangan atas baris yang lengkap di keduanya, sama seperti
+    `DataFrame.corr("spearman")`.
+    """
+    return pairwise_stats(X, method)[0]
+
+
+def pairwise_slope(X):
+    """
+    Kemiringan regresi sederhana kolom j terhadap kolom i (elemen `[i, j]`)
+    untuk semua pasangan, dengan penanganan NaN yang sama seperti
+    `pairwise_corr`.
+    """
+    return pairwise_stats(X)[1]
+
+
+# =====================================================
+# TABEL SEBAB-AKIBAT
+# =====================================================
+def cause_effect_table(means, sebab, dampak, method="pearson"):
+    """
+    Tabel sebab-akibat dari matriks rata-rata tahunan `means`.
+
+    Arah tren (tahun terakhir vs pertama), label pengaruh dan koefisien
+    korelasi dihitung untuk semua pasangan sekaligus dengan NumPy.
+    """
+    kolom = list(means.columns)
+    si = np.array([kolom.index(c) for c in sebab], dtype=np.int64)
+    di = np.array([kolom.index(c) for c in dampak], dtype=np.int64)
+    if len(means) < 2 or len(si) == 0 or len(di) == 0:
+        return pd.DataFrame()
+
+    M = means.to_numpy(dtype=np.float64)
+    naik = M[-1] > M[0]
+    r = pairwise_corr(M, method)
+
+    I, J = np.meshgrid(si, di, indexing="ij")
+    I, J = I.ravel(), J.ravel()
+    keep = I != J                    # jangan bandingkan dengan dirinya sendiri
+    I, J = I[keep], J[keep]
+
+    label = np.array([label_indikator(c) for c in kolom], dtype=object)
+    arah = np.where(naik, ARAH_NAIK, ARAH_TURUN)
+    return pd.DataFrame({
+        "Indikator Penyebab": label[I],
+        "Indikator Dampak": label[J],
+        "Arah Penyebab": arah[I],
+        "Arah Dampak": arah[J],
+        "Pengaruh": np.where(naik[I] == naik[J], "Positif ✅", "Negatif ❌"),
+        f"Korelasi {method.title()}": np.round(r[I, J], 3),
+    })
+
+
+@cached_result("sebab_akibat")
+def cause_effect_table_cached(version, provinsi, tahun, sebab, dampak, method, _be):
+    """`cause_effect_table` yang di-memo per (versi data, filter, pasangan, metode)."""
+    return cause_effect_table(
+        _be.year_means(list(provinsi), tahun), list(sebab), list(dampak), method
+    )
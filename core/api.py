@@ -0,0 +1,260 @@
+"""
+API HTTP lokal di atas lapisan data yang sama dengan dashboard.
+
+Contoh:
+    python -m core.api --port 8502
+    curl 'http://127.0.0.1:8502/api/analisis/agg?by=tahun,provinsi&kolom=ipm'
+    curl 'http://127.0.0.1:8502/api/interaktif/rows?provinsi=Aceh&tahun=2018-2024&format=arrow'
+
+Endpoint (dataset = interaktif | analisis):
+    GET /api                      daftar dataset, versi dan skema
+    GET /api/<dataset>/meta       indikator + nama & definisi
+    GET /api/<dataset>/rows       baris terfilter (provinsi, tahun, kolom, limit, offset)
+    GET /api/<dataset>/agg        rata-rata per by = tahun | provinsi | tahun,provinsi
+
+Respons berupa JSON ringkas (orient "split") atau Arrow IPC stream
+(`format=arrow` atau header Accept). ETag diturunkan dari versi dataset dan
+query, sehingga polling dengan If-None-Match dijawab 304 tanpa menyentuh data.
+"""
+import argparse
+import hashlib
+import io
+import json
+import logging
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import pyarrow as pa
+
+from core.backend import backend_analisis, backend_interaktif
+from core.cache import result_cache
+from core.dataset import province_key, widen_float32
+from core.indikator import metadata
+
+DATASET = {"interaktif": backend_interaktif, "analisis": backend_analisis}
+ARROW = "application/vnd.apache.arrow.stream"
+LIMIT_DEFAULT = 10_000
+
+log = logging.getLogger("kelompok1.api")
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# =====================================================
+# PARAMETER QUERY
+# =====================================================
+def _list(query, name):
+    # ?kolom=a,b&kolom=c -> [a, b, c]
+    return [v for item in query.get(name, []) for v in item.split(",") if v]
+
+
+def _provinsi(be, query):
+    diminta = _list(query, "provinsi")
+    if not diminta:
+        return list(be.provinces)
+    keys = {province_key(p) for p in diminta}
+    return [p for p in be.provinces if province_key(p) in keys]
+
+
+def _tahun(be, query):
+    teks = query.get("tahun", [""])[0]
+    if not teks:
+        return (be.year_min, be.year_max)
+    try:
+        awal, _, akhir = teks.partition("-")
+        return (int(awal), int(akhir or awal))
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"tahun tidak valid: {teks!r}")
+
+
+def _kolom(be, query):
+    kolom = _list(query, "kolom") or list(be.schema.indikator)
+    salah = [c for c in kolom if c not in be.schema.indikator]
+    if salah:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"kolom tidak dikenal: {salah}")
+    return kolom
+
+
+def _int(query, name, default):
+    try:
+        return int(query.get(name, [default])[0])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} harus bilangan bulat")
+
+
+# =====================================================
+# ENDPOINT
+# =====================================================
+def _rows(be, query):
+    kolom = _kolom(be, query)
+    offset = _int(query, "offset", 0)
+    limit = _int(query, "limit", LIMIT_DEFAULT)
+    df = be.filter(_provinsi(be, query), _tahun(be, query))
+    df = df[[be.schema.prov, be.schema.tahun] + kolom]
+    return df.iloc[offset:offset + limit], {"total": len(df), "offset": offset}
+
+
+def _agg(be, query):
+    provinsi, tahun, kolom = _provinsi(be, query), _tahun(be, query), _kolom(be, query)
+    by = tuple(_list(query, "by"))
+    prov, thn = be.schema.prov, be.schema.tahun
+    if by == ("tahun",):
+        df = be.year_means(provinsi, tahun, kolom).reset_index()
+    elif by == ("provinsi",):
+        df = _gabung([be.prov_means(provinsi, tahun, c) for c in kolom], [prov])
+    elif set(by) == {"tahun", "provinsi"}:
+        df = _gabung([be.year_prov_means(provinsi, tahun, c) for c in kolom], [thn, prov])
+    elif not by:
+        df = be.mean(provinsi, tahun, kolom).to_frame().T
+    else:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "by harus tahun, provinsi atau tahun,provinsi")
+    return df, {}
+
+
+def _gabung(frames, on):
+    out = frames[0]
+    for f in frames[1:]:
+        out = out.merge(f, on=on, how="outer")
+    return out
+
+
+def _meta(be, query):
+    df = pd.DataFrame([metadata(c) for c in be.schema.indikator])
+    return df, {
+        "provinsi": list(be.provinces),
+        "tahun": [be.year_min, be.year_max],
+        "kolom_provinsi": be.schema.prov,
+        "kolom_tahun": be.schema.tahun,
+    }
+
+
+ENDPOINT = {"rows": _rows, "agg": _agg, "meta": _meta}
+
+
+# =====================================================
+# SERIALISASI & ETAG
+# =====================================================
+def encode(df, extra, version, fmt):
+    if fmt == "arrow":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b"version": version.encode(),
+            b"extra": json.dumps(extra).encode(),
+        })
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue(), ARROW
+    # Kolom data mentah float32 ditulis dengan repr terpendeknya (75.69,
+    # bukan 75.6900024414); agregat float64 dibiarkan presisi penuh
+    body = json.loads(widen_float32(df).to_json(orient="split", index=False, double_precision=15))
+    payload = {"version": version, **extra, **body}
+    return json.dumps(payload, separators=(",", ":")).encode(), "application/json"
+
+
+def etag(version, path, query, fmt):
+    kanonik = json.dumps([path, sorted(query.items()), fmt], sort_keys=True)
+    return f'"{version}-{hashlib.sha1(kanonik.encode()).hexdigest()[:16]}"'
+
+
+def _format(query, accept):
+    fmt = query.get("format", [""])[0] or ("arrow" if ARROW in (accept or "") else "json")
+    if fmt not in ("json", "arrow"):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "format harus json atau arrow")
+    return fmt
+
+
+def handle(path, query, accept=None, if_none_match=None):
+    """(status, header, body) untuk satu request GET; tanpa ketergantungan HTTP."""
+    parts = [p for p in path.split("/") if p]
+    if parts == ["api"]:
+        body = {
+            name: {
+                "version": get().version,
+                "provinsi": get().schema.prov,
+                "tahun": get().schema.tahun,
+                "indikator": list(get().schema.indikator),
+            }
+            for name, get in DATASET.items()
+        }
+        return HTTPStatus.OK, {"Content-Type": "application/json"}, json.dumps(body).encode()
+    if len(parts) != 3 or parts[0] != "api" or parts[1] not in DATASET or parts[2] not in ENDPOINT:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"endpoint tidak dikenal: {path}")
+
+    be = DATASET[parts[1]]()
+    fmt = _format(query, accept)
+    tag = etag(be.version, path, query, fmt)
+    header = {"ETag": tag, "Cache-Control": "no-cache"}
+    if if_none_match and tag in [t.strip() for t in if_none_match.split(",")]:
+        return HTTPStatus.NOT_MODIFIED, header, b""
+
+    def build():
+        df, extra = ENDPOINT[parts[2]](be, query)
+        return encode(df, extra, be.version, fmt)
+
+    # Respons yang sama (versi + query) dibagi semua klien; versi ikut
+    # sebagai elemen kunci agar bisa dikosongkan per versi data
+    body, ctype = result_cache("api").get_or_build((be.version, tag), build)
+    return HTTPStatus.OK, {**header, "Content-Type": ctype}, body
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "Kelompok1API/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            status, header, body = handle(
+                url.path,
+                parse_qs(url.query),
+                accept=self.headers.get("Accept"),
+                if_none_match=self.headers.get("If-None-Match"),
+            )
+        except ApiError as exc:
+            status, header = exc.status, {"Content-Type": "application/json"}
+            body = json.dumps({"error": str(exc)}).encode()
+        except Exception:
+            # Galat tak terduga tetap dijawab JSON; detailnya hanya di log
+            log.exception("request gagal: %s", self.path)
+            status, header = HTTPStatus.INTERNAL_SERVER_ERROR, {"Content-Type": "application/json"}
+            body = json.dumps({"error": "galat internal server"}).encode()
+        self.send_response(status)
+        for k, v in header.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    # Cache Streamlit berjalan dalam bare mode; peringatannya tidak relevan di sini
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    for get in DATASET.values():
+        get()                    # muat dataset sebelum menerima request
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"API berjalan di http://{args.host}:{args.port}/api")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
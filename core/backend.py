@@ -0,0 +1,290 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.cache import cached_resource
+from core.cube import Cube
+from core.dataset import (
+    PATH_ANALISIS,
+    PATH_INTERAKTIF,
+    Schema,
+    dataset_analisis,
+    dataset_interaktif,
+    standardize_columns,
+)
+from core.ingest import ingest
+from core.instrument import stage
+from core.table import ordered_positions
+
+# pandas (default) atau duckdb
+BACKEND = os.environ.get("KELOMPOK1_BACKEND", "pandas").lower()
+
+
+class Backend:
+    """
+    Antarmuka query yang dipakai halaman: filter baris, rata-rata
+    berkelompok, dan halaman tabel terurut. Semua metode menerima
+    `provinces` (list nama) dan `years` (tuple tahun awal, akhir).
+    """
+
+    schema: Schema
+    version: str
+    provinces: list
+    year_min: int
+    year_max: int
+
+    def filter(self, provinces, years):
+        raise NotImplementedError
+
+    def selection(self, provinces, years):
+        """
+        Seleksi baris ringkas (tanpa salinan data) yang bisa disimpan dan
+        diubah menjadi baris lewat `take`; None bila backend tidak
+        menyimpan frame bersama di memori.
+        """
+        return None
+
+    def take(self, selection):
+        raise NotImplementedError
+
+    def mean(self, provinces, years, kolom=None):
+        raise NotImplementedError
+
+    def prov_means(self, provinces, years, col):
+        raise NotImplementedError
+
+    def year_prov_means(self, provinces, years, col):
+        raise NotImplementedError
+
+    def year_means(self, provinces, years, kolom=None):
+        raise NotImplementedError
+
+    def table_page(self, provinces, years, by, ascending, search, offset, limit):
+        """(DataFrame satu halaman, total baris) untuk tabel berhalaman."""
+        raise NotImplementedError
+
+    @property
+    def cube(self):
+        raise NotImplementedError
+
+
+# =====================================================
+# PANDAS (DATA DI MEMORI, INDEKS + KUBUS)
+# =====================================================
+class PandasBackend(Backend):
+    def __init__(self, ds):
+        self.ds = ds
+        self.schema = ds.schema
+        self.version = ds.version
+        self.provinces = ds.query.provinces
+        self.year_min = ds.query.year_min
+        self.year_max = ds.query.year_max
+
+    @property
+    def cube(self):
+        return self.ds.cube
+
+    def filter(self, provinces, years):
+        return self.take(self.selection(provinces, years))
+
+    def selection(self, provinces, years):
+        return self.ds.query.ranges(provinces, years)
+
+    def take(self, selection):
+        with stage("filter"):
+            return self.ds.query.take(*selection)
+
+    def mean(self, provinces, years, kolom=None):
+        return self.cube.mean(provinces, years, kolom)
+
+    def prov_means(self, provinces, years, col):
+        return self.cube.prov_means(provinces, years, col)
+
+    def year_prov_means(self, provinces, years, col):
+        return self.cube.year_prov_means(provinces, years, col)
+
+    def year_means(self, provinces, years, kolom=None):
+        return self.cube.year_means(provinces, years, kolom)
+
+    def table_page(self, provinces, years, by, ascending, search, offset, limit):
+        rows = ordered_positions(
+            self.ds, self.ds.query.positions(provinces, years), by, ascending, search
+        )
+        return self.ds.df.take(rows[offset:offset + limit]), len(rows)
+
+
+# =====================================================
+# DUCKDB (QUERY LANGSUNG KE PARQUET)
+# =====================================================
+def _q(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class DuckDBBackend(Backend):
+    """
+    Backend DuckDB: membaca file Parquet hasil ingest tanpa memuat
+    seluruh data ke pandas. Normalisasi kolom/provinsi diterapkan di
+    view SQL, filter didorong ke scan Parquet, dan GROUP BY berjalan
+    paralel di semua core.
+    """
+
+    def __init__(self, path, standardize=False, title_case=False):
+        import duckdb
+
+        manifest = ingest(path)
+        self.version = manifest["sha256"][:16]
+        self._con = duckdb.connect()
+        self._lock = threading.Lock()
+
+        src = manifest["parquet"].replace("'", "''")
+        raw = [
+            r[0] for r in self._con.execute(
+                f"DESCRIBE SELECT * FROM read_parquet('{src}')"
+            ).fetchall()
+        ]
+        names = list(standardize_columns(raw)) if standardize else raw
+        prov, tahun = names[0], names[1]
+
+        prov_expr = f"trim(CAST({_q(raw[0])} AS VARCHAR))"
+        if title_case:
+            # Setara str.title() untuk nama provinsi (kata dipisah spasi)
+            prov_expr = (
+                f"array_to_string(list_transform(string_split(lower({prov_expr}), ' '), "
+                "w -> upper(w[1]) || w[2:]), ' ')"
+            )
+        cols = [f"{prov_expr} AS {_q(prov)}", f"CAST({_q(raw[1])} AS INTEGER) AS {_q(tahun)}"]
+        cols += [f"CAST({_q(r)} AS DOUBLE) AS {_q(n)}" for r, n in zip(raw[2:], names[2:])]
+        self._con.execute(
+            f"CREATE VIEW data AS SELECT {', '.join(cols)} FROM read_parquet('{src}')"
+        )
+
+        self.schema = Schema(prov=prov, tahun=tahun, indikator=tuple(names[2:]))
+        self.provinces = [
+            r[0] for r in self._sql(f"SELECT DISTINCT {_q(prov)} FROM data ORDER BY 1").fetchall()
+        ]
+        self.year_min, self.year_max = self._sql(
+            f"SELECT min({_q(tahun)}), max({_q(tahun)}) FROM data"
+        ).fetchone()
+
+    def _sql(self, query, params=None):
+        # Satu cursor per query: koneksi DuckDB dibagi antarsesi Streamlit
+        with self._lock:
+            cur = self._con.cursor()
+        return cur.execute(query, params or [])
+
+    def _where(self, provinces, years):
+        p, t = _q(self.schema.prov), _q(self.schema.tahun)
+        return (
+            f"{p} IN (SELECT unnest(?::VARCHAR[])) AND {t} BETWEEN ? AND ?",
+            [list(provinces), int(years[0]), int(years[1])],
+        )
+
+    def _order(self):
+        return f"{_q(self.schema.prov)}, {_q(self.schema.tahun)}"
+
+    def filter(self, provinces, years):
+        where, params = self._where(provinces, years)
+        with stage("filter"):
+            return self._sql(
+                f"SELECT * FROM data WHERE {where} ORDER BY {self._order()}", params
+            ).df()
+
+    def mean(self, provinces, years, kolom=None):
+        kolom = list(kolom or self.schema.indikator)
+        where, params = self._where(provinces, years)
+        row = self._sql(
+            f"SELECT {', '.join(f'avg({_q(c)})' for c in kolom)} FROM data WHERE {where}",
+            params,
+        ).fetchone()
+        return pd.Series(np.array(row, dtype=np.float64), index=kolom)
+
+    def prov_means(self, provinces, years, col):
+        p = _q(self.schema.prov)
+        where, params = self._where(provinces, years)
+        return self._sql(
+            f"SELECT {p}, avg({_q(col)}) AS {_q(col)} FROM data WHERE {where} "
+            f"GROUP BY {p} ORDER BY {p}",
+            params,
+        ).df()
+
+    def year_prov_means(self, provinces, years, col):
+        p, t = _q(self.schema.prov), _q(self.schema.tahun)
+        where, params = self._where(provinces, years)
+        return self._sql(
+            f"SELECT {t}, {p}, avg({_q(col)}) AS {_q(col)} FROM data WHERE {where} "
+            f"GROUP BY {t}, {p} ORDER BY {t}, {p}",
+            params,
+        ).df()
+
+    def year_means(self, provinces, years, kolom=None):
+        kolom = list(kolom or self.schema.indikator)
+        t = _q(self.schema.tahun)
+        where, params = self._where(provinces, years)
+        df = self._sql(
+            f"SELECT {t}, {', '.join(f'avg({_q(c)}) AS {_q(c)}' for c in kolom)} "
+            f"FROM data WHERE {where} GROUP BY {t} ORDER BY {t}",
+            params,
+        ).df()
+        return df.set_index(self.schema.tahun).astype(np.float64)
+
+    def table_page(self, provinces, years, by, ascending, search, offset, limit):
+        where, params = self._where(provinces, years)
+        if search:
+            where += f" AND contains(lower({_q(self.schema.prov)}), ?)"
+            params.append(search.casefold())
+        order = [
+            f"{_q(c)} {'ASC' if a else 'DESC'} NULLS LAST"
+            for c, a in zip(by or [], ascending or [])
+        ] + [self._order()]
+        total = self._sql(f"SELECT count(*) FROM data WHERE {where}", params).fetchone()[0]
+        page = self._sql(
+            f"SELECT * FROM data WHERE {where} ORDER BY {', '.join(order)} "
+            f"LIMIT {int(limit)} OFFSET {int(offset)}",
+            params,
+        ).df()
+        return page, total
+
+    @property
+    def cube(self):
+        # Kubus dibangun dari agregat SQL (sum/count), bukan dari baris mentah
+        if not hasattr(self, "_cube"):
+            p, t = _q(self.schema.prov), _q(self.schema.tahun)
+            kolom = list(self.schema.indikator)
+            agg = self._sql(
+                f"SELECT {p}, {t}, count(*) AS __rows, "
+                + ", ".join(
+                    f"sum({_q(c)}) AS {_q('s_' + c)}, count({_q(c)}) AS {_q('c_' + c)}"
+                    for c in kolom
+                )
+                + f" FROM data GROUP BY {p}, {t} ORDER BY {p}, {t}"
+            ).df()
+            self._cube = Cube.from_aggregates(
+                agg, self.schema.prov, self.schema.tahun, kolom
+            )
+        return self._cube
+
+
+# =====================================================
+# PEMILIHAN BACKEND
+# =====================================================
+@cached_resource("duckdb")
+def _duckdb_backend(path, mtime_ns, standardize, title_case):
+    return DuckDBBackend(path, standardize=standardize, title_case=title_case)
+
+
+def _duckdb(path, **kwargs):
+    return _duckdb_backend(path, os.stat(path).st_mtime_ns, **kwargs)
+
+
+def backend_interaktif():
+    if BACKEND == "duckdb":
+        return _duckdb(PATH_INTERAKTIF, standardize=False, title_case=True)
+    return PandasBackend(dataset_interaktif())
+
+
+def backend_analisis():
+    if BACKEND == "duckdb":
+        return _duckdb(PATH_ANALISIS, standardize=True, title_case=False)
+    return PandasBackend(dataset_analisis())
@@ -0,0 +1,201 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.analysis import pairwise_slope, pairwise_stats
+from core.cache import cached_result
+
+N_RESAMPLE = 10_000
+CHUNK = 500                     # batas atas resample per tugas worker
+ALPHA = 0.05
+WORKERS = int(os.environ.get("KELOMPOK1_BOOTSTRAP_WORKERS", os.cpu_count() or 1))
+# Anggaran memori total semua worker; ukuran potongan diturunkan darinya
+MEM_BUDGET = int(os.environ.get("KELOMPOK1_BOOTSTRAP_MEM_MB", 512)) * 2**20
+# Di bawah ukuran ini (resample × sel kubus) overhead proses lebih mahal
+# daripada menghitung langsung.
+PARALLEL_MIN = 5_000_000
+
+
+# =====================================================
+# RESAMPLING BLOK PROVINSI
+# =====================================================
+def _resample_chunk(sums, counts, I, J, n, seed, method):
+    """
+    `n` resample bootstrap: provinsi diambil ulang dengan pengembalian
+    sebagai blok utuh (semua tahunnya ikut), sehingga struktur panel tetap.
+
+    Bobot multinomial W[b, p] menggantikan penyalinan baris: rata-rata
+    tahunan per resample = Σ_p W·sums / Σ_p W·counts.
+    """
+    P, Y, K = sums.shape
+    rng = np.random.default_rng(seed)
+    W = rng.multinomial(P, np.full(P, 1.0 / P), size=n).astype(np.float64)
+    s = (W @ sums.reshape(P, -1)).reshape(n, Y, K)
+    c = (W @ counts.reshape(P, -1)).reshape(n, Y, K)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(c > 0, s / np.where(c > 0, c, 1), np.nan)
+    # float32 cukup untuk persentil dan memperkecil hasil yang dikirim antarproses
+    r, b = pairwise_stats(means, method, pairs=(I, J))
+    return r.astype(np.float32), b.astype(np.float32)
+
+
+def _bytes_per_resample(Y, K, method):
+    # Puncak memori terukur per resample: beberapa matriks [K, K] float64,
+    # ditambah ranking per pasangan [Y, K, K] dan perbandingan [Y, Y, K]
+    # untuk Spearman
+    sel = 10 * K * K
+    if method == "spearman":
+        sel += 4 * Y * K * K + 2 * Y * Y * K
+    return 8 * sel
+
+
+def chunk_size(Y, K, method):
+    """
+    Resample per potongan agar semua worker bersama tetap di bawah
+    MEM_BUDGET. Hanya bergantung pada konfigurasi, bukan pada keputusan
+    serial/paralel, sehingga pembagian benih (dan hasilnya) tetap sama.
+    """
+    budget = MEM_BUDGET // max(WORKERS, 1)
+    return int(min(CHUNK, max(1, budget // _bytes_per_resample(Y, K, method))))
+
+
+def _chunks(n_resample, seed, chunk=CHUNK):
+    sizes = [chunk] * (n_resample // chunk)
+    if n_resample % chunk:
+        sizes.append(n_resample % chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    return sizes, seeds
+
+
+@st.cache_resource(show_spinner=False)
+def _pool():
+    # "spawn", bukan fork: server Streamlit multi-thread, dan fork dari proses
+    # bertread bisa mewarisi lock yang sedang dipegang thread lain
+    return ProcessPoolExecutor(
+        max_workers=WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def bootstrap_pairs(sums, counts, I, J, method="pearson", n_resample=N_RESAMPLE, seed=0):
+    """
+    Distribusi bootstrap korelasi dan kemiringan untuk pasangan kolom
+    (I[k], J[k]) dari potongan kubus `sums`/`counts` [provinsi, tahun, kolom].
+
+    Resample dibagi menjadi potongan berbenih tetap sehingga hasilnya sama
+    baik dihitung serial maupun di pool proses.
+    """
+    # Statistik berpasangan hanya bergantung pada kedua kolomnya: buang
+    # kolom yang tidak ada di pasangan mana pun sebelum resampling
+    cols, pos = np.unique(np.concatenate([I, J]), return_inverse=True)
+    sums, counts = sums[..., cols], counts[..., cols]
+    I, J = pos[:len(I)], pos[len(I):]
+
+    _, Y, K = sums.shape
+    sizes, seeds = _chunks(n_resample, seed, chunk_size(Y, K, method))
+    args = [(sums, counts, I, J, n, s, method) for n, s in zip(sizes, seeds)]
+    if WORKERS > 1 and len(sizes) > 1 and n_resample * sums.size >= PARALLEL_MIN:
+        hasil = list(_pool().map(_resample_chunk, *zip(*args)))
+    else:
+        hasil = [_resample_chunk(*a) for a in args]
+    r = np.concatenate([h[0] for h in hasil])
+    b = np.concatenate([h[1] for h in hasil])
+    return r, b
+
+
+def _interval(dist):
+    with np.errstate(all="ignore"):
+        lo, hi = np.nanpercentile(dist, [100 * ALPHA / 2, 100 * (1 - ALPHA / 2)], axis=0)
+    return lo, hi
+
+
+def _fmt(lo, hi):
+    return [
+        "–" if np.isnan(a) or np.isnan(b) else f"[{a:.3f}, {b:.3f}]"
+        for a, b in zip(lo, hi)
+    ]
+
+
+def confidence_table(cube, provinsi, tahun, sebab, dampak, method="pearson", n_resample=N_RESAMPLE):
+    """
+    Interval kepercayaan bootstrap per pasangan sebab-akibat, dengan urutan
+    baris yang sama seperti `cause_effect_table`.
+    """
+    kolom = cube.kolom
+    p, ys = cube.select(provinsi, tahun)
+    sums, counts = cube.sums[p, ys], cube.counts[p, ys]
+    si = np.array([kolom.index(c) for c in sebab], dtype=np.int64)
+    di = np.array([kolom.index(c) for c in dampak], dtype=np.int64)
+    if len(p) == 0 or sums.shape[1] < 2 or len(si) == 0 or len(di) == 0:
+        return pd.DataFrame()
+
+    I, J = np.meshgrid(si, di, indexing="ij")
+    I, J = I.ravel(), J.ravel()
+    keep = I != J
+    I, J = I[keep], J[keep]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums.sum(axis=0) / counts.sum(axis=0)
+    slope = pairwise_slope(means)[I, J]
+    r_dist, b_dist = bootstrap_pairs(sums, counts, I, J, method, n_resample)
+    r_lo, r_hi = _interval(r_dist)
+    b_lo, b_hi = _interval(b_dist)
+    return pd.DataFrame({
+        f"CI 95% {method.title()}": _fmt(r_lo, r_hi),
+        "Slope": np.round(slope, 4),
+        "CI 95% Slope": _fmt(b_lo, b_hi),
+        "Signifikan": np.where((r_lo > 0) | (r_hi < 0), "Ya", "Tidak"),
+    })
+
+
+@cached_result("bootstrap")
+def confidence_table_cached(version, provinsi, tahun, sebab, dampak, method, n_resample, _be):
+    """`confidence_table` yang di-memo per (versi data, filter, pasangan, metode)."""
+    return confidence_table(
+        _be.cube, list(provinsi), tahun, list(sebab), list(dampak), method, n_resample
+    )
+
+
+# =====================================================
+# JOB LATAR BELAKANG
+# =====================================================
+# Waktu tunggu singkat agar hasil yang sudah ada di cache tampil di rerun
+# yang sama tanpa menunggu polling
+TUNGGU_CACHE = 0.2
+
+
+@st.cache_resource(show_spinner=False)
+def _jobs():
+    # Satu registri per proses: job dengan argumen sama dibagi antarsesi.
+    # Thread hanya mengoordinasi; hitungan berat ada di pool proses.
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="bootstrap"), {}, threading.Lock()
+
+
+def confidence_table_job(version, provinsi, tahun, sebab, dampak, method, n_resample, _be):
+    """
+    `confidence_table_cached` di thread latar belakang agar rerun tidak
+    tertahan. Mengembalikan tabelnya bila sudah selesai, atau None selama
+    masih dihitung (panggil lagi dengan argumen yang sama untuk mengecek).
+    """
+    args = (version, provinsi, tahun, sebab, dampak, method, n_resample)
+    executor, jobs, lock = _jobs()
+    with lock:
+        job = jobs.get(args)
+        if job is None:
+            job = jobs[args] = executor.submit(confidence_table_cached, *args, _be=_be)
+    try:
+        hasil = job.result(timeout=TUNGGU_CACHE)
+    except FutureTimeout:
+        return None
+    finally:
+        # Job gagal ikut dilepas agar pemanggilan berikutnya mencoba ulang
+        if job.done():
+            with lock:
+                if jobs.get(args) is job:
+                    del jobs[args]
+    return hasil
@@ -0,0 +1,201 @@
+"""
+Gabungkan banyak file ekspor BPS "Tabel Dinamis" (xlsx/csv) sekaligus.
+
+Contoh:
+    python -m core.bps_ingest unduhan_bps/ --output data/bps_gabungan.parquet
+
+Setiap file diparse paralel di process pool. Nama provinsi disatukan
+lewat `province_key` dan nama indikator lewat normalisasi kolom yang
+sama dengan halaman Analisis. Hasilnya digabung dengan dataset dasar
+menjadi satu file Parquet, yang bisa dipakai halaman Analisis dengan
+KELOMPOK1_DATA_ANALISIS=<path>.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from core.dataset import PATH_ANALISIS, normalize, province_key, standardize_columns
+from core.ingest import BASE_DIR, load_table
+from core.validate import coerce_numeric
+
+EKSTENSI = (".xlsx", ".xls", ".csv")
+KOL_PROV, KOL_TAHUN = "provinsi", "tahun"
+_TAHUN = re.compile(r"^\s*((?:19|20)\d{2})(?:\.0)?\s*$")
+_BUKAN_WILAYAH = {"INDONESIA", "NASIONAL", "SUMBER", "CATATAN", "KETERANGAN"}
+
+
+# =====================================================
+# PARSING SATU FILE
+# =====================================================
+def _read_raw(path):
+    if path.lower().endswith(".csv"):
+        return pd.read_csv(path, header=None, dtype=str, sep=None, engine="python")
+    return pd.read_excel(path, header=None, dtype=str)
+
+
+def _year(cell):
+    m = _TAHUN.match(str(cell)) if isinstance(cell, str) else None
+    return int(m.group(1)) if m else None
+
+
+def _to_number(values):
+    # Aturan koersi yang sama dengan validasi ingest (desimal koma, "-", catatan kaki)
+    return coerce_numeric(values)[0]
+
+
+def _indicator_name(raw, header_row, path):
+    # Judul tabel BPS biasanya ada di sel teks pertama di atas header
+    for r in range(header_row):
+        cells = [c for c in raw.iloc[r] if isinstance(c, str) and c.strip()]
+        if cells:
+            return cells[0]
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _parse_long(raw, header_row):
+    df = raw.iloc[header_row + 1:].copy()
+    df.columns = standardize_columns(raw.iloc[header_row].astype(str))
+    df = df.dropna(subset=[KOL_PROV, KOL_TAHUN])
+    out = pd.DataFrame({
+        KOL_PROV: df[KOL_PROV],
+        KOL_TAHUN: _to_number(df[KOL_TAHUN]),
+    })
+    for col in df.columns.drop([KOL_PROV, KOL_TAHUN]):
+        out[col] = _to_number(df[col])
+    return out
+
+
+def _parse_wide(raw, header_row, path, name_from):
+    header = raw.iloc[header_row]
+    years = {j: _year(c) for j, c in header.items() if _year(c)}
+    prov_col = min(j for j in header.index if j not in years)
+    body = raw.iloc[header_row + 1:]
+
+    name = (
+        _indicator_name(raw, header_row, path) if name_from == "title"
+        else os.path.splitext(os.path.basename(path))[0]
+    )
+    indikator = standardize_columns([name])[0]
+
+    long = body.melt(
+        id_vars=[prov_col], value_vars=list(years), var_name="_kol", value_name=indikator
+    )
+    return pd.DataFrame({
+        KOL_PROV: long[prov_col],
+        KOL_TAHUN: long["_kol"].map(years),
+        indikator: _to_number(long[indikator]),
+    })
+
+
+def parse_file(path, name_from="file"):
+    """
+    Parse satu ekspor BPS menjadi format panjang (provinsi, tahun, indikator...).
+
+    Mendukung tabel lebar BPS (baris provinsi × kolom tahun) dan tabel
+    panjang yang sudah memiliki kolom Provinsi/Tahun seperti Dataset.xlsx.
+    """
+    raw = _read_raw(path)
+    for r in range(len(raw)):
+        row = raw.iloc[r]
+        labels = set(standardize_columns(row.dropna().astype(str)))
+        if {KOL_PROV, KOL_TAHUN} <= labels:
+            df = _parse_long(raw, r)
+            break
+        if any(_year(c) for c in row):
+            df = _parse_wide(raw, r, path, name_from)
+            break
+    else:
+        raise ValueError(f"{path}: baris header tahun/provinsi tidak ditemukan")
+
+    df[KOL_PROV] = df[KOL_PROV].astype(str).str.strip()
+    df = df[(df[KOL_PROV] != "") & df[KOL_PROV].ne("nan") & df[KOL_TAHUN].notna()]
+    df[KOL_PROV] = df[KOL_PROV].map(province_key)
+    df = df[~df[KOL_PROV].str.split().str[0].isin(_BUKAN_WILAYAH)]
+    df[KOL_TAHUN] = df[KOL_TAHUN].astype(int)
+    # Baris catatan kaki tidak punya nilai numerik sama sekali
+    nilai = df.columns.drop([KOL_PROV, KOL_TAHUN])
+    df = df.dropna(subset=list(nilai), how="all")
+    return df.groupby([KOL_PROV, KOL_TAHUN], as_index=False).first()
+
+
+# =====================================================
+# GABUNG SEMUA FILE
+# =====================================================
+def base_frame(path):
+    """Dataset dasar dengan normalisasi halaman Analisis + kunci provinsi."""
+    df, _ = normalize(load_table(path), standardize=True)
+    df = df.rename(columns={df.columns[0]: KOL_PROV, df.columns[1]: KOL_TAHUN})
+    df[KOL_PROV] = df[KOL_PROV].map(province_key)
+    return df
+
+
+def merge_frames(frames):
+    merged = None
+    for df in frames:
+        if merged is None:
+            merged = df.set_index([KOL_PROV, KOL_TAHUN])
+            continue
+        df = df.set_index([KOL_PROV, KOL_TAHUN])
+        # File yang lebih baru menimpa nilai kolom yang sama, sisanya digabung
+        merged = df.combine_first(merged)[
+            list(merged.columns) + [c for c in df.columns if c not in merged.columns]
+        ]
+    return merged.sort_index().reset_index()
+
+
+def find_exports(directory):
+    return sorted(
+        os.path.join(directory, f) for f in os.listdir(directory)
+        if f.lower().endswith(EKSTENSI) and not f.startswith("~$")
+    )
+
+
+def ingest_directory(directory, base=PATH_ANALISIS, name_from="file", workers=None):
+    paths = find_exports(directory)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(parse_file, paths, [name_from] * len(paths)))
+    if base:
+        frames.insert(0, base_frame(base))
+    return paths, merge_frames(frames)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", help="folder berisi ekspor BPS (xlsx/csv)")
+    parser.add_argument(
+        "--output", default=os.path.join(BASE_DIR, "data", "bps_gabungan.parquet")
+    )
+    parser.add_argument("--base", default=PATH_ANALISIS,
+                        help="dataset dasar yang ikut digabung")
+    parser.add_argument("--no-base", action="store_true")
+    parser.add_argument("--name-from", choices=["file", "title"], default="file",
+                        help="nama indikator dari nama file atau judul tabel")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    paths, merged = ingest_directory(
+        args.directory,
+        base=None if args.no_base else args.base,
+        name_from=args.name_from,
+        workers=args.workers,
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    merged.to_parquet(args.output, index=False)
+
+    print(
+        f"{len(paths)} file → {len(merged)} baris, "
+        f"{merged[KOL_PROV].nunique()} provinsi, {merged.shape[1] - 2} indikator "
+        f"({time.perf_counter() - t0:.1f} detik)"
+    )
+    print(f"Tersimpan di {args.output}")
+    print(f"Gunakan di dashboard: KELOMPOK1_DATA_ANALISIS={args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+"""
+Kebijakan cache terpusat.
+
+Dua jenis cache:
+- "resource": objek immutable per versi data (dataset, kubus, indeks urut,
+  geometri). Memakai st.cache_resource dengan batas entri kecil agar versi
+  lama terlepas.
+- "hasil": hasil per filter (grafik, regresi, bootstrap, ...). Disimpan di
+  `ResultCache` bersama antarsesi (tanpa salinan per sesi) dengan batas
+  entri dan TTL.
+
+Semua cache terdaftar di registri sehingga hit rate, jumlah entri dan
+perkiraan ukuran bisa dilihat dan dikosongkan dari halaman admin.
+"""
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+RESOURCE = "resource"
+HASIL = "hasil"
+
+# TTL default hasil per filter (detik); 0 = tanpa TTL
+TTL_HASIL = int(os.environ.get("KELOMPOK1_CACHE_TTL", 3600))
+
+# nama: (jenis, maks entri, TTL detik atau None, keterangan)
+POLICY = {
+    "dataset": (RESOURCE, 4, None, "Dataset ternormalisasi per file/mtime"),
+    "duckdb": (RESOURCE, 4, None, "Koneksi & view DuckDB per file/mtime"),
+    "geometri": (RESOURCE, 4, None, "GeoJSON provinsi yang disederhanakan"),
+    "urutan_tabel": (RESOURCE, 64, None, "Permutasi urut tabel per versi data"),
+    "turunan": (RESOURCE, 256, None, "Seri indikator turunan per versi data"),
+    "kubus_turunan": (RESOURCE, 64, None, "Kubus + kolom turunan per versi data"),
+    "grafik": (
+        HASIL, int(os.environ.get("KELOMPOK1_CHART_CACHE_SIZE", 128)), TTL_HASIL,
+        "Spesifikasi grafik per filter (JSON)",
+    ),
+    "regresi": (HASIL, 128, TTL_HASIL, "Hasil regresi panel per filter & spesifikasi"),
+    "sebab_akibat": (HASIL, 64, TTL_HASIL, "Tabel sebab-akibat per filter, pasangan & metode"),
+    "bootstrap": (HASIL, 32, TTL_HASIL, "Interval kepercayaan bootstrap per filter"),
+    "karantina": (HASIL, 8, None, "Tabel karantina validasi per versi data"),
+    "api": (HASIL, 256, TTL_HASIL, "Respons API JSON/Arrow per versi data & query"),
+}
+
+
+def _policy(name):
+    jenis, maxsize, ttl, ket = POLICY[name]
+    key = f"KELOMPOK1_CACHE_{name.upper()}_MAX"
+    return jenis, int(os.environ.get(key, maxsize)), ttl or None, ket
+
+
+# =====================================================
+# PERKIRAAN UKURAN
+# =====================================================
+def estimate_bytes(obj, _seen=None, _depth=0):
+    """Perkiraan kasar memori sebuah objek (DataFrame, array, dataclass, ...)."""
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen or _depth > 4:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        m = obj.memory_usage(deep=True)
+        return int(m.sum() if hasattr(m, "sum") else m)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (str, bytes)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sum(
+            estimate_bytes(k, seen, _depth + 1) + estimate_bytes(v, seen, _depth + 1)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sum(estimate_bytes(v, seen, _depth + 1) for v in obj)
+    if hasattr(obj, "__dict__"):
+        return sys.getsizeof(obj) + estimate_bytes(vars(obj), seen, _depth + 1)
+    return sys.getsizeof(obj)
+
+
+# =====================================================
+# CACHE HASIL (LRU + TTL, BERSAMA ANTARSESI)
+# =====================================================
+class ResultCache:
+    """
+    Cache LRU berbatas dengan TTL untuk hasil per filter.
+
+    Nilai dibagi semua sesi apa adanya: pemanggil wajib memperlakukannya
+    sebagai read-only (buat salinan sebelum mengubah).
+    """
+
+    jenis = HASIL
+    # Kunci tuple memuat versi data, jadi bisa dikosongkan per versi
+    per_versi = True
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()          # key -> (kedaluwarsa, nilai, bytes)
+        self._lock = threading.Lock()
+
+    def _encode(self, value):
+        return value, estimate_bytes(value)
+
+    def _decode(self, stored):
+        return stored
+
+    def get_or_build(self, key, build):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and (item[0] is None or item[0] > now):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._decode(item[1])
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+
+        stored, size = self._encode(build())
+        expires = now + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (expires, stored, size)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return self._decode(stored)
+
+    def _expire(self):
+        now = time.monotonic()
+        for key in [k for k, v in self._data.items() if v[0] is not None and v[0] <= now]:
+            del self._data[key]
+
+    def stats(self):
+        with self._lock:
+            self._expire()
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "bytes": sum(v[2] for v in self._data.values()),
+            }
+
+    def clear(self, version=None):
+        """Kosongkan semua entri, atau hanya entri yang kuncinya memuat `version`."""
+        with self._lock:
+            if version is None:
+                self._data.clear()
+                self.hits = self.misses = 0
+                return
+            for key in [k for k in self._data if isinstance(k, tuple) and version in k]:
+                del self._data[key]
+
+
+# =====================================================
+# STATISTIK CACHE RESOURCE (st.cache_resource)
+# =====================================================
+class ResourceStats:
+    """
+    Penghitung untuk fungsi st.cache_resource: panggilan, miss (fungsi
+    benar-benar dijalankan), serta referensi lemah ke objek yang masih
+    hidup untuk menghitung entri dan ukuran.
+    """
+
+    jenis = RESOURCE
+    # st.cache_resource hanya bisa dikosongkan per fungsi, tidak per versi
+    per_versi = False
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.calls = 0
+        self.misses = 0
+        self.funcs = []
+        self._refs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def track(self, value):
+        with self._lock:
+            try:
+                self._refs[id(value)] = weakref.ref(value)
+            except TypeError:
+                # Objek tanpa dukungan weakref: simpan, dibatasi seperti cache-nya
+                self._refs[id(value)] = lambda v=value: v
+            while len(self._refs) > self.maxsize:
+                self._refs.popitem(last=False)
+
+    def _alive(self):
+        for key in [k for k, r in self._refs.items() if r() is None]:
+            del self._refs[key]
+        return [r() for r in self._refs.values()]
+
+    def stats(self):
+        with self._lock:
+            alive = self._alive()
+            hits = max(self.calls - self.misses, 0)
+            return {
+                "hits": hits,
+                "misses": self.misses,
+                "hit_rate": hits / self.calls if self.calls else 0.0,
+                "entries": len(alive),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "bytes": sum(estimate_bytes(v) for v in alive),
+            }
+
+    def clear(self, version=None):
+        if version is not None:
+            raise ValueError("cache resource tidak bisa dikosongkan per versi")
+        for func in self.funcs:
+            func.clear()
+        with self._lock:
+            self._refs.clear()
+            self.calls = self.misses = 0
+
+
+# =====================================================
+# REGISTRI
+# =====================================================
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def _entry(name, factory):
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = factory()
+        return _registry[name]
+
+
+def result_cache(name, cls=ResultCache):
+    """`ResultCache` bersama untuk nama kebijakan `name` (satu per proses)."""
+    _, maxsize, ttl, _ = _policy(name)
+    return _entry(name, lambda: cls(maxsize=maxsize, ttl=ttl))
+
+
+def _hash_args(func, args, kwargs):
+    # Parameter berawalan "_" tidak ikut kunci, seperti konvensi Streamlit
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return (func.__module__, func.__qualname__) + tuple(
+        v for k, v in bound.arguments.items() if not k.startswith("_")
+    )
+
+
+def cached_result(name):
+    """Dekorator: memo hasil fungsi di `result_cache(name)`."""
+    def deco(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return result_cache(name).get_or_build(
+                _hash_args(func, args, kwargs), lambda: func(*args, **kwargs)
+            )
+        return wrapper
+    return deco
+
+
+def cached_resource(name):
+    """Dekorator: st.cache_resource dengan batas dari POLICY + statistik registri."""
+    _, maxsize, ttl, _ = _policy(name)
+    stats = _entry(name, lambda: ResourceStats(maxsize, ttl))
+
+    def deco(func):
+        @functools.wraps(func)
+        def build(*args, **kwargs):
+            with stats._lock:
+                stats.misses += 1
+            value = func(*args, **kwargs)
+            stats.track(value)
+            return value
+
+        cached = st.cache_resource(show_spinner=False, max_entries=maxsize, ttl=ttl)(build)
+        stats.funcs.append(cached)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stats._lock:
+                stats.calls += 1
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+    return deco
+
+
+def registry_stats():
+    """Satu baris per cache terdaftar."""
+    rows = []
+    with _registry_lock:
+        items = list(_registry.items())
+    for name, cache in items:
+        s = cache.stats()
+        rows.append({
+            "Cache": name,
+            "Jenis": cache.jenis,
+            "Keterangan": POLICY.get(name, (None, None, None, ""))[3],
+            "Hit": s["hits"],
+            "Miss": s["misses"],
+            "Hit rate": s["hit_rate"],
+            "Entri": s["entries"],
+            "Maks": s["maxsize"],
+            "TTL (s)": s["ttl"] or "-",
+            "KB": s["bytes"] / 1024,
+        })
+    return pd.DataFrame(rows)
+
+
+def invalidate(names=None, version=None):
+    """
+    Kosongkan cache terdaftar. `names` membatasi cache mana; `version`
+    hanya menghapus entri hasil untuk versi data tersebut, dan cache yang
+    tidak mendukungnya dilewati. Mengembalikan nama cache yang dikosongkan.
+    """
+    with _registry_lock:
+        items = list(_registry.items())
+    dikosongkan = []
+    for name, cache in items:
+        if names is not None and name not in names:
+            continue
+        if version is not None and not cache.per_versi:
+            continue
+        cache.clear(version)
+        dikosongkan.append(name)
+    return dikosongkan
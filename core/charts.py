@@ -0,0 +1,206 @@
+import json
+import os
+
+import altair as alt
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from core.cache import ResultCache, result_cache
+
+# Data grafik sudah diagregasi di Python; batas 5000 baris Altair hanya
+# menggagalkan tren per wilayah pada data tingkat kabupaten/kota
+alt.data_transformers.disable_max_rows()
+
+# =====================================================
+# CACHE SPESIFIKASI GRAFIK (LRU)
+# =====================================================
+class ChartCache(ResultCache):
+    """
+    Cache spesifikasi grafik yang sudah diserialisasi.
+
+    Nilai disimpan sebagai string JSON sehingga aman dibagi antarsesi
+    (tidak ada objek yang bisa termutasi oleh satu sesi).
+    """
+
+    def _encode(self, spec):
+        payload = json.dumps(spec, default=_json_default)
+        return payload, len(payload)
+
+    def _decode(self, payload):
+        return json.loads(payload)
+
+
+def _json_default(obj):
+    # Array NumPy / skalar dari Plotly atau pandas
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Tidak bisa diserialisasi: {type(obj)!r}")
+
+
+def chart_cache():
+    """Satu cache grafik per proses, dibagi semua sesi (kebijakan "grafik")."""
+    return result_cache("grafik", ChartCache)
+
+
+def chart_key(version, kind, indikator, provinsi, tahun):
+    return (version, kind, indikator, tuple(sorted(provinsi)), tuple(tahun))
+
+
+# =====================================================
+# PEMBANGUN SPESIFIKASI GRAFIK
+# =====================================================
+# Di atas ambang ini grafik garis beralih ke WebGL tanpa marker, dan tiap
+# seri dipangkas dengan LTTB agar ukuran JSON tetap terbatas
+GL_SERIES = int(os.environ.get("KELOMPOK1_GL_SERIES", 20))
+GL_POINTS = int(os.environ.get("KELOMPOK1_GL_POINTS", 5000))
+LTTB_POINTS = int(os.environ.get("KELOMPOK1_LTTB_POINTS", 300))
+LTTB_MIN = 20                  # titik minimum per seri walau seri sangat banyak
+
+
+def lttb(x, y, n_out):
+    """
+    Indeks titik hasil downsampling Largest-Triangle-Three-Buckets.
+    Titik pertama dan terakhir selalu dipertahankan; bentuk puncak dan
+    lembah tetap terlihat walau jumlah titik jauh berkurang.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(hi, edges[i + 2] if i + 2 < len(edges) else n)
+        cx, cy = x[nxt].mean(), y[nxt].mean()
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def _gl_line_figure(df, indikator, judul):
+    warna = px.colors.qualitative.Plotly
+    grup = df.dropna(subset=[indikator]).groupby("Provinsi", sort=False, observed=True)
+    # Anggaran titik total dibagi rata antar seri agar payload tetap terbatas
+    n_out = max(LTTB_MIN, min(LTTB_POINTS, GL_POINTS // max(grup.ngroups, 1)))
+    traces = []
+    for i, (prov, seri) in enumerate(grup):
+        x = seri["Tahun"].to_numpy()
+        y = seri[indikator].to_numpy(dtype=np.float64)
+        idx = lttb(x, y, n_out)
+        traces.append(go.Scattergl(
+            x=x[idx], y=y[idx],
+            mode="lines",
+            name=prov,
+            line={"color": warna[i % len(warna)], "width": 1.5},
+            hovertemplate=f"{prov}<br>Tahun=%{{x}}<br>{indikator}=%{{y}}<extra></extra>",
+        ))
+    fig = go.Figure(traces)
+    fig.update_layout(
+        title=judul,
+        xaxis_title="Tahun",
+        yaxis_title=indikator,
+        hovermode="closest",
+        legend_title_text="Provinsi"
+    )
+    return fig
+
+
+def plotly_line_spec(df, indikator, tahun_range):
+    judul = f"Tren {indikator} ({tahun_range[0]}–{tahun_range[1]})"
+
+    # Banyak seri/titik: WebGL + LTTB. Mempersempit rentang tahun membangun
+    # ulang grafik sehingga rentang itu kembali tampil dalam resolusi penuh.
+    if df["Provinsi"].nunique() > GL_SERIES or len(df) > GL_POINTS:
+        return _gl_line_figure(df, indikator, judul).to_plotly_json()
+
+    fig = px.line(
+        df,
+        x="Tahun",
+        y=indikator,
+        color="Provinsi",
+        markers=True,
+        title=judul
+    )
+
+    fig.update_layout(
+        hovermode="x unified",
+        legend_title_text="Provinsi"
+    )
+    return fig.to_plotly_json()
+
+
+def bar_chart_spec(prov_df, kol_prov, col):
+    return alt.Chart(prov_df).mark_bar().encode(
+        y=alt.Y(f"{kol_prov}:N", title="Provinsi"),
+        x=alt.X(f"{col}:Q", title="Rata-rata"),
+        color=alt.Color(f"{kol_prov}:N", legend=None),
+        tooltip=[kol_prov, col]
+    ).to_dict()
+
+
+def line_chart_spec(trend_df, kol_tahun, kol_prov, col):
+    return alt.Chart(trend_df).mark_line(point=True).encode(
+        x=alt.X(f"{kol_tahun}:O", title="Tahun"),
+        y=alt.Y(f"{col}:Q", title="Nilai"),
+        color=alt.Color(f"{kol_prov}:N", title="Provinsi"),
+        tooltip=[kol_prov, kol_tahun, col]
+    ).to_dict()
+
+
+def trend_facet_spec(means, kol_tahun):
+    """Tren semua indikator dari matriks tahun × indikator, satu panel per indikator."""
+    long = means.reset_index().melt(id_vars=kol_tahun, var_name="indikator", value_name="nilai")
+    return alt.Chart(long).mark_line(point=True).encode(
+        x=alt.X(f"{kol_tahun}:O", title="Tahun"),
+        y=alt.Y("nilai:Q", title=None),
+        tooltip=["indikator", kol_tahun, "nilai"]
+    ).properties(width=220, height=140).facet(
+        facet=alt.Facet("indikator:N", title=None), columns=3
+    ).resolve_scale(y="independent").to_dict()
+
+
+# =====================================================
+# GRAFIK HALAMAN (AGREGASI + CACHE)
+# =====================================================
+# Dipakai halaman dan warm-up agar kunci cache selalu identik.
+def line_chart_interaktif(be, indikator, provinsi, tahun_range):
+    def build():
+        # Kolom indikator sudah numerik sejak ingest (core/validate.py)
+        return plotly_line_spec(be.filter(provinsi, tahun_range), indikator, tahun_range)
+
+    return chart_cache().get_or_build(
+        chart_key(be.version, "line", indikator, provinsi, tahun_range), build
+    )
+
+
+def bar_chart_analisis(be, provinsi, tahun, col):
+    return chart_cache().get_or_build(
+        chart_key(be.version, "bar", col, provinsi, tahun),
+        lambda: bar_chart_spec(
+            be.prov_means(provinsi, tahun, col).sort_values(by=col),
+            be.schema.prov,
+            col
+        )
+    )
+
+
+def trend_chart_analisis(be, provinsi, tahun, col):
+    return chart_cache().get_or_build(
+        chart_key(be.version, "trend", col, provinsi, tahun),
+        lambda: line_chart_spec(
+            be.year_prov_means(provinsi, tahun, col),
+            be.schema.tahun,
+            be.schema.prov,
+            col
+        )
+    )
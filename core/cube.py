@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+
+class Cube:
+    """
+    Kubus agregat provinsi × tahun × indikator.
+
+    Menyimpan jumlah nilai (`sums`) dan banyaknya nilai non-null
+    (`counts`) per sel, plus jumlah baris per (provinsi, tahun).
+    Rata-rata untuk kombinasi filter apa pun cukup berupa slicing array
+    lalu satu reduksi, tidak bergantung pada banyaknya baris mentah.
+    """
+
+    def __init__(self, df, prov, tahun, kolom):
+        X = df[list(kolom)].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(X)
+        self._build(
+            prov, tahun, kolom, df[prov], df[tahun],
+            np.where(valid, X, 0.0), valid, np.ones(len(df)),
+        )
+
+    @classmethod
+    def from_aggregates(cls, agg, prov, tahun, kolom):
+        """
+        Bangun kubus dari agregat per (provinsi, tahun) yang sudah dihitung
+        di tempat lain (mis. GROUP BY DuckDB): kolom `s_<indikator>` berisi
+        jumlah, `c_<indikator>` jumlah nilai non-null, `__rows` jumlah baris.
+        """
+        cube = cls.__new__(cls)
+        cube._build(
+            prov, tahun, kolom, agg[prov], agg[tahun],
+            agg[[f"s_{c}" for c in kolom]].fillna(0).to_numpy(dtype=np.float64),
+            agg[[f"c_{c}" for c in kolom]].to_numpy(dtype=np.float64),
+            agg["__rows"].to_numpy(),
+        )
+        return cube
+
+    def _build(self, prov, tahun, kolom, prov_values, year_values, sums, counts, rows):
+        self.prov, self.tahun = prov, tahun
+        self.kolom = list(kolom)
+        codes, uniques = pd.factorize(prov_values, sort=True)
+        years = np.asarray(year_values, dtype=np.int64)
+        self.provinces = list(uniques)
+        self._code = {p: i for i, p in enumerate(self.provinces)}
+        self.year_min = int(years.min()) if len(years) else 0
+        n_year = int(years.max()) - self.year_min + 1 if len(years) else 0
+        self.years = np.arange(self.year_min, self.year_min + n_year)
+
+        P, Y, K = len(self.provinces), n_year, len(self.kolom)
+        sel = codes * Y + (years - self.year_min)
+        self.sums = np.zeros((P * Y, K))
+        self.counts = np.zeros((P * Y, K))
+        self.rows = np.bincount(sel, weights=rows, minlength=P * Y)
+        self.rows = self.rows.astype(np.int64).reshape(P, Y)
+        np.add.at(self.sums, sel, sums)
+        np.add.at(self.counts, sel, counts)
+        self.sums = self.sums.reshape(P, Y, K)
+        self.counts = self.counts.reshape(P, Y, K)
+
+    def with_columns(self, kolom, values):
+        """
+        Kubus baru dengan kolom tambahan dari nilai per sel `values`
+        [provinsi, tahun, k] (NaN = kosong), mis. indikator turunan.
+        """
+        valid = ~np.isnan(values)
+        cube = Cube.__new__(Cube)
+        cube.__dict__.update(self.__dict__)
+        cube.kolom = self.kolom + list(kolom)
+        cube.sums = np.concatenate([self.sums, np.where(valid, values, 0.0)], axis=-1)
+        cube.counts = np.concatenate([self.counts, valid.astype(np.float64)], axis=-1)
+        return cube
+
+    # -------------------------------------------------
+    # SELEKSI
+    # -------------------------------------------------
+    def select(self, provinces, years):
+        p = np.array(
+            sorted(self._code[x] for x in set(provinces) if x in self._code),
+            dtype=np.int64,
+        )
+        lo = max(int(years[0]) - self.year_min, 0)
+        hi = min(int(years[1]) - self.year_min + 1, len(self.years))
+        return p, slice(lo, max(lo, hi))
+
+    def _part(self, provinces, years, kolom=None):
+        p, ys = self.select(provinces, years)
+        k = (
+            slice(None) if kolom is None
+            else [self.kolom.index(c) for c in kolom]
+        )
+        return (
+            p, ys,
+            self.sums[p, ys][..., k],
+            self.counts[p, ys][..., k],
+            self.rows[p, ys],
+        )
+
+    @staticmethod
+    def _div(s, c):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(c > 0, s / np.where(c > 0, c, 1), np.nan)
+
+    # -------------------------------------------------
+    # AGREGAT
+    # -------------------------------------------------
+    def mean(self, provinces, years, kolom=None):
+        """Rata-rata tiap indikator atas seluruh baris terpilih."""
+        _, _, s, c, _ = self._part(provinces, years, kolom)
+        return pd.Series(
+            self._div(s.sum(axis=(0, 1)), c.sum(axis=(0, 1))),
+            index=kolom or self.kolom,
+        )
+
+    def prov_means(self, provinces, years, col):
+        """Rata-rata per provinsi (setara groupby(prov)[col].mean())."""
+        p, _, s, c, rows = self._part(provinces, years, [col])
+        ada = rows.sum(axis=1) > 0
+        return pd.DataFrame({
+            self.prov: np.array(self.provinces, dtype=object)[p][ada],
+            col: self._div(s.sum(axis=1), c.sum(axis=1))[ada, 0],
+        })
+
+    def year_prov_means(self, provinces, years, col):
+        """Rata-rata per (tahun, provinsi), format panjang seperti groupby."""
+        p, ys, s, c, rows = self._part(provinces, years, [col])
+        yi, pi = np.nonzero(rows.T > 0)
+        m = self._div(s[..., 0], c[..., 0])
+        return pd.DataFrame({
+            self.tahun: self.years[ys][yi],
+            self.prov: np.array(self.provinces, dtype=object)[p][pi],
+            col: m[pi, yi],
+        })
+
+    def year_means(self, provinces, years, kolom=None):
+        """Matriks tahun × indikator (setara groupby(tahun)[kolom].mean())."""
+        _, ys, s, c, rows = self._part(provinces, years, kolom)
+        ada = rows.sum(axis=0) > 0
+        return pd.DataFrame(
+            self._div(s.sum(axis=0), c.sum(axis=0))[ada],
+            index=pd.Index(self.years[ys][ada], name=self.tahun),
+            columns=kolom or self.kolom,
+        )
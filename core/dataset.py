@@ -0,0 +1,266 @@
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.cache import cached_resource, cached_result
+from core.cube import Cube
+from core.ingest import BASE_DIR, ingest, load_quarantine
+from core.instrument import enabled, stage
+from core.query import ProvinceYearIndex
+
+# =====================================================
+# SUMBER DATA
+# =====================================================
+# Bisa diarahkan ke file lain (mis. data sintetis untuk benchmark)
+PATH_INTERAKTIF = os.environ.get(
+    "KELOMPOK1_DATA_INTERAKTIF", os.path.join(BASE_DIR, "Dataset.xlsx")
+)
+PATH_ANALISIS = os.environ.get(
+    "KELOMPOK1_DATA_ANALISIS", os.path.join(BASE_DIR, "Dataset_prakbigdata.xlsx")
+)
+
+# Profil tipe data di memori: "ringkas" (Provinsi kategori, Tahun int16,
+# indikator float32) atau "penuh" (tipe hasil baca apa adanya)
+PROFIL_DTYPE = os.environ.get("KELOMPOK1_DTYPE_PROFILE", "ringkas").lower()
+
+
+@dataclass(frozen=True)
+class Schema:
+    prov: str
+    tahun: str
+    indikator: tuple
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    Dataset yang sudah dinormalisasi, dibagi ke semua sesi.
+
+    Anggap `df` read-only: halaman yang perlu mengubah data harus
+    bekerja pada salinan hasil filter, bukan pada objek bersama ini.
+    """
+    df: pd.DataFrame
+    schema: Schema
+    version: str
+    # Bit kosong per (baris, indikator), dipadatkan dengan np.packbits
+    missing: np.ndarray = field(default=None, repr=False, compare=False)
+
+    def is_missing(self, col):
+        """Mask boolean baris kosong untuk satu indikator."""
+        k = self.schema.indikator.index(col)
+        return np.unpackbits(self.missing[:, k], count=len(self.df)).astype(bool)
+
+    @cached_property
+    def query(self):
+        """Indeks (provinsi, tahun), dibangun sekali per dataset."""
+        return ProvinceYearIndex(self.df, self.schema.prov, self.schema.tahun)
+
+    @cached_property
+    def cube(self):
+        """Kubus jumlah/count provinsi × tahun × indikator."""
+        return Cube(
+            self.df, self.schema.prov, self.schema.tahun, self.schema.indikator
+        )
+
+
+# =====================================================
+# NORMALISASI (SEKALI PER VERSI DATA)
+# =====================================================
+def standardize_columns(columns):
+    return (
+        pd.Index(columns)
+        .str.strip()
+        .str.lower()
+        .str.replace(" ", "_")
+        .str.replace("(", "")
+        .str.replace(")", "")
+        .str.replace("%", "")
+    )
+
+
+# Ejaan alternatif nama provinsi (GeoJSON lama, ekspor BPS, singkatan)
+_ALIAS_PROVINSI = {
+    "NANGGROE ACEH DARUSSALAM": "ACEH",
+    "DI ACEH": "ACEH",
+    "DAERAH ISTIMEWA YOGYAKARTA": "DI YOGYAKARTA",
+    "YOGYAKARTA": "DI YOGYAKARTA",
+    "D I YOGYAKARTA": "DI YOGYAKARTA",        # "D.I. Yogyakarta"
+    "D K I JAKARTA": "DKI JAKARTA",           # "D.K.I. Jakarta"
+    "DAERAH KHUSUS IBUKOTA JAKARTA": "DKI JAKARTA",
+    "JAKARTA RAYA": "DKI JAKARTA",
+    "JAKARTA": "DKI JAKARTA",
+    "BANGKA BELITUNG": "KEPULAUAN BANGKA BELITUNG",
+    "PROBANTEN": "BANTEN",
+    "NUSATENGGARA BARAT": "NUSA TENGGARA BARAT",
+    "NUSATENGGARA TIMUR": "NUSA TENGGARA TIMUR",
+    "IRIAN JAYA BARAT": "PAPUA BARAT",
+    "IRIAN JAYA TIMUR": "PAPUA",
+    "IRIAN JAYA TENGAH": "PAPUA",
+    "IRIAN JAYA": "PAPUA",
+}
+
+
+def province_key(name):
+    """Kunci kanonik nama provinsi, sama untuk semua ejaan yang dikenal."""
+    key = " ".join(str(name).upper().replace(".", " ").split())
+    if key.startswith("KEP "):
+        key = "KEPULAUAN " + key[4:]
+    if key.startswith("PROVINSI "):
+        key = key[len("PROVINSI "):]
+    return _ALIAS_PROVINSI.get(key, key)
+
+
+def normalize(df, standardize=False, title_case=False):
+    df = df.copy()
+    if standardize:
+        df.columns = standardize_columns(df.columns)
+
+    prov, tahun = df.columns[0], df.columns[1]
+    df[prov] = df[prov].astype(str).str.strip()
+    if title_case:
+        df[prov] = df[prov].str.title()
+    df[tahun] = df[tahun].astype(int)
+    # Urutkan sekali agar indeks query bisa memotong baris per provinsi
+    df = df.sort_values([prov, tahun], kind="stable").reset_index(drop=True)
+
+    schema = Schema(prov=prov, tahun=tahun, indikator=tuple(df.columns[2:]))
+    return df, schema
+
+
+def compact(df, schema):
+    """
+    Tipe ringkas: Provinsi kategori (kamus nama dibagi semua baris),
+    Tahun int16, indikator float32 (sudah numerik sejak ingest).
+    """
+    prov = df[schema.prov]
+    out = {
+        schema.prov: pd.Categorical(prov, categories=sorted(prov.unique())),
+        schema.tahun: df[schema.tahun].astype(np.int16),
+    }
+    for c in schema.indikator:
+        out[c] = df[c].astype(np.float32)
+    return pd.DataFrame(out, index=df.index)[list(df.columns)]
+
+
+def widen_float32(df):
+    """
+    Kolom float32 → float64 lewat repr terpendeknya, untuk keluaran yang
+    menulis angka apa adanya (XLSX, JSON): 69.7, bukan 69.69999694824219.
+    """
+    f32 = df.select_dtypes(np.float32).columns
+    if len(f32) == 0:
+        return df
+    return df.astype({c: str for c in f32}).astype({c: np.float64 for c in f32})
+
+
+def missing_bits(df, schema):
+    return np.packbits(df[list(schema.indikator)].isna().to_numpy(), axis=0)
+
+
+@cached_resource("dataset")
+def _build_dataset(path, mtime_ns, standardize, title_case):
+    with stage("load"):
+        manifest = ingest(path)
+        raw = pd.read_parquet(manifest["parquet"])
+    with stage("normalize"):
+        df, schema = normalize(raw, standardize=standardize, title_case=title_case)
+        if PROFIL_DTYPE == "ringkas":
+            df = compact(df, schema)
+    return Dataset(
+        df=df,
+        schema=schema,
+        version=manifest["sha256"][:16],
+        missing=missing_bits(df, schema),
+    )
+
+
+def get_dataset(path, standardize=False, title_case=False):
+    # mtime ikut menjadi kunci cache sehingga file yang berubah dimuat ulang
+    return _build_dataset(
+        path, os.stat(path).st_mtime_ns, standardize, title_case
+    )
+
+
+def dataset_interaktif():
+    """Dataset halaman Data Interaktif (nama kolom asli, Provinsi Title Case)."""
+    return get_dataset(PATH_INTERAKTIF, title_case=True)
+
+
+def dataset_analisis():
+    """Dataset halaman Analisis (nama kolom distandarisasi)."""
+    return get_dataset(PATH_ANALISIS, standardize=True)
+
+
+# =====================================================
+# LAPORAN MEMORI
+# =====================================================
+def memory_report(ds):
+    """
+    Memori per kolom dengan profil aktif, dibandingkan perkiraan tanpa
+    profil (object untuk Provinsi, int64 Tahun, float64 indikator).
+    """
+    df, schema = ds.df, ds.schema
+    n = len(df)
+    prov = df[schema.prov]
+    if isinstance(prov.dtype, pd.CategoricalDtype):
+        ukuran = np.array([sys.getsizeof(c) for c in prov.cat.categories])
+        prov_penuh = int(ukuran[prov.cat.codes.to_numpy()].sum()) + 8 * n
+    else:
+        prov_penuh = int(prov.memory_usage(deep=True, index=False))
+
+    rows = []
+    for c in df.columns:
+        penuh = prov_penuh if c == schema.prov else 8 * n
+        rows.append({
+            "Kolom": c,
+            "Tipe": str(df[c].dtype),
+            "KB": df[c].memory_usage(deep=True, index=False) / 1024,
+            "KB tanpa profil": penuh / 1024,
+            "Kosong": int(ds.is_missing(c).sum()) if c in schema.indikator else 0,
+        })
+    return pd.DataFrame(rows)
+
+
+def render_memory_report():
+    """Memori dataset di memori per kolom (bersama instrumentasi)."""
+    if not enabled():
+        return
+    with st.sidebar.expander("🧮 Memori Dataset"):
+        st.caption(f"Profil tipe data: {PROFIL_DTYPE}")
+        for judul, get in (
+            ("Data Interaktif", dataset_interaktif),
+            ("Analisis", dataset_analisis),
+        ):
+            laporan = memory_report(get())
+            total, penuh = laporan["KB"].sum(), laporan["KB tanpa profil"].sum()
+            st.caption(
+                f"{judul}: {total:.0f} KB (tanpa profil ≈ {penuh:.0f} KB, "
+                f"{penuh / max(total, 1e-9):.1f}×)"
+            )
+            st.dataframe(laporan.round(1), hide_index=True)
+
+
+# =====================================================
+# KARANTINA VALIDASI
+# =====================================================
+@cached_result("karantina")
+def _karantina(version, path):
+    # Dikunci pada versi data: ingest (stat + manifest) hanya berjalan
+    # sekali per versi, bukan di setiap rerun
+    return load_quarantine(path)
+
+
+def render_quarantine(path, version):
+    """Peringatan + tabel sel yang ditolak saat ingest (bila ada)."""
+    karantina = _karantina(version, path)
+    if karantina.empty:
+        return
+    with st.expander(f"⚠️ {len(karantina)} sel data ditolak saat validasi"):
+        ringkas = karantina.groupby(["kolom", "alasan"]).size().rename("jumlah")
+        st.caption(" · ".join(f"{k} ({a}): {n}" for (k, a), n in ringkas.items()))
+        st.dataframe(karantina, hide_index=True, use_container_width=True)
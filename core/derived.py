@@ -0,0 +1,157 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from core.backend import Backend
+from core.cache import cached_resource
+from core.cube import Cube
+
+
+# =====================================================
+# REGISTRI INDIKATOR TURUNAN
+# =====================================================
+def _yoy(M):
+    # Perubahan (%) terhadap tahun sebelumnya
+    out = np.full_like(M, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out[:, 1:] = (M[:, 1:] / M[:, :-1] - 1.0) * 100.0
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+def _ma3(M):
+    # Rata-rata bergerak 3 tahun; kosong bila salah satu tahun kosong
+    out = np.full_like(M, np.nan)
+    out[:, 2:] = (M[:, 2:] + M[:, 1:-1] + M[:, :-2]) / 3.0
+    return out
+
+
+def _indeks(M):
+    # Indeks terhadap tahun pertama yang terisi per provinsi (= 100)
+    valid = ~np.isnan(M)
+    first = valid.argmax(axis=1)
+    base = M[np.arange(len(M)), first]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = M / base[:, None] * 100.0
+    out[~np.isfinite(out)] = np.nan
+    return out
+
+
+# tag nama kolom -> (keterangan, fungsi atas matriks provinsi × tahun)
+TURUNAN = {
+    "(YoY %)": ("perubahan persen dibanding tahun sebelumnya", _yoy),
+    "(MA-3)": ("rata-rata bergerak 3 tahun", _ma3),
+    "(Indeks)": ("indeks dengan tahun pertama yang tersedia = 100", _indeks),
+}
+
+
+def derived_name(base, tag):
+    return f"{base} {tag}"
+
+
+def split_name(name):
+    """(kolom dasar, tag) untuk nama indikator turunan, selain itu None."""
+    for tag in TURUNAN:
+        if name.endswith(" " + tag):
+            return name[: -len(tag) - 1], tag
+    return None
+
+
+def derived_names(indikator):
+    """Semua indikator turunan yang bisa dibentuk dari kolom dasar."""
+    return [derived_name(c, tag) for c in indikator for tag in TURUNAN]
+
+
+def describe(name):
+    base, tag = split_name(name)
+    return f"{TURUNAN[tag][0].capitalize()} dari {base}."
+
+
+# =====================================================
+# PERHITUNGAN (MALAS, DI-CACHE PER VERSI DATA)
+# =====================================================
+@cached_resource("turunan")
+def _series(version, name, _cube):
+    # Dihitung sekali per (versi data, indikator turunan) saat pertama diminta;
+    # satu operasi vektor atas semua provinsi sekaligus.
+    base, tag = split_name(name)
+    k = _cube.kolom.index(base)
+    M = Cube._div(_cube.sums[..., k], _cube.counts[..., k])
+    return TURUNAN[tag][1](M)
+
+
+@cached_resource("kubus_turunan")
+def _extended_cube(version, names, _cube):
+    return _cube.with_columns(
+        list(names), np.stack([_series(version, n, _cube) for n in names], axis=-1)
+    )
+
+
+class DerivedBackend(Backend):
+    """
+    Backend dasar + kolom turunan yang diminta. Nilai turunan dihitung per
+    (provinsi, tahun) dari kubus dan hanya ditempelkan ke hasil query
+    (baris terfilter, halaman tabel, agregat), bukan ke dataset yang dimuat.
+    """
+
+    def __init__(self, base, names):
+        self.base = base
+        self.names = tuple(names)
+        self.schema = replace(base.schema, indikator=base.schema.indikator + self.names)
+        self.version = base.version
+        self.provinces = base.provinces
+        self.year_min = base.year_min
+        self.year_max = base.year_max
+
+    @property
+    def cube(self):
+        return _extended_cube(self.version, self.names, self.base.cube)
+
+    def _attach(self, df):
+        cube = self.base.cube
+        p = pd.Index(cube.provinces).get_indexer(df[self.schema.prov])
+        t = df[self.schema.tahun].to_numpy(dtype=np.int64) - cube.year_min
+        return df.assign(**{
+            n: _series(self.version, n, cube)[p, t] for n in self.names
+        })
+
+    def filter(self, provinces, years):
+        return self._attach(self.base.filter(provinces, years))
+
+    def mean(self, provinces, years, kolom=None):
+        return self.cube.mean(provinces, years, kolom)
+
+    def prov_means(self, provinces, years, col):
+        if col not in self.names:
+            return self.base.prov_means(provinces, years, col)
+        return self.cube.prov_means(provinces, years, col)
+
+    def year_prov_means(self, provinces, years, col):
+        if col not in self.names:
+            return self.base.year_prov_means(provinces, years, col)
+        return self.cube.year_prov_means(provinces, years, col)
+
+    def year_means(self, provinces, years, kolom=None):
+        return self.cube.year_means(provinces, years, kolom)
+
+    def table_page(self, provinces, years, by, ascending, search, offset, limit):
+        if not any(c in self.names for c in by or []):
+            page, total = self.base.table_page(
+                provinces, years, by, ascending, search, offset, limit
+            )
+            return self._attach(page), total
+        # Urut berdasarkan kolom turunan: urutkan baris terfilter di sini
+        df = self.filter(provinces, years)
+        if search:
+            df = df[df[self.schema.prov].str.casefold().str.contains(search.casefold(), regex=False)]
+        df = df.sort_values(
+            list(by), ascending=list(ascending), kind="stable", na_position="last"
+        )
+        return df.iloc[offset:offset + limit], len(df)
+
+
+def with_derived(be, names):
+    """Bungkus backend dengan kolom turunan `names` (yang bukan turunan diabaikan)."""
+    names = tuple(n for n in names if split_name(n))
+    return DerivedBackend(be, names) if names else be
@@ -0,0 +1,124 @@
+import hashlib
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+from core.dataset import widen_float32
+from core.ingest import BASE_DIR
+
+# =====================================================
+# FORMAT & LOKASI EKSPOR
+# =====================================================
+# Disajikan langsung oleh static serving Streamlit sebagai /app/static/export/...,
+# sehingga rerun tidak pernah membaca ulang isi file ke memori
+EXPORT_DIR = os.path.join(BASE_DIR, "static", "export")
+EXPORT_URL = "app/static/export"
+CHUNK_ROWS = 50_000
+MAX_FILES = 32
+
+FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "XLSX": (
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+}
+
+
+def filter_hash(version, provinsi, tahun):
+    """Kunci ekspor: hash dari versi data dan state filter."""
+    raw = repr((version, tuple(sorted(provinsi)), tuple(tahun)))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _chunks(df, size=CHUNK_ROWS):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+# =====================================================
+# PENULIS PER FORMAT (BERTAHAP PER POTONGAN)
+# =====================================================
+def _write_csv(df, path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        df.iloc[0:0].to_csv(f, index=False)
+        for part in _chunks(df):
+            part.to_csv(f, index=False, header=False)
+
+
+def _write_parquet(df, path):
+    # Skema diambil dari potongan pertama (frame kosong tidak punya tipe string)
+    schema = pa.Schema.from_pandas(df.iloc[:CHUNK_ROWS], preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for part in _chunks(df):
+            writer.write_table(
+                pa.Table.from_pandas(part, schema=schema, preserve_index=False)
+            )
+
+
+def _write_xlsx(df, path):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Data")
+    ws.append([str(c) for c in df.columns])
+    for part in _chunks(df):
+        # openpyxl menulis ekspansi float32 penuh; simpan nilai seperti sumbernya
+        for row in widen_float32(part).itertuples(index=False, name=None):
+            ws.append([None if v != v else v for v in row])
+    wb.save(path)
+
+
+_WRITERS = {"csv": _write_csv, "parquet": _write_parquet, "xlsx": _write_xlsx}
+
+
+def _prune():
+    # Folder dibagi antarproses: lewati file .tmp yang sedang ditulis dan
+    # file yang keburu dihapus proses lain di antara listdir dan stat
+    files = []
+    for name in os.listdir(EXPORT_DIR):
+        if name.endswith(".tmp"):
+            continue
+        path = os.path.join(EXPORT_DIR, name)
+        try:
+            files.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    files.sort()
+    for _, old in files[:-MAX_FILES]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+
+def export_path(key, fmt):
+    ext, _ = FORMATS[fmt]
+    return os.path.join(EXPORT_DIR, f"{key}.{ext}")
+
+
+def export_url(key, fmt):
+    ext, _ = FORMATS[fmt]
+    return f"{EXPORT_URL}/{key}.{ext}"
+
+
+def build_export(df, key, fmt):
+    """
+    Tulis hasil ekspor ke disk per potongan baris dan kembalikan path-nya.
+
+    File yang sudah ada untuk kunci yang sama dipakai ulang, sehingga
+    ekspor hanya dibangun sekali per state filter.
+    """
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    path = export_path(key, fmt)
+    if not os.path.exists(path):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            _WRITERS[FORMATS[fmt][0]](df, tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        _prune()
+    return path
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import streamlit as st
+
+from core.backend import Backend, backend_analisis, backend_interaktif
+from core.dataset import province_key
+
+# Halaman (judul di st.navigation) yang membaca filter bersama
+HALAMAN = ("Data Interaktif", "Analisis Data & Kesimpulan")
+
+KEY_STATE = "filter_bersama"
+KEY_HASIL = "filter_bersama_hasil"
+MAX_HASIL = 32                  # entri hasil query per sesi
+
+
+# =====================================================
+# MODEL FILTER SESI
+# =====================================================
+@dataclass(frozen=True)
+class FilterState:
+    """Filter lintas halaman: provinsi sebagai `province_key`, rentang tahun."""
+
+    provinsi: tuple
+    tahun: tuple
+
+
+def _opsi():
+    # Provinsi dari kedua dataset digabung lewat kunci kanonik; nama tampilan
+    # diambil dari dataset interaktif (Title Case) bila tersedia
+    nama = {}
+    lo, hi = [], []
+    for be in (backend_analisis(), backend_interaktif()):
+        nama.update({province_key(p): p for p in be.provinces})
+        lo.append(be.year_min)
+        hi.append(be.year_max)
+    return dict(sorted(nama.items())), (min(lo), max(hi))
+
+
+def default_state():
+    """
+    Filter awal setiap sesi: semua provinsi, semua tahun. Satu sumber untuk
+    halaman dan warm-up agar yang dipanaskan sama dengan tampilan pertama.
+    """
+    nama, tahun = _opsi()
+    return FilterState(tuple(nama), tahun)
+
+
+def current():
+    """Filter sesi saat ini; awalnya `default_state()`."""
+    if KEY_STATE not in st.session_state:
+        st.session_state[KEY_STATE] = default_state()
+    return st.session_state[KEY_STATE]
+
+
+def resolve(be, state=None):
+    """(nama provinsi di dataset `be`, rentang tahun yang dijepit ke dataset)."""
+    state = state or current()
+    keys = set(state.provinsi)
+    provinsi = [p for p in be.provinces if province_key(p) in keys]
+    awal = min(max(state.tahun[0], be.year_min), be.year_max)
+    akhir = max(min(state.tahun[1], be.year_max), awal)
+    return provinsi, (awal, akhir)
+
+
+def _simpan(kunci_nama):
+    st.session_state[KEY_STATE] = FilterState(
+        tuple(kunci_nama[n] for n in st.session_state["_fb_provinsi"]),
+        tuple(st.session_state["_fb_tahun"]),
+    )
+
+
+def render_sidebar():
+    """Widget filter bersama di sidebar (dipanggil dari app.py)."""
+    nama, (lo, hi) = _opsi()
+    state = current()
+    # Nilai widget selalu diisi ulang dari model agar tetap utuh walau
+    # halaman tanpa filter (yang tidak merender widget ini) sempat dibuka
+    st.session_state["_fb_provinsi"] = [nama[k] for k in state.provinsi if k in nama]
+    st.session_state["_fb_tahun"] = state.tahun
+    kunci_nama = {v: k for k, v in nama.items()}
+
+    st.sidebar.header("🔍 Filter Bersama")
+    st.sidebar.multiselect(
+        "Pilih Provinsi", list(nama.values()), key="_fb_provinsi",
+        on_change=_simpan, args=(kunci_nama,)
+    )
+    st.sidebar.slider(
+        "Rentang Tahun", lo, hi, key="_fb_tahun",
+        on_change=_simpan, args=(kunci_nama,)
+    )
+
+
+# =====================================================
+# CACHE HASIL QUERY PER SESI
+# =====================================================
+def _beku(x):
+    return tuple(x) if isinstance(x, (list, tuple)) else x
+
+
+class SessionBackend(Backend):
+    """
+    Backend yang mengingat seleksi baris dan agregat per sesi, dikunci pada
+    (versi data, metode, argumen). Kembali ke halaman dengan filter yang
+    sama memakai hasil tersimpan tanpa filter/agregasi ulang.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.schema = base.schema
+        self.version = base.version
+        self.provinces = base.provinces
+        self.year_min = base.year_min
+        self.year_max = base.year_max
+
+    @property
+    def cube(self):
+        return self.base.cube
+
+    def _memo(self, metode, *args):
+        hasil = st.session_state.setdefault(KEY_HASIL, OrderedDict())
+        stat = st.session_state.setdefault(f"{KEY_HASIL}_stat", {"hits": 0, "misses": 0})
+        key = (self.version, metode) + tuple(_beku(a) for a in args)
+        if key in hasil:
+            hasil.move_to_end(key)
+            stat["hits"] += 1
+            return hasil[key]
+        stat["misses"] += 1
+        value = getattr(self.base, metode)(*args)
+        hasil[key] = value
+        while len(hasil) > MAX_HASIL:
+            hasil.popitem(last=False)
+        return value
+
+    def filter(self, provinces, years):
+        # Yang disimpan hanya rentang baris; frame bersama dipotong saat
+        # dibutuhkan sehingga sesi tidak menahan salinan DataFrame
+        selection = self._memo("selection", provinces, years)
+        if selection is None:
+            return self.base.filter(provinces, years)
+        return self.base.take(selection)
+
+    def mean(self, provinces, years, kolom=None):
+        return self._memo("mean", provinces, years, kolom)
+
+    def prov_means(self, provinces, years, col):
+        return self._memo("prov_means", provinces, years, col)
+
+    def year_prov_means(self, provinces, years, col):
+        return self._memo("year_prov_means", provinces, years, col)
+
+    def year_means(self, provinces, years, kolom=None):
+        return self._memo("year_means", provinces, years, kolom)
+
+    def table_page(self, provinces, years, by, ascending, search, offset, limit):
+        return self.base.table_page(provinces, years, by, ascending, search, offset, limit)
+
+
+def session_stats():
+    """Hit/miss cache hasil query sesi ini."""
+    stat = st.session_state.get(f"{KEY_HASIL}_stat", {"hits": 0, "misses": 0})
+    total = stat["hits"] + stat["misses"]
+    return {
+        **stat,
+        "hit_rate": stat["hits"] / total if total else 0.0,
+        "entries": len(st.session_state.get(KEY_HASIL, ())),
+    }
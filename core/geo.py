@@ -0,0 +1,200 @@
+import json
+import math
+import os
+
+import altair as alt
+import numpy as np
+import streamlit as st
+
+from core.cache import cached_resource
+from core.charts import chart_cache, chart_key
+from core.dataset import province_key
+from core.ingest import BASE_DIR, file_digest
+
+# =====================================================
+# KONFIGURASI GEOMETRI
+# =====================================================
+# Toleransi penyederhanaan (derajat) per tingkat detail peta
+TOLERANSI = {"Rendah": 0.05, "Sedang": 0.02, "Tinggi": 0.005}
+DETAIL_DEFAULT = "Sedang"
+
+# File di sini disajikan Streamlit sebagai /app/static/geo/...
+STATIC_DIR = os.path.join(BASE_DIR, "static", "geo")
+STATIC_URL = "app/static/geo"
+
+GEO_PATH = os.environ.get(
+    "KELOMPOK1_GEOJSON", os.path.join(BASE_DIR, "indonesia_provinsi.json")
+)
+
+_NAME_FIELDS = (
+    "Propinsi", "PROVINSI", "Provinsi", "provinsi",
+    "NAME_1", "name", "NAMA", "state",
+)
+
+
+# =====================================================
+# PENYEDERHANAAN (DOUGLAS-PEUCKER)
+# =====================================================
+def _dp_mask(pts, tol):
+    keep = np.zeros(len(pts), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        a, b, seg = pts[i], pts[j], pts[i + 1:j]
+        d = b - a
+        length = math.hypot(d[0], d[1])
+        if length == 0:
+            dist = np.hypot(seg[:, 0] - a[0], seg[:, 1] - a[1])
+        else:
+            dist = np.abs(d[0] * (seg[:, 1] - a[1]) - d[1] * (seg[:, 0] - a[0])) / length
+        k = int(np.argmax(dist))
+        if dist[k] > tol:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return keep
+
+
+def _simplify_ring(ring, tol, decimals):
+    pts = np.asarray(ring, dtype=np.float64)[:, :2]
+    out = np.round(pts[_dp_mask(pts, tol)], decimals)
+    # Ring tertutup butuh minimal 4 titik (titik awal = titik akhir)
+    return out.tolist() if len(out) >= 4 else None
+
+
+def _simplify_polygon(rings, tol, decimals):
+    outer = _simplify_ring(rings[0], tol, decimals)
+    if outer is None:
+        return None
+    holes = [h for h in (_simplify_ring(r, tol, decimals) for r in rings[1:]) if h]
+    return [outer] + holes
+
+
+def _round_polygon(rings, decimals):
+    # Tanpa penyederhanaan dan tanpa syarat jumlah titik: untuk pulau yang
+    # lenyap bahkan saat hanya dibulatkan
+    return [np.round(np.asarray(r, dtype=np.float64)[:, :2], decimals).tolist() for r in rings]
+
+
+def simplify_geometry(geom, tol):
+    """Sederhanakan Polygon/MultiPolygon; pulau yang terlalu kecil dibuang."""
+    decimals = max(2, math.ceil(-math.log10(tol)) + 1)
+    polygons = (
+        [geom["coordinates"]] if geom["type"] == "Polygon" else geom["coordinates"]
+    )
+    parts = [p for p in (_simplify_polygon(r, tol, decimals) for r in polygons) if p]
+    if not parts:
+        # Provinsi tetap harus tampil: pakai bagian terbesar tanpa penyederhanaan
+        largest = max(polygons, key=lambda r: len(r[0]))
+        parts = [_simplify_polygon(largest, 0.0, decimals) or _round_polygon(largest, decimals)]
+    return {"type": "MultiPolygon", "coordinates": parts}
+
+
+def _province_name(props):
+    for field in _NAME_FIELDS:
+        if props.get(field):
+            return props[field]
+    return ""
+
+
+def simplify_geojson(geojson, tol):
+    """FeatureCollection ringkas: hanya geometri + kunci provinsi kanonik."""
+    features = []
+    for feat in geojson["features"]:
+        name = _province_name(feat.get("properties") or {})
+        features.append({
+            "type": "Feature",
+            "properties": {"key": province_key(name), "nama": name},
+            "geometry": simplify_geometry(feat["geometry"], tol),
+        })
+    return {"type": "FeatureCollection", "features": features}
+
+
+# =====================================================
+# CACHE GEOMETRI (SEKALI PER FILE SUMBER)
+# =====================================================
+@cached_resource("geometri")
+def _prepare(path, mtime_ns):
+    digest = file_digest(path)[:12]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    with open(path, encoding="utf-8") as f:
+        geojson = json.load(f)
+
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    levels = {}
+    for detail, tol in TOLERANSI.items():
+        name = f"{stem}-{digest}-{tol}.json"
+        out = os.path.join(STATIC_DIR, name)
+        if os.path.exists(out):
+            with open(out, encoding="utf-8") as f:
+                simple = json.load(f)
+        else:
+            simple = simplify_geojson(geojson, tol)
+            tmp = f"{out}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(simple, f, separators=(",", ":"))
+            os.replace(tmp, out)
+        levels[detail] = {"url": f"{STATIC_URL}/{name}", "features": simple["features"]}
+    return levels
+
+
+def prepared_geometry(path):
+    """Geometri tersederhana per tingkat detail, atau None bila file tidak ada."""
+    if not os.path.exists(path):
+        return None
+    return _prepare(path, os.stat(path).st_mtime_ns)
+
+
+# =====================================================
+# SPESIFIKASI PETA
+# =====================================================
+def choropleth_spec(level, values, col, static_serving=True):
+    """
+    Peta choropleth: geometri dirujuk lewat URL statis (di-cache browser),
+    hanya tabel nilai per provinsi yang ikut di spesifikasi tiap rerun.
+    Tanpa static serving, geometri disisipkan langsung sebagai fallback.
+    """
+    if static_serving:
+        shapes = alt.Data(
+            url=level["url"], format=alt.DataFormat(property="features", type="json")
+        )
+    else:
+        shapes = alt.Data(values=level["features"])
+
+    base = alt.Chart(shapes).mark_geoshape(
+        fill="#e5e7eb", stroke="white", strokeWidth=0.5
+    )
+    warna = alt.Chart(shapes).mark_geoshape(
+        stroke="white", strokeWidth=0.5
+    ).transform_lookup(
+        lookup="properties.key",
+        from_=alt.LookupData(values, "key", [col, "provinsi"]),
+    ).transform_filter(
+        alt.expr.isValid(alt.datum[col])
+    ).encode(
+        color=alt.Color(f"{col}:Q", title="Rata-rata", scale=alt.Scale(scheme="teals")),
+        tooltip=[alt.Tooltip("provinsi:N", title="Provinsi"), alt.Tooltip(f"{col}:Q", format=".2f")],
+    )
+    return alt.layer(base, warna).project("mercator").properties(height=380).to_dict()
+
+
+def map_chart_analisis(be, geometri, detail, provinsi, tahun, col):
+    """Spesifikasi peta halaman Analisis lewat cache grafik."""
+    def build():
+        values = be.prov_means(provinsi, tahun, col)
+        values = values.rename(columns={be.schema.prov: "provinsi"})
+        values["key"] = values["provinsi"].map(province_key)
+        return choropleth_spec(
+            geometri[detail],
+            values,
+            col,
+            static_serving=st.get_option("server.enableStaticServing")
+        )
+
+    return chart_cache().get_or_build(
+        chart_key(be.version, f"map-{detail}", col, provinsi, tahun), build
+    )
@@ -0,0 +1,60 @@
+from core.dataset import standardize_columns
+
+# =====================================================
+# METADATA INDIKATOR
+# =====================================================
+# Kunci mengikuti nama kolom asli Dataset.xlsx (halaman Data Interaktif);
+# kolom dataset Analisis dicocokkan lewat standardize_columns.
+INDIKATOR = [
+    "AHH",
+    "AML",
+    "PPM",
+    "RLS",
+    "TPT",
+    "IPM",
+    "E_Growth",
+    "Laju_Pertumbuhan",
+    "PDRB_Kapita",
+    "Inflasi_(YoY)",
+    "Gini_Ratio"
+]
+NAMA = {
+    "AHH": "Angka Harapan Hidup",
+    "AML": "Angka Melek Huruf",
+    "PPM": "Penduduk Miskin",
+    "RLS": "Rata-rata Lama Sekolah",
+    "TPT": "Tingkat Pengangguran Terbuka",
+    "IPM": "Indeks Pembangunan Manusia",
+    "E_Growth": "Pertumbuhan Ekonomi",
+    "Laju_Pertumbuhan": "Laju Pertumbuhan",
+    "PDRB_Kapita": "PDRB per Kapita",
+    "Inflasi_(YoY)": "Inflasi (Year-on-Year)",
+    "Gini_Ratio": "Gini Ratio"
+}
+
+DEFINISI = {
+    "AHH": "Angka Harapan Hidup (AHH) adalah rata-rata perkiraan jumlah tahun hidup yang akan dijalani seseorang sejak lahir, yang mencerminkan derajat kesehatan masyarakat.",
+    "AML": "Angka Melek Huruf (AML) adalah persentase penduduk usia 15 tahun ke atas yang mampu membaca dan menulis, sebagai indikator dasar kualitas pendidikan.",
+    "PPM": "Pengeluaran Per Kapita (PPM) merupakan rata-rata pengeluaran konsumsi penduduk per orang dalam periode tertentu, yang mencerminkan tingkat kesejahteraan ekonomi.",
+    "RLS": "Rata-rata Lama Sekolah (RLS) adalah rata-rata jumlah tahun pendidikan formal yang telah ditempuh oleh penduduk usia 25 tahun ke atas.",
+    "TPT": "Tingkat Pengangguran Terbuka (TPT) adalah persentase angkatan kerja yang tidak bekerja dan sedang mencari pekerjaan terhadap total angkatan kerja.",
+    "IPM": "Indeks Pembangunan Manusia (IPM) merupakan indeks komposit yang mengukur capaian pembangunan manusia melalui dimensi kesehatan, pendidikan, dan standar hidup layak.",
+    "E_Growth": "Economic Growth (Pertumbuhan Ekonomi) adalah persentase perubahan Produk Domestik Regional Bruto (PDRB) riil dari satu periode ke periode berikutnya.",
+    "Laju_Pertumbuhan": "Laju Pertumbuhan menunjukkan persentase perubahan suatu variabel ekonomi dalam periode tertentu.",
+    "PDRB_Kapita": "PDRB per Kapita adalah nilai Produk Domestik Regional Bruto dibagi jumlah penduduk.",
+    "Inflasi_(YoY)": "Inflasi Year-on-Year (YoY) adalah persentase kenaikan harga barang dan jasa dibandingkan periode yang sama pada tahun sebelumnya.",
+    "Gini_Ratio": "Gini Ratio adalah ukuran ketimpangan distribusi pendapatan dengan nilai antara 0 hingga 1."
+}
+
+
+_KUNCI = dict(zip(standardize_columns(INDIKATOR), INDIKATOR))
+
+
+def metadata(kolom):
+    """Nama & definisi untuk kolom indikator mana pun (asli atau terstandar)."""
+    asli = kolom if kolom in NAMA else _KUNCI.get(standardize_columns([kolom])[0])
+    return {
+        "kolom": kolom,
+        "nama": NAMA.get(asli),
+        "definisi": DEFINISI.get(asli),
+    }
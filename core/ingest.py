@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from core.validate import validate_table
+
+# =====================================================
+# LOKASI CACHE KOLOMNAR
+# =====================================================
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.environ.get(
+    "KELOMPOK1_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "ingest")
+)
+# Naikkan bila langkah ingest berubah agar cache lama dibangun ulang
+PIPELINE = 2
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """Hash SHA-256 isi file, dibaca per potongan agar hemat memori."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_paths(source):
+    stem = os.path.splitext(os.path.basename(source))[0]
+    # Sertakan hash path agar dua file bernama sama tidak saling menimpa
+    tag = hashlib.sha1(os.path.abspath(source).encode("utf-8")).hexdigest()[:8]
+    base = os.path.join(CACHE_DIR, f"{stem}-{tag}")
+    return base + ".parquet", base + ".json", base + ".karantina.parquet"
+
+
+def _read_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, writer):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    writer(tmp)
+    os.replace(tmp, path)
+
+
+def _read_source(source):
+    ext = os.path.splitext(source)[1].lower()
+    if ext == ".csv":
+        return pd.read_csv(source)
+    if ext == ".parquet":
+        return pd.read_parquet(source)
+    return pd.read_excel(source)
+
+
+def ingest(source):
+    """
+    Konversi workbook sumber menjadi file Parquet sekali saja.
+
+    Saat dibangun, tabel divalidasi (lihat `validate_table`): kolom
+    indikator dikoersi menjadi angka dan sel yang ditolak disimpan di
+    Parquet karantina terpisah.
+
+    Cache dikunci pada mtime dan hash isi file sumber: bila mtime sama,
+    file tidak di-hash ulang; bila mtime berubah tetapi isinya sama,
+    manifest cukup diperbarui tanpa parsing ulang.
+    Mengembalikan manifest (dict) berisi path Parquet dan hash sumber.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    parquet_path, manifest_path, karantina_path = _cache_paths(source)
+    stat = os.stat(source)
+    manifest = _read_manifest(manifest_path)
+    have_parquet = os.path.exists(parquet_path) and os.path.exists(karantina_path)
+    if manifest and manifest.get("pipeline") != PIPELINE:
+        manifest = None
+
+    if (
+        manifest
+        and have_parquet
+        and manifest.get("mtime_ns") == stat.st_mtime_ns
+        and manifest.get("size") == stat.st_size
+    ):
+        return manifest
+
+    digest = file_digest(source)
+    if manifest and have_parquet and manifest.get("sha256") == digest:
+        rejected = manifest.get("rejected", 0)
+    else:
+        df, karantina = validate_table(_read_source(source))
+        _write_atomic(parquet_path, lambda p: df.to_parquet(p, index=False))
+        _write_atomic(karantina_path, lambda p: karantina.to_parquet(p, index=False))
+        rejected = len(karantina)
+
+    manifest = {
+        "source": os.path.abspath(source),
+        "parquet": parquet_path,
+        "quarantine": karantina_path,
+        "rejected": rejected,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "pipeline": PIPELINE,
+    }
+
+    def _dump(p):
+        with open(p, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+    _write_atomic(manifest_path, _dump)
+    return manifest
+
+
+def load_table(source):
+    """Baca tabel sumber lewat cache Parquet (parse Excel hanya saat berubah)."""
+    return pd.read_parquet(ingest(source)["parquet"])
+
+
+def load_quarantine(source):
+    """Sel yang ditolak saat validasi ingest (baris, kolom, nilai, alasan)."""
+    return pd.read_parquet(ingest(source)["quarantine"])
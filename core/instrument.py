@@ -0,0 +1,141 @@
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from core.ingest import BASE_DIR
+
+# =====================================================
+# KONFIGURASI
+# =====================================================
+ENV_FLAG = "KELOMPOK1_PROFILE"
+QUERY_FLAG = "profile"
+LOG_PATH = os.environ.get(
+    "KELOMPOK1_TIMING_LOG", os.path.join(BASE_DIR, ".cache", "logs", "timing.jsonl")
+)
+
+_STATE = "_instrument_stages"
+_START = "_instrument_start"
+_ENABLED = "_instrument_enabled"
+_PAGE = "_instrument_page"
+
+
+def _logger():
+    logger = logging.getLogger("kelompok1.timing")
+    if not logger.handlers:
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        handler = RotatingFileHandler(
+            LOG_PATH, maxBytes=1_000_000, backupCount=5, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def enabled():
+    """Aktif lewat env KELOMPOK1_PROFILE=1 atau query `?profile=1`."""
+    if get_script_run_ctx() is None:
+        return False
+    if os.environ.get(ENV_FLAG, "").lower() in ("1", "true", "yes"):
+        return True
+    # Query param bisa hilang saat pindah halaman, jadi diingat per sesi
+    flag = st.query_params.get(QUERY_FLAG)
+    if flag is not None:
+        st.session_state[_ENABLED] = flag.lower() in ("1", "true", "yes")
+    return st.session_state.get(_ENABLED, False)
+
+
+# =====================================================
+# PENCATATAN TAHAP
+# =====================================================
+@contextmanager
+def stage(name):
+    """
+    Catat durasi satu tahap bernama (load, normalize, filter, aggregate,
+    chart, table, export). Tanpa overhead berarti bila instrumentasi mati.
+    """
+    if not enabled():
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        stages = st.session_state.setdefault(_STATE, {})
+        total, count = stages.get(name, (0.0, 0))
+        stages[name] = (total + ms, count + 1)
+
+
+def begin_rerun():
+    if enabled():
+        st.session_state[_STATE] = {}
+        st.session_state[_START] = time.perf_counter()
+
+
+def end_rerun(page, fragment=None):
+    """Tutup satu rerun: tulis record JSONL dan kembalikan record-nya."""
+    if not enabled():
+        return None
+    start = st.session_state.get(_START, time.perf_counter())
+    stages = st.session_state.get(_STATE, {})
+    record = {
+        "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "page": page,
+        "total_ms": round((time.perf_counter() - start) * 1000, 2),
+        "stages": {
+            name: {"ms": round(ms, 2), "calls": calls}
+            for name, (ms, calls) in stages.items()
+        },
+    }
+    if fragment:
+        record["fragment"] = fragment
+    else:
+        st.session_state[_PAGE] = page
+    _logger().info(json.dumps(record, ensure_ascii=False))
+    return record
+
+
+def fragment(func):
+    """
+    `st.fragment` yang ikut diinstrumentasi: rerun khusus fragment tidak
+    melewati app.py, jadi fragment membuka dan menutup record-nya sendiri
+    (dicatat dengan nama fragment) agar tahapnya tidak tertumpuk ke rerun
+    halaman sebelumnya.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        ctx = get_script_run_ctx()
+        if ctx is None or not ctx.fragment_ids_this_run:
+            return func(*args, **kwargs)
+        begin_rerun()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end_rerun(st.session_state.get(_PAGE), fragment=func.__name__)
+
+    return st.fragment(wrapper)
+
+
+def render_sidebar(record):
+    """Rincian waktu rerun terakhir dalam expander sidebar."""
+    if record is None:
+        return
+    with st.sidebar.expander("⏱️ Rincian Waktu Rerun"):
+        st.caption(f"{record['page']} · total {record['total_ms']:.1f} ms")
+        rows = sorted(
+            record["stages"].items(), key=lambda kv: kv[1]["ms"], reverse=True
+        )
+        st.table({
+            "Tahap": [name for name, _ in rows],
+            "ms": [f"{v['ms']:.1f}" for _, v in rows],
+            "Panggilan": [v["calls"] for _, v in rows],
+        })
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+
+class ProvinceYearIndex:
+    """
+    Indeks (provinsi, tahun) di atas DataFrame yang sudah terurut.
+
+    Setiap baris diberi kunci gabungan `kode_provinsi * rentang + tahun`,
+    sehingga satu filter provinsi/rentang tahun cukup diselesaikan dengan
+    `searchsorted` per provinsi terpilih, bukan scan boolean seluruh baris.
+    """
+
+    def __init__(self, df, prov, tahun):
+        self.df = df
+        codes, uniques = pd.factorize(df[prov], sort=True)
+        years = df[tahun].to_numpy(dtype=np.int64)
+        self.provinces = list(uniques)
+        self._code = {p: i for i, p in enumerate(self.provinces)}
+        self.year_min = int(years.min()) if len(years) else 0
+        self.year_max = int(years.max()) if len(years) else 0
+        self._span = self.year_max - self.year_min + 2
+        self._keys = codes.astype(np.int64) * self._span + (years - self.year_min)
+        if np.any(np.diff(self._keys) < 0):
+            raise ValueError("DataFrame harus terurut berdasarkan (provinsi, tahun)")
+
+    @property
+    def row_codes(self):
+        """Kode provinsi per baris (posisi dalam `provinces`)."""
+        return self._keys // self._span
+
+    def codes(self, provinces):
+        return np.array(
+            sorted(self._code[p] for p in set(provinces) if p in self._code),
+            dtype=np.int64,
+        )
+
+    def ranges(self, provinces, years):
+        """Rentang baris [awal, akhir) untuk tiap provinsi terpilih, sudah digabung."""
+        codes = self.codes(provinces)
+        lo = max(int(years[0]), self.year_min) - self.year_min
+        hi = min(int(years[1]), self.year_max) - self.year_min
+        if len(codes) == 0 or lo > hi:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        base = codes * self._span
+        starts = np.searchsorted(self._keys, base + lo, side="left")
+        ends = np.searchsorted(self._keys, base + hi, side="right")
+        keep = ends > starts
+        starts, ends = starts[keep], ends[keep]
+
+        # Gabungkan rentang yang bersambung agar bisa dipotong sebagai satu slice
+        if len(starts) > 1:
+            brk = np.flatnonzero(starts[1:] != ends[:-1]) + 1
+            starts = starts[np.r_[0, brk]]
+            ends = ends[np.r_[brk - 1, len(ends) - 1]]
+        return starts, ends
+
+    @staticmethod
+    def _positions(starts, ends):
+        lengths = ends - starts
+        if len(lengths) == 0:
+            return np.empty(0, dtype=np.int64)
+        offsets = np.repeat(starts - np.r_[0, np.cumsum(lengths)[:-1]], lengths)
+        return np.arange(lengths.sum(), dtype=np.int64) + offsets
+
+    def positions(self, provinces, years):
+        return self._positions(*self.ranges(provinces, years))
+
+    def take(self, starts, ends):
+        """
+        Baris untuk rentang hasil `ranges`. Satu rentang bersambung
+        dikembalikan sebagai slice (view); selain itu sebagai `take`.
+        """
+        if len(starts) == 0:
+            return self.df.iloc[0:0]
+        if len(starts) == 1:
+            return self.df.iloc[int(starts[0]):int(ends[0])]
+        return self.df.take(self._positions(starts, ends))
+
+    def filter(self, provinces, years):
+        """Subset baris untuk provinsi dan rentang tahun (inklusif)."""
+        return self.take(*self.ranges(provinces, years))
@@ -0,0 +1,242 @@
+"""
+Laporan HTML mandiri per provinsi dari analisis halaman Analisis.
+
+Contoh:
+    python -m core.report --output laporan/
+    python -m core.report --provinsi "JAWA BARAT" "BALI" --tahun 2018 2024
+
+Setiap laporan memuat ringkasan statistik, narasi tren, grafik Altair dan
+Plotly (spesifikasi tertanam, dirender vega-embed/plotly.js dari CDN) dan
+tabel sebab-akibat. Provinsi dibagi ke process pool; tiap worker memuat
+dataset sekali lalu menulis laporannya sendiri.
+"""
+import argparse
+import html
+import json
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import plotly.graph_objects as go
+
+from core.analysis import cause_effect_table, label_indikator, trend_narrative
+from core.backend import backend_analisis
+from core.charts import _json_default, bar_chart_spec, trend_facet_spec
+from core.dataset import province_key
+from core.ingest import BASE_DIR
+
+OUTPUT_DIR = os.path.join(BASE_DIR, "laporan")
+
+_CDN = """
+<script src="https://cdn.jsdelivr.net/npm/vega@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@6"></script>
+<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
+"""
+
+_CSS = """
+body { font-family: sans-serif; background: #EBF4DD; color: #2F4F3F; margin: 2rem; }
+.grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: .75rem; }
+.metric-box { background: #fff; border-radius: 8px; padding: .75rem; }
+.highlight { background: #fff; border-left: 4px solid #5A7863; padding: 1rem; }
+.charts > div { margin-bottom: 1.5rem; }
+table { border-collapse: collapse; background: #fff; }
+td, th { border: 1px solid #ccc; padding: .3rem .6rem; }
+"""
+
+
+# =====================================================
+# PERHITUNGAN PER PROVINSI
+# =====================================================
+_be = None
+
+
+def _init():
+    global _be
+    # Di luar `streamlit run` cache tetap berfungsi; peringatan bare mode tidak perlu
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    _be = backend_analisis()
+
+
+def slug(provinsi):
+    return re.sub(r"[^a-z0-9]+", "-", province_key(provinsi).lower()).strip("-")
+
+
+def _json(obj):
+    # Aman disisipkan di dalam <script>
+    return json.dumps(obj, default=_json_default).replace("</", "<\\/")
+
+
+@lru_cache(maxsize=8)
+def _perbandingan(tahun, utama):
+    # Sama untuk semua laporan dengan periode yang sama: dibuat sekali per worker
+    be = _be
+    return bar_chart_spec(
+        be.prov_means(be.provinces, tahun, utama).sort_values(by=utama),
+        be.schema.prov, utama,
+    )
+
+
+def build_report(provinsi, tahun, utama):
+    """Isi laporan satu provinsi: dict berisi teks, tabel dan spesifikasi grafik."""
+    be = _be
+    schema = be.schema
+    indikator = list(schema.indikator)
+    mean_values = be.mean([provinsi], tahun)
+    means = be.year_means([provinsi], tahun)
+
+    nasional = be.year_means(be.provinces, tahun, [utama])[utama]
+    fig = go.Figure([
+        go.Scatter(x=means.index, y=means[utama], mode="lines+markers", name=provinsi),
+        go.Scatter(x=nasional.index, y=nasional, mode="lines", name="Rata-rata nasional",
+                   line={"dash": "dash"}),
+    ])
+    fig.update_layout(
+        title=f"{label_indikator(utama)}: {provinsi} vs rata-rata nasional",
+        xaxis_title="Tahun", hovermode="x unified",
+    )
+
+    return {
+        "provinsi": provinsi,
+        "tahun": tahun,
+        "ringkasan": mean_values,
+        "narasi": trend_narrative(mean_values, means),
+        "sebab_akibat": cause_effect_table(means, indikator, indikator),
+        "altair": [
+            _perbandingan(tuple(tahun), utama),
+            trend_facet_spec(means, schema.tahun),
+        ],
+        "plotly": [fig.to_plotly_json()],
+    }
+
+
+def render_html(report):
+    """HTML satu file dengan spesifikasi grafik tertanam."""
+    e = html.escape
+    t0, t1 = report["tahun"]
+    metrik = "".join(
+        f"<div class='metric-box'><b>{e(col.replace('_', ' ').upper())}</b>"
+        f"<h3>{val:.2f}</h3></div>"
+        for col, val in report["ringkasan"].items()
+    )
+    grafik, skrip = [], []
+    for i, spec in enumerate(report["altair"]):
+        grafik.append(f"<div id='vl{i}'></div>")
+        skrip.append(f"vegaEmbed('#vl{i}', {_json(spec)}, {{actions: false}});")
+    for i, fig in enumerate(report["plotly"]):
+        grafik.append(f"<div id='pl{i}'></div>")
+        skrip.append(
+            f"(function(f){{Plotly.newPlot('pl{i}', f.data, f.layout, "
+            f"{{responsive: true}});}})({_json(fig)});"
+        )
+    tabel = report["sebab_akibat"]
+    tabel_html = tabel.to_html(index=False, escape=True) if not tabel.empty else (
+        "<p>Tidak ada data untuk kombinasi indikator yang dipilih.</p>"
+    )
+    return f"""<!DOCTYPE html>
+<html lang="id">
+<head>
+<meta charset="utf-8">
+<title>Laporan {e(report['provinsi'])} {t0}–{t1}</title>
+<style>{_CSS}</style>
+{_CDN}
+</head>
+<body>
+<h1>📊 Analisis Data & Kesimpulan: {e(report['provinsi'])}</h1>
+<p>Periode {t0}–{t1}</p>
+<h2>📌 Ringkasan Statistik</h2>
+<div class="grid">{metrik}</div>
+<h2>🧠 Analisis Data</h2>
+<div class="highlight">{e(" ".join(report['narasi']))}</div>
+<h2>📊 Grafik</h2>
+<div class="charts">{"".join(grafik)}</div>
+<h2>🧩 Analisis Sebab-Akibat</h2>
+{tabel_html}
+<script>
+{chr(10).join(skrip)}
+</script>
+</body>
+</html>
+"""
+
+
+def write_report(provinsi, tahun, utama, output):
+    t = time.perf_counter()
+    path = os.path.join(output, f"{slug(provinsi)}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(render_html(build_report(provinsi, tahun, utama)))
+    return provinsi, path, time.perf_counter() - t
+
+
+def _index_html(hasil, tahun):
+    baris = "".join(
+        f"<li><a href='{html.escape(os.path.basename(p))}'>{html.escape(prov)}</a></li>"
+        for prov, p, _ in sorted(hasil)
+    )
+    return (
+        f"<!DOCTYPE html><html lang='id'><head><meta charset='utf-8'>"
+        f"<title>Laporan {tahun[0]}–{tahun[1]}</title><style>{_CSS}</style></head>"
+        f"<body><h1>Laporan per Provinsi ({tahun[0]}–{tahun[1]})</h1><ul>{baris}</ul></body></html>"
+    )
+
+
+# =====================================================
+# CLI
+# =====================================================
+def generate(provinsi=None, tahun=None, utama=None, output=OUTPUT_DIR, workers=None):
+    """Tulis laporan semua provinsi terpilih secara paralel; kembalikan hasil per provinsi."""
+    _init()
+    be = _be
+    provinsi = provinsi or be.provinces
+    keys = {province_key(p): p for p in be.provinces}
+    provinsi = [keys.get(province_key(p), p) for p in provinsi]
+    tahun = tuple(tahun or (be.year_min, be.year_max))
+    indikator = list(be.schema.indikator)
+    utama = utama or ("e_growth" if "e_growth" in indikator else indikator[0])
+
+    os.makedirs(output, exist_ok=True)
+    n = len(provinsi)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init) as pool:
+        hasil = list(pool.map(
+            write_report, provinsi, [tahun] * n, [utama] * n, [output] * n
+        ))
+    with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as f:
+        f.write(_index_html(hasil, tahun))
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=OUTPUT_DIR)
+    parser.add_argument("--provinsi", nargs="*", default=None,
+                        help="nama provinsi (ejaan apa pun); default semua")
+    parser.add_argument("--tahun", nargs=2, type=int, default=None,
+                        metavar=("AWAL", "AKHIR"))
+    parser.add_argument("--indikator", default=None,
+                        help="indikator utama untuk grafik perbandingan")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    _init()
+    indikator = _be.schema.indikator
+    if args.indikator is not None and args.indikator not in indikator:
+        parser.error(
+            f"indikator tidak dikenal: {args.indikator} (pilihan: {', '.join(indikator)})"
+        )
+
+    t0 = time.perf_counter()
+    hasil = generate(args.provinsi, args.tahun, args.indikator, args.output, args.workers)
+    print(
+        f"{len(hasil)} laporan ditulis ke {args.output} "
+        f"({time.perf_counter() - t0:.1f} detik)"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
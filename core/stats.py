@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+from core.analysis import label_indikator
+from core.cache import cached_result
+
+MODEL_POOLED = "pooled"
+MODEL_FE = "fe"
+
+
+# =====================================================
+# OLS BERBATCH
+# =====================================================
+def _demean(V, W, groups, n_groups):
+    """Kurangi rata-rata per provinsi (hanya baris valid) dari `V[m, n, k]`."""
+    G = np.zeros((len(groups), n_groups))
+    G[np.arange(len(groups)), groups] = 1.0
+    VW = V * W[..., None]
+    sums = np.einsum("ng,mnk->mgk", G, VW)
+    cnt = W @ G                                   # [m, g]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(cnt[..., None] > 0, sums / cnt[..., None], 0.0)
+    return (V - means[:, groups, :]) * W[..., None], (cnt > 0).sum(axis=1)
+
+
+def ols_batch(Y, X, groups=None, n_groups=0):
+    """
+    Banyak regresi OLS sekaligus dengan jumlah regresor yang sama.
+
+    Y : [m, n] variabel dependen per model
+    X : [m, n, p] regresor per model (tanpa konstanta)
+    groups : kode provinsi per baris; bila diberikan, model efek tetap
+             provinsi (within estimator), selain itu pooled dengan konstanta.
+
+    Baris dengan NaN di salah satu variabel model dibuang per model.
+    Mengembalikan dict berisi koefisien, standard error, R² dan n.
+    """
+    W = (~np.isnan(Y) & ~np.isnan(X).any(axis=2)).astype(np.float64)
+    Y = np.where(W > 0, Y, 0.0)
+    X = np.where(W[..., None] > 0, X, 0.0)
+    n = W.sum(axis=1)
+
+    if groups is not None:
+        Z, n_fe = _demean(np.concatenate([Y[..., None], X], axis=2), W, groups, n_groups)
+        Y, X = Z[..., 0], Z[..., 1:]
+        dof = n - X.shape[2] - n_fe
+    else:
+        X = np.concatenate([W[..., None], X], axis=2)   # konstanta (0 di baris invalid)
+        dof = n - X.shape[2]
+
+    XtX = np.einsum("mnp,mnq->mpq", X, X)
+    Xty = np.einsum("mnp,mn->mp", X, Y)
+    # pinv lebih tahan terhadap regresor konstan/kolinear daripada solve
+    inv = np.linalg.pinv(XtX)
+    beta = np.einsum("mpq,mq->mp", inv, Xty)
+
+    resid = (Y - np.einsum("mnp,mp->mn", X, beta)) * W
+    ssr = (resid ** 2).sum(axis=1)
+    if groups is not None:
+        sst = (Y ** 2).sum(axis=1)                      # R² within
+    else:
+        ybar = Y.sum(axis=1) / np.maximum(n, 1)
+        sst = (((Y - ybar[:, None]) * W) ** 2).sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sigma2 = np.where(dof > 0, ssr / dof, np.nan)
+        se = np.sqrt(np.diagonal(inv, axis1=1, axis2=2) * sigma2[:, None])
+        r2 = np.where(sst > 0, 1.0 - ssr / sst, np.nan)
+    if groups is None:
+        beta, se = beta[:, 1:], se[:, 1:]               # buang konstanta
+    return {"coef": beta, "se": se, "r2": r2, "n": n.astype(int)}
+
+
+# =====================================================
+# SPESIFIKASI MODEL
+# =====================================================
+def pair_specs(dependen, regresor):
+    """Satu model bivariat per (dependen, regresor), tanpa pasangan diri sendiri."""
+    return [(y, (x,)) for y in dependen for x in regresor if x != y]
+
+
+def fit_panel(df, kol_prov, specs, model=MODEL_POOLED):
+    """
+    Estimasi semua spesifikasi `(dependen, (regresor, ...))` pada data panel.
+
+    Model dengan jumlah regresor yang sama dihitung dalam satu batch
+    aljabar linear NumPy. Hasil: satu baris per (model, regresor).
+    """
+    if df.empty or not specs:
+        return pd.DataFrame()
+    groups, uniques = pd.factorize(df[kol_prov], sort=True)
+    kolom = sorted({c for y, xs in specs for c in (y, *xs)})
+    V = df[kolom].to_numpy(dtype=np.float64).T          # [k, n]
+    idx = {c: i for i, c in enumerate(kolom)}
+
+    by_p = {}
+    for s in specs:
+        by_p.setdefault(len(s[1]), []).append(s)
+
+    rows = []
+    for p, batch in by_p.items():
+        Y = V[[idx[y] for y, _ in batch]]
+        X = np.stack([V[[idx[x] for x in xs]].T for _, xs in batch])
+        res = ols_batch(
+            Y, X,
+            groups=groups if model == MODEL_FE else None,
+            n_groups=len(uniques),
+        )
+        for m, (y, xs) in enumerate(batch):
+            for j, x in enumerate(xs):
+                rows.append({
+                    "Dependen": label_indikator(y),
+                    "Variabel": label_indikator(x),
+                    "Koefisien": res["coef"][m, j],
+                    "Std. Error": res["se"][m, j],
+                    "t": res["coef"][m, j] / res["se"][m, j] if res["se"][m, j] else np.nan,
+                    "R²": res["r2"][m],
+                    "n": res["n"][m],
+                })
+    return pd.DataFrame(rows)
+
+
+@cached_result("regresi")
+def fit_panel_cached(version, provinsi, tahun, specs, model, _be):
+    """`fit_panel` yang di-cache per (versi data, filter, spesifikasi, model)."""
+    return fit_panel(_be.filter(list(provinsi), tahun), _be.schema.prov, list(specs), model)
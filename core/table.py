@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.cache import cached_resource
+from core.instrument import stage
+
+UKURAN_HALAMAN = (25, 50, 100, 250)
+URUTAN_DEFAULT = "(Default)"
+
+
+# =====================================================
+# INDEKS URUTAN (SEKALI PER DATASET & KUNCI URUT)
+# =====================================================
+def _rank_codes(series, ascending):
+    # Kode urut per kolom; NaN selalu di akhir seperti sort_values pandas
+    codes, uniques = pd.factorize(series, sort=True)
+    n = len(uniques)
+    codes = np.where(codes < 0, n, codes if ascending else n - 1 - codes)
+    return codes
+
+
+@cached_resource("urutan_tabel")
+def sort_order(version, _df, by, ascending):
+    """Permutasi baris seluruh dataset untuk kunci urut `by` (stabil)."""
+    keys = [_rank_codes(_df[c], a) for c, a in zip(by, ascending)]
+    return np.lexsort(keys[::-1])
+
+
+def ordered_positions(ds, positions, by=None, ascending=None, search=""):
+    """
+    Posisi baris subset, terurut dan tersaring pencarian Provinsi.
+
+    Urutan diambil dari indeks urut seluruh dataset lalu disaring dengan
+    mask keanggotaan, jadi tidak ada sort ulang per rerun.
+    """
+    member = np.zeros(len(ds.df), dtype=bool)
+    member[positions] = True
+
+    if search:
+        q = ds.query
+        cocok = [i for i, p in enumerate(q.provinces) if search.casefold() in str(p).casefold()]
+        member &= np.isin(q.row_codes, cocok)
+
+    if not by:
+        return np.flatnonzero(member)
+    order = sort_order(ds.version, ds.df, tuple(by), tuple(ascending))
+    return order[member[order]]
+
+
+# =====================================================
+# KOMPONEN TABEL BERHALAMAN
+# =====================================================
+def paged_table(backend, provinces, years, key, default_sort=None, height=450):
+    """
+    Tabel yang diurutkan dan dipotong di server (lewat backend query);
+    hanya halaman yang terlihat dikirim ke browser.
+    `default_sort` = (kolom, ascending).
+    """
+    schema = backend.schema
+    kolom = [schema.prov, schema.tahun] + list(schema.indikator)
+    c1, c2, c3, c4 = st.columns([3, 2, 3, 2])
+    with c1:
+        urut = st.selectbox(
+            "Urutkan", [URUTAN_DEFAULT] + kolom, key=f"{key}_urut"
+        )
+    with c2:
+        naik = st.radio(
+            "Arah", ["Naik", "Turun"], horizontal=True, key=f"{key}_arah"
+        ) == "Naik"
+    with c3:
+        cari = st.text_input(
+            f"Cari {schema.prov}", key=f"{key}_cari"
+        ).strip()
+    with c4:
+        ukuran = st.selectbox(
+            "Baris/halaman", UKURAN_HALAMAN, key=f"{key}_ukuran"
+        )
+
+    if urut == URUTAN_DEFAULT:
+        by, ascending = default_sort or (None, None)
+    else:
+        by, ascending = [urut], [naik]
+
+    # Jaga nomor halaman tetap valid saat hasil filter mengecil
+    k_hal = f"{key}_hal"
+    awal = (st.session_state.get(k_hal, 1) - 1) * ukuran
+
+    with stage("table"):
+        halaman, total = backend.table_page(
+            provinces, years, by, ascending, cari, awal, ukuran
+        )
+        n_hal = max(1, -(-total // ukuran))
+        if awal and awal >= total:
+            # Termasuk hasil kosong: kembali ke halaman 1, bukan halaman lama
+            st.session_state[k_hal] = n_hal
+            awal = (n_hal - 1) * ukuran
+            halaman, total = backend.table_page(
+                provinces, years, by, ascending, cari, awal, ukuran
+            )
+        st.number_input(
+            f"Halaman (dari {n_hal})", min_value=1, max_value=n_hal, key=k_hal
+        )
+        st.dataframe(
+            halaman,
+            use_container_width=True,
+            height=height,
+            hide_index=True
+        )
+    st.caption(
+        f"Menampilkan {min(awal + 1, total)}–{min(awal + ukuran, total)} "
+        f"dari {total} baris"
+    )
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+# Penanda "data tidak tersedia" pada tabel BPS
+PENANDA_KOSONG = {"-", "–", "—", "…", "...", "..", "x", "na", "n/a", "n.a", "n.a.", "nan", "none", ""}
+# Catatan kaki di ujung angka: 12,5*  12.5¹  12.5 a)  12.5(r)
+_CATATAN_KAKI = r"(?:\s*[*†‡¹²³⁴⁵⁶⁷⁸⁹⁰]+|\s*\(?[a-zA-Z]\)|\s*\([a-zA-Z]+\))+$"
+
+ALASAN_KOSONG = "penanda kosong BPS"
+ALASAN_BUKAN_ANGKA = "bukan angka"
+ALASAN_TAHUN = "tahun tidak valid"
+ALASAN_PROVINSI = "provinsi kosong"
+
+KOLOM_KARANTINA = ["baris", "provinsi", "tahun", "kolom", "nilai", "alasan"]
+
+
+# =====================================================
+# KOERSI ANGKA (VEKTOR)
+# =====================================================
+def coerce_numeric(values):
+    """
+    Ubah kolom berformat BPS menjadi float dalam satu pass vektor.
+
+    Menangani penanda kosong ("-", "…"), desimal koma (12,5), pemisah
+    ribuan titik bila ada koma (1.234,5) dan catatan kaki di ujung angka.
+    Mengembalikan (nilai float, alasan penolakan per sel atau None).
+    """
+    values = pd.Series(values)
+    alasan = pd.Series(None, index=values.index, dtype=object)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.float64), alasan
+
+    num = pd.to_numeric(values, errors="coerce")
+    teks_mask = num.isna() & values.notna()
+    if not teks_mask.any():
+        return num.astype(np.float64), alasan
+
+    text = (
+        values[teks_mask].astype(str)
+        .str.replace("\u00a0", " ", regex=False)
+        .str.strip()
+        .str.replace(_CATATAN_KAKI, "", regex=True)
+        .str.replace(" ", "", regex=False)
+    )
+    koma, titik = text.str.rfind(","), text.str.rfind(".")
+    ribuan_titik = (koma > titik) & (titik >= 0)
+    text = text.where(~ribuan_titik, text.str.replace(".", "", regex=False))
+    desimal_koma = koma > titik
+    text = text.where(
+        desimal_koma,
+        text.str.replace(",", "", regex=False),   # 1,234.5 -> 1234.5
+    ).str.replace(",", ".", regex=False)
+
+    hasil = pd.to_numeric(text, errors="coerce")
+    num[teks_mask] = hasil
+
+    gagal = hasil.isna()
+    kosong = values[teks_mask].astype(str).str.strip().str.lower().isin(PENANDA_KOSONG)
+    alasan[gagal[gagal].index] = np.where(kosong[gagal], ALASAN_KOSONG, ALASAN_BUKAN_ANGKA)
+    return num.astype(np.float64), alasan
+
+
+# =====================================================
+# VALIDASI TABEL
+# =====================================================
+def _karantina(df, mask, kolom, alasan):
+    prov, tahun = df.columns[0], df.columns[1]
+    rows = df.index[mask]
+    return pd.DataFrame({
+        "baris": rows + 2,                       # nomor baris di file sumber
+        "provinsi": df.loc[rows, prov].astype(str).to_numpy(),
+        "tahun": df.loc[rows, tahun].astype(str).to_numpy(),
+        "kolom": kolom,
+        "nilai": df.loc[rows, kolom].astype(str).to_numpy(),
+        "alasan": np.asarray(alasan)[mask] if np.ndim(alasan) else alasan,
+    })
+
+
+def validate_table(df):
+    """
+    Validasi sekali saat ingest. Kolom pertama = provinsi, kedua = tahun,
+    sisanya indikator numerik.
+
+    Baris tanpa provinsi atau dengan tahun tak terbaca dibuang; sel indikator
+    yang tidak bisa dibaca menjadi NaN. Semua yang ditolak dicatat di tabel
+    karantina beserta alasannya. Mengembalikan (df bersih, karantina).
+    """
+    df = df.reset_index(drop=True)
+    prov, tahun = df.columns[0], df.columns[1]
+    karantina = []
+
+    prov_kosong = (df[prov].isna() | (df[prov].astype(str).str.strip() == "")).to_numpy()
+    if prov_kosong.any():
+        karantina.append(_karantina(df, prov_kosong, prov, ALASAN_PROVINSI))
+
+    t, _ = coerce_numeric(df[tahun])
+    tahun_salah = (t.isna() | (t % 1 != 0)).to_numpy() & ~prov_kosong
+    if tahun_salah.any():
+        karantina.append(_karantina(df, tahun_salah, tahun, ALASAN_TAHUN))
+
+    keep = ~(prov_kosong | tahun_salah)
+    bersih = {prov: df[prov], tahun: t.round().astype("Int64")}
+    for c in df.columns[2:]:
+        nilai, alasan = coerce_numeric(df[c])
+        ditolak = (alasan.notna().to_numpy()) & keep
+        if ditolak.any():
+            karantina.append(_karantina(df, ditolak, c, alasan.to_numpy()))
+        bersih[c] = nilai
+
+    out = pd.DataFrame(bersih)[list(df.columns)][keep].reset_index(drop=True)
+    out[tahun] = out[tahun].astype(np.int64)
+    karantina = (
+        pd.concat(karantina, ignore_index=True) if karantina
+        else pd.DataFrame(columns=KOLOM_KARANTINA)
+    )
+    return out, karantina.astype(str).assign(baris=lambda k: k["baris"].astype(np.int64))
@@ -0,0 +1,139 @@
+"""
+Warm-up cache di latar belakang saat proses Streamlit mulai melayani.
+
+app.py memanggil `start_warmup()` di setiap rerun; thread hanya dibuat
+sekali per proses (lewat st.cache_resource). Halaman tidak menunggu
+warm-up: mereka memanggil fungsi ter-cache yang sama, jadi hasil yang
+sudah siap langsung dipakai dan yang belum dihitung seperti biasa.
+
+Juga bisa dijalankan saat build/deploy untuk mengisi cache di disk
+(Parquet hasil ingest, geometri peta):
+    python -m core.warmup
+"""
+import threading
+import time
+
+import streamlit as st
+
+from core.backend import backend_analisis, backend_interaktif
+from core.charts import bar_chart_analisis, line_chart_interaktif, trend_chart_analisis
+from core.filters import default_state, resolve
+from core.geo import DETAIL_DEFAULT, GEO_PATH, map_chart_analisis, prepared_geometry
+from core.instrument import enabled
+
+_lock = threading.Lock()
+_state = {"status": "belum mulai", "steps": [], "error": None, "total": 0}
+
+
+def _record(name, fn):
+    t0 = time.perf_counter()
+    fn()
+    with _lock:
+        _state["steps"].append({"step": name, "ms": round((time.perf_counter() - t0) * 1000, 1)})
+
+
+def _steps():
+    be2 = {}
+    be3 = {}
+
+    def load_interaktif():
+        be2["be"] = backend_interaktif()
+
+    def load_analisis():
+        be3["be"] = backend_analisis()
+
+    def build_cubes():
+        be2["be"].cube
+        be3["be"].cube
+
+    # Filter awal sesi, dijepit per dataset persis seperti di halaman
+    def default_aggregates():
+        be = be3["be"]
+        semua, tahun = resolve(be, default_state())
+        be.mean(semua, tahun)
+        be.year_means(semua, tahun)
+
+    def default_charts():
+        be = be2["be"]
+        semua, tahun = resolve(be, default_state())
+        line_chart_interaktif(be, be.schema.indikator[0], semua, tahun)
+        be = be3["be"]
+        semua, tahun = resolve(be, default_state())
+        col = be.schema.indikator[0]
+        bar_chart_analisis(be, semua, tahun, col)
+        trend_chart_analisis(be, semua, tahun, col)
+        geometri = prepared_geometry(GEO_PATH)
+        if geometri is not None:
+            map_chart_analisis(be, geometri, DETAIL_DEFAULT, semua, tahun, col)
+
+    def default_tables():
+        be = be2["be"]
+        semua, tahun = resolve(be, default_state())
+        be.table_page(
+            semua, tahun,
+            [be.schema.tahun, be.schema.indikator[0]], [True, False], "", 0, 25
+        )
+
+    return [
+        ("Muat dataset Data Interaktif", load_interaktif),
+        ("Muat dataset Analisis", load_analisis),
+        ("Bangun indeks & kubus", build_cubes),
+        ("Agregat filter default", default_aggregates),
+        ("Grafik filter default", default_charts),
+        ("Indeks urut tabel default", default_tables),
+    ]
+
+
+def run_warmup():
+    steps = _steps()
+    with _lock:
+        _state.update(status="berjalan", steps=[], error=None, total=len(steps))
+    try:
+        for name, fn in steps:
+            _record(name, fn)
+        status = "selesai"
+    except Exception as exc:  # warm-up tidak boleh menjatuhkan aplikasi
+        with _lock:
+            _state["error"] = f"{type(exc).__name__}: {exc}"
+        status = "gagal"
+    with _lock:
+        _state["status"] = status
+
+
+@st.cache_resource(show_spinner=False)
+def _warmup_thread():
+    thread = threading.Thread(target=run_warmup, name="kelompok1-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def start_warmup():
+    """Mulai warm-up sekali per proses; panggilan berikutnya tidak berbuat apa-apa."""
+    _warmup_thread()
+
+
+def status():
+    with _lock:
+        return {**_state, "steps": list(_state["steps"])}
+
+
+def render_status():
+    """Progres warm-up di sidebar (bersama instrumentasi)."""
+    if not enabled():
+        return
+    s = status()
+    with st.sidebar.expander(f"🔥 Warm-up Cache: {s['status']}"):
+        if s["total"]:
+            st.progress(len(s["steps"]) / s["total"])
+        for step in s["steps"]:
+            st.caption(f"✓ {step['step']} · {step['ms']:.0f} ms")
+        if s["error"]:
+            st.caption(f"⚠️ {s['error']}")
+
+
+if __name__ == "__main__":
+    run_warmup()
+    for step in status()["steps"]:
+        print(f"{step['step']}: {step['ms']:.0f} ms")
+    if status()["error"]:
+        print(f"Gagal: {status()['error']}")
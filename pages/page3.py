@@ -1,9 +1,25 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import json
 import os
-import altair as alt
+
+from core.analysis import cause_effect_table_cached, trend_narrative
+from core.backend import backend_analisis
+from core.bootstrap import N_RESAMPLE, confidence_table_job
+from core.charts import bar_chart_analisis, trend_chart_analisis
+from core.dataset import PATH_ANALISIS, render_quarantine
+from core.derived import derived_names, with_derived
+from core.export import FORMATS, build_export, export_path, export_url, filter_hash
+from core.filters import SessionBackend, resolve
+from core.geo import (
+    DETAIL_DEFAULT,
+    GEO_PATH,
+    TOLERANSI,
+    map_chart_analisis,
+    prepared_geometry,
+)
+from core.instrument import fragment, stage
+from core.stats import MODEL_FE, MODEL_POOLED, fit_panel_cached, pair_specs
+from core.table import paged_table
 
 
 
@@ -42,58 +58,28 @@ h2 { color: #0f766e; }
 # =====================================================
 # LOAD DATA
 # =====================================================
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_PATH = os.path.join(BASE_DIR, "Dataset_prakbigdata.xlsx")
-GEO_PATH = os.path.join(BASE_DIR, "indonesia_provinsi.json")
-
-df = pd.read_excel(DATA_PATH)
-
-# =====================================================
-# STANDARISASI KOLOM
-# =====================================================
-df.columns = (
-    df.columns
-    .str.strip()
-    .str.lower()
-    .str.replace(" ", "_")
-    .str.replace("(", "")
-    .str.replace(")", "")
-    .str.replace("%", "")
-)
+# Kolom sudah distandarisasi sekali saat dataset dimuat; filter dan
+# agregasi lewat backend query (pandas atau DuckDB, lihat KELOMPOK1_BACKEND)
+be = SessionBackend(backend_analisis())
 
-kol_prov = df.columns[0]
-kol_tahun = df.columns[1]
-indikator = df.columns[2:]
+kol_prov = be.schema.prov
+kol_tahun = be.schema.tahun
+indikator = list(be.schema.indikator)
 
 # =====================================================
 # SIDEBAR FILTER
 # =====================================================
 st.sidebar.header("🔍 Filter Data")
 
-provinsi_list = sorted(df[kol_prov].unique())
-
-provinsi = st.sidebar.multiselect(
-    "Pilih Provinsi",
-    provinsi_list,
-    default=provinsi_list
-)
-
-tahun = st.sidebar.slider(
-    "Rentang Tahun",
-    int(df[kol_tahun].min()),
-    int(df[kol_tahun].max()),
-    (int(df[kol_tahun].min()), int(df[kol_tahun].max()))
-)
+# Provinsi & tahun berasal dari filter bersama (sidebar app.py)
+provinsi, tahun = resolve(be)
 
+# Indikator turunan (YoY, MA-3, indeks) dihitung saat pertama dipilih
 indikator_pilihan = st.sidebar.selectbox(
     "Pilih Indikator",
-    indikator
+    indikator + derived_names(indikator)
 )
-
-filtered_df = df[
-    (df[kol_prov].isin(provinsi)) &
-    (df[kol_tahun].between(tahun[0], tahun[1]))
-]
+be_pilihan = with_derived(be, [indikator_pilihan])
 
 # =====================================================
 # TITLE
@@ -105,160 +91,310 @@ Halaman ini menyajikan **analisis interaktif** berbasis data pembangunan provins
 Seluruh grafik, peta, dan kesimpulan akan **berubah otomatis** sesuai filter.
 """)
 
+# Sel yang gagal divalidasi saat ingest ditampilkan, bukan diam-diam jadi NaN
+render_quarantine(PATH_ANALISIS, be.version)
+
+# Bagian yang punya widget sendiri adalah fragment: widget di dalamnya hanya
+# menjalankan ulang fragment tersebut, bukan seluruh halaman. Perubahan
+# filter sidebar tetap menjalankan ulang semuanya, tetapi hasil per filter
+# diambil dari cache sesi/proses.
+
+
 # =====================================================
 # METRIC RINGKASAN
 # =====================================================
-st.subheader("📌 Ringkasan Statistik")
+def section_ringkasan(provinsi, tahun):
+    st.subheader("📌 Ringkasan Statistik")
+
+    with stage("aggregate"):
+        mean_values = be.mean(provinsi, tahun)
+
+    cols = st.columns(4)
+    for i, col in enumerate(mean_values.index):
+        with cols[i % 4]:
+            st.markdown(
+                f"""
+                <div class="metric-box">
+                    <b>{col.replace('_',' ').upper()}</b><br>
+                    <h3>{mean_values[col]:.2f}</h3>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
 
-mean_values = filtered_df[indikator].mean()
-
-cols = st.columns(4)
-for i, col in enumerate(mean_values.index):
-    with cols[i % 4]:
-        st.markdown(
-            f"""
-            <div class="metric-box">
-                <b>{col.replace('_',' ').upper()}</b><br>
-                <h3>{mean_values[col]:.2f}</h3>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
 
 # =====================================================
 # BAR & LINE SIDE BY SIDE
 # =====================================================
-st.subheader("📊 Perbandingan & Tren Indikator")
+def section_grafik(provinsi, tahun, indikator_pilihan):
+    st.subheader("📊 Perbandingan & Tren Indikator")
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-# ---------- BAR ----------
-prov_df = (
-    filtered_df
-    .groupby(kol_prov)[indikator_pilihan]
-    .mean()
-    .reset_index()
-    .sort_values(by=indikator_pilihan)
-)
+    # Agregasi + pembuatan grafik dilewati bila filter sama sudah pernah dihitung
 
-bar_chart = alt.Chart(prov_df).mark_bar().encode(
-    y=alt.Y(f"{kol_prov}:N", title="Provinsi"),
-    x=alt.X(f"{indikator_pilihan}:Q", title="Rata-rata"),
-    color=alt.Color(f"{kol_prov}:N", legend=None),
-    tooltip=[kol_prov, indikator_pilihan]
-)
+    # ---------- BAR ----------
+    with stage("chart"):
+        bar_chart = bar_chart_analisis(be_pilihan, provinsi, tahun, indikator_pilihan)
 
-with col1:
-    st.altair_chart(bar_chart, use_container_width=True)
+    with col1:
+        st.vega_lite_chart(bar_chart, use_container_width=True)
 
-# ---------- LINE ----------
-trend_df = (
-    filtered_df
-    .groupby([kol_tahun, kol_prov])[indikator_pilihan]
-    .mean()
-    .reset_index()
-)
+    # ---------- LINE ----------
+    with stage("chart"):
+        line_chart = trend_chart_analisis(be_pilihan, provinsi, tahun, indikator_pilihan)
 
-line_chart = alt.Chart(trend_df).mark_line(point=True).encode(
-    x=alt.X(f"{kol_tahun}:O", title="Tahun"),
-    y=alt.Y(f"{indikator_pilihan}:Q", title="Nilai"),
-    color=alt.Color(f"{kol_prov}:N", title="Provinsi"),
-    tooltip=[kol_prov, kol_tahun, indikator_pilihan]
-)
+    with col2:
+        st.vega_lite_chart(line_chart, use_container_width=True)
 
-with col2:
-    st.altair_chart(line_chart, use_container_width=True)
+
+# =====================================================
+# PETA CHOROPLETH
+# =====================================================
+@fragment
+def section_peta(provinsi, tahun, indikator_pilihan):
+    st.subheader("🗺️ Peta Sebaran Indikator")
+
+    # Geometri disederhanakan sekali per file, di beberapa toleransi
+    geometri = prepared_geometry(GEO_PATH)
+    if geometri is None:
+        st.info(
+            f"Peta belum tersedia: file {os.path.basename(GEO_PATH)} tidak ditemukan."
+        )
+        return
+
+    detail = st.radio(
+        "Detail Peta",
+        list(TOLERANSI),
+        index=list(TOLERANSI).index(DETAIL_DEFAULT),
+        horizontal=True
+    )
+
+    with stage("chart"):
+        peta = map_chart_analisis(
+            be_pilihan, geometri, detail, provinsi, tahun, indikator_pilihan
+        )
+
+    st.vega_lite_chart(peta, use_container_width=True)
 
 
 # =====================================================
 # ANALISIS PARAGRAF OTOMATIS
 # =====================================================
-st.subheader("🧠 Analisis Data")
-
-analisis = []
-for col in indikator:
-    tren = filtered_df.groupby(kol_tahun)[col].mean()
-    if len(tren) > 1:
-        arah = "meningkat 📈" if tren.iloc[-1] > tren.iloc[0] else "menurun 📉"
-        analisis.append(
-            f"Rata-rata {col.replace('_',' ').upper()} sebesar {mean_values[col]:.2f} "
-            f"dan secara umum {arah} selama periode pengamatan."
+def section_analisis(provinsi, tahun):
+    st.subheader("🧠 Analisis Data")
+
+    with stage("aggregate"):
+        analisis = trend_narrative(
+            be.mean(provinsi, tahun),
+            be.year_means(provinsi, tahun)
         )
 
-st.markdown(
-    "<div class='highlight'>" + " ".join(analisis) + "</div>",
-    unsafe_allow_html=True
-)
+    st.markdown(
+        "<div class='highlight'>" + " ".join(analisis) + "</div>",
+        unsafe_allow_html=True
+    )
+
 
 # =====================================================
 # DOWNLOAD DATA
 # =====================================================
-st.subheader("📥 Unduh Data")
-
-csv = filtered_df.to_csv(index=False).encode("utf-8")
+@fragment
+def section_unduh(provinsi, tahun):
+    st.subheader("📥 Unduh Data")
+
+    # File hanya dibuat saat diminta, satu kali per state filter & format
+    fmt = st.radio("Format", list(FORMATS), horizontal=True)
+    key = filter_hash(be.version, provinsi, tahun)
+    path = export_path(key, fmt)
+    ext, mime = FORMATS[fmt]
+    static = st.get_option("server.enableStaticServing")
+
+    # Tanpa static serving, tombol download hanya dibuat pada run setelah
+    # "Siapkan File" diklik: st.download_button membaca seluruh file ke memori
+    if not (static and os.path.exists(path)):
+        if not st.button(f"Siapkan File {fmt}"):
+            return
+        with st.spinner("Menyiapkan file..."), stage("export"):
+            path = build_export(be.filter(provinsi, tahun), key, fmt)
+
+    nama = f"data_page3_terfilter.{ext}"
+    if static:
+        # Tautan ke file statis: rerun tidak membaca atau mendaftarkan payload
+        st.markdown(
+            f'<a href="{export_url(key, fmt)}" download="{nama}">'
+            f"📥 Download Data Terfilter ({fmt})</a>",
+            unsafe_allow_html=True
+        )
+        return
+
+    with open(path, "rb") as f:
+        st.download_button(
+            f"Download Data Terfilter ({fmt})",
+            f,
+            nama,
+            mime,
+            on_click="ignore"
+        )
 
-st.download_button(
-    "Download Data Terfilter (CSV)",
-    csv,
-    "data_page3_terfilter.csv",
-    "text/csv"
-)
 
 # =====================================================
 # PREVIEW
 # =====================================================
-with st.expander("📋 Lihat Data Terfilter"):
-    st.dataframe(filtered_df)
+@fragment
+def section_preview(provinsi, tahun):
+    with st.expander("📋 Lihat Data Terfilter"):
+        paged_table(be, provinsi, tahun, key="tabel_analisis")
+
 
 # =====================================================
 # FILTER & ANALISIS SEBAB-AKIBAT INTERAKTIF
 # =====================================================
-st.subheader("🧩 Analisis Sebab-Akibat (Tabel Interaktif)")
-
-# Sidebar filter khusus sebab-akibat
-st.sidebar.markdown("### 🔹 Filter Sebab-Akibat")
-indikator_sebab = st.sidebar.multiselect(
-    "Pilih Indikator Penyebab",
-    indikator,
-    default=indikator
-)
+@fragment
+def section_sebab_akibat(provinsi, tahun):
+    st.subheader("🧩 Analisis Sebab-Akibat (Tabel Interaktif)")
+
+    # Filter khusus sebab-akibat berada di dalam fragment (bukan sidebar)
+    # agar perubahannya hanya menghitung ulang tabel ini
+    st.markdown("#### 🔹 Filter Sebab-Akibat")
+    kiri, kanan = st.columns(2)
+    with kiri:
+        indikator_sebab = st.multiselect(
+            "Pilih Indikator Penyebab",
+            indikator,
+            default=indikator
+        )
+    with kanan:
+        indikator_dampak = st.multiselect(
+            "Pilih Indikator Dampak",
+            indikator,
+            default=indikator
+        )
+
+    metode_korelasi = st.radio(
+        "Metode Korelasi",
+        ["Pearson", "Spearman"],
+        horizontal=True
+    )
+    tampilkan_ci = st.checkbox(
+        f"Tampilkan interval kepercayaan 95% (bootstrap {N_RESAMPLE:,} resample provinsi)"
+    )
+
+    # Semua pasangan dihitung sekaligus dari matriks rata-rata tahunan
+    with stage("aggregate"):
+        df_sebab_akibat = cause_effect_table_cached(
+            be.version,
+            tuple(provinsi),
+            tuple(tahun),
+            tuple(indikator_sebab),
+            tuple(indikator_dampak),
+            metode_korelasi.lower(),
+            _be=be
+        )
+
+    # Bootstrap berjalan di latar belakang: tabel tampil dulu tanpa CI,
+    # lalu halaman dimuat ulang setelah job selesai
+    if tampilkan_ci and not df_sebab_akibat.empty:
+        job = (
+            be.version,
+            tuple(provinsi),
+            tuple(tahun),
+            tuple(indikator_sebab),
+            tuple(indikator_dampak),
+            metode_korelasi.lower(),
+            N_RESAMPLE,
+        )
+        df_ci = confidence_table_job(*job, _be=be)
+        if df_ci is None:
+            st.info("⏳ Interval kepercayaan sedang dihitung; tabel akan diperbarui otomatis.")
+            tunggu_bootstrap(job, be)
+        else:
+            df_sebab_akibat = pd.concat([df_sebab_akibat, df_ci], axis=1)
+
+    # Tampilkan tabel
+    if not df_sebab_akibat.empty:
+        with stage("table"):
+            st.dataframe(df_sebab_akibat)
+    else:
+        st.write("Tidak ada data untuk kombinasi indikator yang dipilih.")
+
+
+@st.fragment(run_every=1.0)
+def tunggu_bootstrap(job, be):
+    # Polling ringan tanpa widget; dibiarkan di luar instrumentasi agar
+    # tidak mencatat satu record per detik. Rerun penuh setelah selesai
+    # (scope="fragment" hanya menjalankan ulang poller ini sendiri).
+    if confidence_table_job(*job, _be=be) is not None:
+        st.rerun()
 
-indikator_dampak = st.sidebar.multiselect(
-    "Pilih Indikator Dampak",
-    indikator,
-    default=indikator
-)
 
-# Buat list untuk menampung hasil
-sebab_akibat_data = []
-
-for col1 in indikator_sebab:
-    tren1 = filtered_df.groupby(kol_tahun)[col1].mean()
-    if len(tren1) < 2:
-        continue
-    arah1 = "Meningkat 📈" if tren1.iloc[-1] > tren1.iloc[0] else "Menurun 📉"
-    
-    for col2 in indikator_dampak:
-        if col1 == col2:
-            continue  # jangan bandingkan dengan dirinya sendiri
-        tren2 = filtered_df.groupby(kol_tahun)[col2].mean()
-        if len(tren2) < 2:
-            continue
-        arah2 = "Meningkat 📈" if tren2.iloc[-1] > tren2.iloc[0] else "Menurun 📉"
-
-        pengaruh = "Positif ✅" if arah1 == arah2 else "Negatif ❌"
-
-        sebab_akibat_data.append({
-            "Indikator Penyebab": col1.replace("_"," ").title(),
-            "Indikator Dampak": col2.replace("_"," ").title(),
-            "Arah Penyebab": arah1,
-            "Arah Dampak": arah2,
-            "Pengaruh": pengaruh
-        })
-
-# Tampilkan tabel
-if sebab_akibat_data:
-    df_sebab_akibat = pd.DataFrame(sebab_akibat_data)
-    st.dataframe(df_sebab_akibat)
-else:
-    st.write("Tidak ada data untuk kombinasi indikator yang dipilih.")
+# =====================================================
+# REGRESI PANEL
+# =====================================================
+@fragment
+def section_regresi(provinsi, tahun):
+    st.subheader("📐 Regresi Panel")
+
+    mode = st.radio(
+        "Spesifikasi",
+        ["Bivariat (satu regresor per model)", "Multivariat (semua regresor)", "Semua pasangan indikator"],
+        horizontal=True
+    )
+    model = st.radio(
+        "Model",
+        ["Pooled OLS", "Efek Tetap Provinsi"],
+        horizontal=True
+    )
+
+    if mode == "Semua pasangan indikator":
+        specs = pair_specs(indikator, indikator)
+    else:
+        kiri, kanan = st.columns(2)
+        with kiri:
+            dependen = st.selectbox(
+                "Variabel Dependen",
+                indikator,
+                index=indikator.index("e_growth") if "e_growth" in indikator else 0
+            )
+        with kanan:
+            lainnya = [c for c in indikator if c != dependen]
+            regresor = st.multiselect("Regresor", lainnya, default=lainnya)
+        if mode.startswith("Bivariat"):
+            specs = pair_specs([dependen], regresor)
+        else:
+            specs = [(dependen, tuple(regresor))] if regresor else []
+
+    # Semua model dengan jumlah regresor sama diestimasi dalam satu batch
+    with stage("aggregate"):
+        hasil = fit_panel_cached(
+            be.version,
+            tuple(provinsi),
+            tuple(tahun),
+            tuple(specs),
+            MODEL_FE if model == "Efek Tetap Provinsi" else MODEL_POOLED,
+            _be=be
+        )
+
+    if hasil.empty:
+        st.write("Tidak ada model untuk kombinasi indikator yang dipilih.")
+        return
+
+    with stage("table"):
+        st.dataframe(
+            hasil.round({"Koefisien": 4, "Std. Error": 4, "t": 2, "R²": 3}),
+            hide_index=True
+        )
+    st.caption(
+        "R² pada model efek tetap adalah R² *within* (variasi di dalam provinsi). "
+        "Baris dengan nilai kosong dibuang per model."
+    )
+
+
+section_ringkasan(provinsi, tahun)
+section_grafik(provinsi, tahun, indikator_pilihan)
+section_peta(provinsi, tahun, indikator_pilihan)
+section_analisis(provinsi, tahun)
+section_unduh(provinsi, tahun)
+section_preview(provinsi, tahun)
+section_sebab_akibat(provinsi, tahun)
+section_regresi(provinsi, tahun)
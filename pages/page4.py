@@ -58,5 +58,23 @@ st.image(
 
 st.write("Klik tombol **Unduh** dan pilih format file yang diinginkan.")
 
+# =========================
+# MENGGABUNGKAN BANYAK FILE
+# =========================
+st.subheader("4️⃣ Menggabungkan Banyak File Unduhan")
+st.write(
+    "Simpan semua file unduhan (xlsx/csv, satu indikator per file) dalam satu "
+    "folder, lalu gabungkan sekaligus tanpa menyalin manual ke Dataset.xlsx:"
+)
+st.code(
+    "python -m core.bps_ingest folder_unduhan/ --output data/bps_gabungan.parquet",
+    language="bash"
+)
+st.write(
+    "Nama provinsi dan nama indikator diseragamkan otomatis. Jalankan dashboard "
+    "dengan `KELOMPOK1_DATA_ANALISIS=data/bps_gabungan.parquet` untuk memakai "
+    "hasil gabungan di halaman Analisis."
+)
+
 st.markdown("---")
 st.success("Dataset BPS siap digunakan untuk analisis.")
@@ -0,0 +1,74 @@
+import streamlit as st
+
+from core.backend import backend_analisis, backend_interaktif
+from core.cache import invalidate, registry_stats
+from core.filters import session_stats
+
+KEY_PESAN = "_cache_pesan"
+
+# =========================
+# STATISTIK CACHE
+# =========================
+st.title("🧰 Statistik & Pengelolaan Cache")
+
+st.write(
+    "Cache **resource** menyimpan objek per versi data (dataset, kubus, "
+    "indeks urut) dan dibagi semua sesi. Cache **hasil** menyimpan hasil per "
+    "filter dengan batas entri dan TTL sehingga memori tetap datar."
+)
+
+tabel = registry_stats()
+if tabel.empty:
+    st.info("Belum ada cache yang terdaftar.")
+else:
+    total_kb = tabel["KB"].sum()
+    st.caption(f"{len(tabel)} cache · perkiraan total {total_kb / 1024:.1f} MB")
+    st.dataframe(
+        tabel.style.format({"Hit rate": "{:.0%}", "KB": "{:.1f}"}),
+        hide_index=True,
+        use_container_width=True
+    )
+
+sesi = session_stats()
+st.caption(
+    f"Hasil filter sesi ini — Hit: {sesi['hits']} · Miss: {sesi['misses']} · "
+    f"Hit rate: {sesi['hit_rate']:.0%} · Entri: {sesi['entries']}"
+)
+
+# =========================
+# INVALIDASI SELEKTIF
+# =========================
+st.subheader("🧹 Kosongkan Cache")
+
+nama = list(tabel["Cache"]) if not tabel.empty else []
+pilihan = st.multiselect("Cache", nama, default=[])
+
+versi = {
+    f"Data Interaktif ({backend_interaktif().version})": backend_interaktif().version,
+    f"Analisis ({backend_analisis().version})": backend_analisis().version,
+}
+lingkup = st.radio(
+    "Lingkup",
+    ["Semua entri"] + list(versi),
+    horizontal=True,
+    help=(
+        "Pilih versi data untuk hanya menghapus hasil per filter milik versi itu. "
+        "Cache resource tidak bisa dikosongkan per versi dan akan dilewati."
+    )
+)
+
+if st.button("Kosongkan", disabled=not pilihan):
+    dikosongkan = invalidate(pilihan, version=versi.get(lingkup))
+    # Pesan disimpan agar tetap tampil setelah rerun (statistik diperbarui)
+    st.session_state[KEY_PESAN] = (
+        dikosongkan, [n for n in pilihan if n not in dikosongkan]
+    )
+    st.rerun()
+
+pesan = st.session_state.pop(KEY_PESAN, None)
+if pesan:
+    dikosongkan, dilewati = pesan
+    if dikosongkan:
+        st.success(f"Cache dikosongkan: {', '.join(dikosongkan)}")
+    if dilewati:
+        st.warning(f"Tidak didukung per versi (tidak dikosongkan): {', '.join(dilewati)}")
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Halaman dan dataset dirujuk relatif terhadap root repo, seperti `streamlit run app.py`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
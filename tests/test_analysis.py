@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.analysis import pairwise_corr, pairwise_slope, pairwise_stats
+
+
+def _panel(seed, shape=(12, 6), kosong=0.3):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=shape)
+    X[..., 2] = np.round(X[..., 2])          # ranking dengan nilai kembar
+    X[rng.random(shape) < kosong] = np.nan
+    return X
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+@pytest.mark.parametrize("seed", range(5))
+def test_pairwise_corr_sama_dengan_pandas(method, seed):
+    X = _panel(seed)
+    ref = pd.DataFrame(X).corr(method).to_numpy()
+    np.testing.assert_allclose(pairwise_corr(X, method), ref, atol=1e-10)
+
+
+def test_pairwise_corr_batch():
+    B = _panel(7, shape=(4, 10, 5))
+    r = pairwise_corr(B, "spearman")
+    for k in range(len(B)):
+        ref = pd.DataFrame(B[k]).corr("spearman").to_numpy()
+        np.testing.assert_allclose(r[k], ref, atol=1e-10)
+
+
+def test_pairwise_slope_sama_dengan_polyfit():
+    X = _panel(3)
+    b = pairwise_slope(X)
+    for i in range(X.shape[1]):
+        for j in range(X.shape[1]):
+            ok = ~np.isnan(X[:, i]) & ~np.isnan(X[:, j])
+            ref = np.polyfit(X[ok, i], X[ok, j], 1)[0]
+            assert b[i, j] == pytest.approx(ref, abs=1e-9)
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+@pytest.mark.parametrize("kembar", [True, False])
+def test_jalur_data_lengkap_sama_dengan_pandas(method, kembar):
+    X = _panel(11, kosong=0.0)
+    if not kembar:
+        X[:, 2] += np.arange(len(X)) * 1e-3
+    r, b = pairwise_stats(X, method)
+    np.testing.assert_allclose(r, pd.DataFrame(X).corr(method).to_numpy(), atol=1e-10)
+    C = np.cov(X, rowvar=False)
+    np.testing.assert_allclose(b, C / np.diag(C)[:, None], atol=1e-10)
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_batch_campuran_dan_pasangan(method):
+    # Batch berisi matriks lengkap dan ber-NaN: tiap matriks memakai
+    # jalurnya sendiri, hasilnya tetap sama dengan pandas
+    B = np.stack([_panel(s, kosong=0.0 if s % 2 else 0.3) for s in range(6)])
+    I, J = np.array([0, 2, 4, 5]), np.array([1, 0, 2, 3])
+    r, b = pairwise_stats(B, method, pairs=(I, J))
+    assert r.shape == b.shape == (6, 4)
+    for k in range(len(B)):
+        ref = pd.DataFrame(B[k]).corr(method).to_numpy()
+        np.testing.assert_allclose(r[k], ref[I, J], atol=1e-10)
+        np.testing.assert_allclose(b[k], pairwise_slope(B[k])[I, J], atol=1e-10)
@@ -0,0 +1,105 @@
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pyarrow as pa
+import pytest
+
+from core import api
+from core.api import ARROW, ApiError, handle
+from core.backend import backend_analisis, backend_interaktif
+
+
+def _get(path, query="", **kwargs):
+    return handle(path, parse_qs(query), **kwargs)
+
+
+def test_rows_json_ringkas():
+    status, _, body = _get("/api/interaktif/rows", "provinsi=aceh&tahun=2023-2024&kolom=IPM")
+    assert status == HTTPStatus.OK
+    data = json.loads(body)
+    assert data["columns"] == ["Provinsi", "Tahun", "IPM"]
+    assert [row[2] for row in data["data"]] == [73.4, 74.03]
+
+
+def test_agg_presisi_penuh():
+    be = backend_analisis()
+    _, _, body = _get("/api/analisis/agg", "kolom=ipm,pdrb_kapita&tahun=2020")
+    data = json.loads(body)
+    ref = be.mean(be.provinces, (2020, 2020), ["ipm", "pdrb_kapita"])
+    assert data["data"][0] == pytest.approx(ref.tolist(), rel=1e-14)
+
+
+def test_rows_arrow():
+    _, header, body = _get("/api/interaktif/rows", "tahun=2024", accept=ARROW)
+    assert header["Content-Type"] == ARROW
+    table = pa.ipc.open_stream(io.BytesIO(body)).read_all()
+    assert table.num_rows == len(backend_interaktif().provinces)
+    assert table.schema.field("IPM").type == pa.float32()
+
+
+def test_etag_menghasilkan_304():
+    path, query = "/api/analisis/agg", "by=provinsi&kolom=ipm"
+    _, header, _ = _get(path, query)
+    status, _, body = _get(path, query, if_none_match=header["ETag"])
+    assert status == HTTPStatus.NOT_MODIFIED and body == b""
+
+
+@pytest.mark.parametrize("path, query, status", [
+    ("/api/x", "", HTTPStatus.NOT_FOUND),
+    ("/api/analisis/agg", "kolom=xx", HTTPStatus.BAD_REQUEST),
+    ("/api/analisis/agg", "tahun=abc", HTTPStatus.BAD_REQUEST),
+])
+def test_galat(path, query, status):
+    with pytest.raises(ApiError) as err:
+        _get(path, query)
+    assert err.value.status == status
+
+
+def test_cache_api_dikosongkan_per_versi():
+    from core.cache import invalidate, result_cache
+
+    cache = result_cache("api")
+    cache.clear()
+    _get("/api/interaktif/rows", "tahun=2024")
+    assert cache.stats()["entries"] == 1
+    assert invalidate(["api"], version="versi-lain") == ["api"]
+    assert cache.stats()["entries"] == 1
+    invalidate(["api"], version=backend_interaktif().version)
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), api.Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_handler_galat_tak_terduga_jadi_json_500(server, monkeypatch, caplog):
+    def rusak(*args, **kwargs):
+        raise RuntimeError("rahasia internal")
+
+    monkeypatch.setattr(api, "handle", rusak)
+    with caplog.at_level("ERROR", logger="kelompok1.api"):
+        with pytest.raises(urllib.error.HTTPError) as err:
+            urllib.request.urlopen(f"{server}/api/interaktif/rows")
+    assert err.value.code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert err.value.headers["Content-Type"] == "application/json"
+    body = json.loads(err.value.read())
+    assert "error" in body and "rahasia" not in body["error"]
+    assert any(r.exc_info and "rahasia internal" in str(r.exc_info[1]) for r in caplog.records)
+
+
+def test_handler_galat_api_tetap_4xx(server):
+    with pytest.raises(urllib.error.HTTPError) as err:
+        urllib.request.urlopen(f"{server}/api/tidak-ada/rows")
+    assert err.value.code == HTTPStatus.NOT_FOUND
+    assert "endpoint tidak dikenal" in json.loads(err.value.read())["error"]
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backend import DuckDBBackend, PandasBackend
+from core.dataset import PATH_ANALISIS, PATH_INTERAKTIF, dataset_analisis, dataset_interaktif
+
+pytest.importorskip("duckdb")
+
+# Data pandas disimpan float32 (profil "ringkas"), DuckDB menghitung dalam double
+RTOL = 1e-5
+
+
+@pytest.fixture(scope="module", params=["interaktif", "analisis"])
+def backends(request):
+    if request.param == "interaktif":
+        return (
+            PandasBackend(dataset_interaktif()),
+            DuckDBBackend(PATH_INTERAKTIF, standardize=False, title_case=True),
+        )
+    return (
+        PandasBackend(dataset_analisis()),
+        DuckDBBackend(PATH_ANALISIS, standardize=True, title_case=False),
+    )
+
+
+def _filters(be, n=8, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        k = int(rng.integers(1, len(be.provinces) + 1))
+        provinsi = sorted(rng.choice(be.provinces, k, replace=False).tolist())
+        awal, akhir = sorted(rng.integers(be.year_min, be.year_max + 1, 2).tolist())
+        yield provinsi, (awal, akhir)
+
+
+def _frame(df, schema):
+    # Samakan tipe (kategori/int16/float32 vs string/int/double) sebelum dibandingkan
+    out = df.reset_index(drop=True)
+    return out.astype({
+        c: str if c == schema.prov else np.int64 if c == schema.tahun else np.float64
+        for c in out.columns
+    })
+
+
+def test_metadata_sama(backends):
+    pd_be, db_be = backends
+    assert pd_be.schema == db_be.schema
+    assert list(pd_be.provinces) == list(db_be.provinces)
+    assert (pd_be.year_min, pd_be.year_max) == (db_be.year_min, db_be.year_max)
+
+
+def test_filter_dan_agregat_sama(backends):
+    pd_be, db_be = backends
+    schema = pd_be.schema
+    col = schema.indikator[0]
+    for provinsi, tahun in _filters(pd_be):
+        pd.testing.assert_frame_equal(
+            _frame(pd_be.filter(provinsi, tahun), schema),
+            _frame(db_be.filter(provinsi, tahun), schema),
+            rtol=RTOL,
+        )
+        np.testing.assert_allclose(
+            pd_be.mean(provinsi, tahun), db_be.mean(provinsi, tahun), rtol=RTOL
+        )
+        pd.testing.assert_frame_equal(
+            _frame(pd_be.prov_means(provinsi, tahun, col), schema),
+            _frame(db_be.prov_means(provinsi, tahun, col), schema),
+            rtol=RTOL,
+        )
+        pd.testing.assert_frame_equal(
+            _frame(pd_be.year_prov_means(provinsi, tahun, col), schema),
+            _frame(db_be.year_prov_means(provinsi, tahun, col), schema),
+            rtol=RTOL,
+        )
+        pd.testing.assert_frame_equal(
+            pd_be.year_means(provinsi, tahun),
+            db_be.year_means(provinsi, tahun),
+            rtol=RTOL, check_index_type=False, check_dtype=False,
+        )
+
+
+def test_halaman_tabel_sama(backends):
+    pd_be, db_be = backends
+    schema = pd_be.schema
+    by = [schema.indikator[-1], schema.tahun]
+    for provinsi, tahun in _filters(pd_be, n=4, seed=1):
+        for ascending in ([True, False], [False, True]):
+            a, n_a = pd_be.table_page(provinsi, tahun, by, ascending, "", 3, 10)
+            b, n_b = db_be.table_page(provinsi, tahun, by, ascending, "", 3, 10)
+            assert n_a == n_b
+            pd.testing.assert_frame_equal(_frame(a, schema), _frame(b, schema), rtol=RTOL)
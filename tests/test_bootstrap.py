@@ -0,0 +1,98 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import bootstrap
+
+
+def _cube(P=12, Y=8, K=5, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(P, Y, K)), np.ones((P, Y, K))
+
+
+def test_potongan_mengikuti_anggaran_memori(monkeypatch):
+    monkeypatch.setattr(bootstrap, "MEM_BUDGET", 64 * 2**20)
+    monkeypatch.setattr(bootstrap, "WORKERS", 4)
+    for Y, K, method in [(10, 11, "pearson"), (20, 100, "pearson"), (20, 100, "spearman")]:
+        n = bootstrap.chunk_size(Y, K, method)
+        assert 1 <= n <= bootstrap.CHUNK
+        if n > 1:
+            assert n * bootstrap.WORKERS * bootstrap._bytes_per_resample(Y, K, method) <= 64 * 2**20
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_kolom_di_luar_pasangan_tidak_mengubah_hasil(method):
+    sums, counts = _cube()
+    I, J = np.array([0, 3]), np.array([3, 1])
+    r, b = bootstrap.bootstrap_pairs(sums, counts, I, J, method, 300)
+    kolom = [0, 1, 3]
+    r2, b2 = bootstrap.bootstrap_pairs(
+        sums[..., kolom], counts[..., kolom], np.array([0, 2]), np.array([2, 1]), method, 300
+    )
+    np.testing.assert_array_equal(r, r2)
+    np.testing.assert_array_equal(b, b2)
+
+
+# Batas 10.000 resample semua pasangan di ukuran target, satu core (detik)
+BATAS_DETIK = 15
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_waktu_100_indikator(method, monkeypatch):
+    # 34 provinsi × 20 tahun × 100 indikator, 9.900 pasangan; 1.000 resample
+    # diukur serial lalu diekstrapolasi ke N_RESAMPLE
+    monkeypatch.setattr(bootstrap, "WORKERS", 1)
+    sums, counts = _cube(P=34, Y=20, K=100)
+    I, J = np.nonzero(~np.eye(100, dtype=bool))
+    bootstrap.bootstrap_pairs(sums, counts, I, J, method, 20)
+    mulai = time.perf_counter()
+    r, _ = bootstrap.bootstrap_pairs(sums, counts, I, J, method, 1000)
+    detik = (time.perf_counter() - mulai) * bootstrap.N_RESAMPLE / 1000
+    assert r.shape == (1000, len(I))
+    assert detik < BATAS_DETIK, f"{detik:.1f} detik per {bootstrap.N_RESAMPLE:,} resample"
+
+
+def test_pool_spawn_sama_dengan_serial(monkeypatch):
+    sums, counts = _cube()
+    I, J = np.array([0, 3, 4]), np.array([3, 1, 2])
+    serial = bootstrap.bootstrap_pairs(sums, counts, I, J, "pearson", 1200)
+    monkeypatch.setattr(bootstrap, "WORKERS", 2)
+    monkeypatch.setattr(bootstrap, "PARALLEL_MIN", 0)
+    bootstrap._pool.clear()
+    try:
+        assert bootstrap._pool()._mp_context.get_start_method() == "spawn"
+        paralel = bootstrap.bootstrap_pairs(sums, counts, I, J, "pearson", 1200)
+    finally:
+        bootstrap._pool().shutdown()
+        bootstrap._pool.clear()
+    np.testing.assert_array_equal(serial[0], paralel[0])
+    np.testing.assert_array_equal(serial[1], paralel[1])
+
+
+def test_job_latar_belakang(monkeypatch):
+    lepas = threading.Event()
+    panggilan = []
+
+    def lambat(*args, _be):
+        panggilan.append(args)
+        lepas.wait(5)
+        return pd.DataFrame({"CI": [1]})
+
+    monkeypatch.setattr(bootstrap, "confidence_table_cached", lambat)
+    monkeypatch.setattr(bootstrap, "TUNGGU_CACHE", 0.01)
+    bootstrap._jobs.clear()
+    args = (1, ("Aceh",), (2020,), ("a",), ("b",), "pearson", 100)
+
+    # Selama job berjalan: None, dan pemanggilan ulang tidak membuat job baru
+    assert bootstrap.confidence_table_job(*args, _be=None) is None
+    assert bootstrap.confidence_table_job(*args, _be=None) is None
+    lepas.set()
+    bootstrap._jobs()[0].shutdown(wait=True)
+    hasil = bootstrap.confidence_table_job(*args, _be=None)
+    assert hasil["CI"].tolist() == [1]
+    assert panggilan == [args]
+    assert bootstrap._jobs()[1] == {}
+    bootstrap._jobs.clear()
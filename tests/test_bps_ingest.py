@@ -0,0 +1,66 @@
+import os
+
+import pandas as pd
+import pytest
+
+from core.bps_ingest import ingest_directory, parse_file
+from core.dataset import province_key
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "bps")
+XLSX = os.path.join(FIXTURES, "Gini_Ratio.xlsx")
+CSV = os.path.join(FIXTURES, "Persentase_Penduduk_Miskin.csv")
+
+
+def _tabel(rows, kolom):
+    return pd.DataFrame(rows, columns=["provinsi", "tahun", kolom])
+
+
+def test_xlsx_lebar_menjadi_panjang():
+    # Judul, baris kosong, INDONESIA, catatan kaki dan sel "-"/"…" dibuang;
+    # desimal koma dan tanda catatan kaki "¹" dikoersi
+    pd.testing.assert_frame_equal(parse_file(XLSX), _tabel([
+        ("ACEH", 2021, 0.324), ("ACEH", 2022, 0.311), ("ACEH", 2023, 0.296),
+        ("DI YOGYAKARTA", 2021, 0.436), ("DI YOGYAKARTA", 2022, 0.459),
+        ("DI YOGYAKARTA", 2023, 0.449),
+        ("KEPULAUAN BANGKA BELITUNG", 2021, 0.247), ("KEPULAUAN BANGKA BELITUNG", 2023, 0.245),
+        ("PAPUA", 2021, 0.396), ("PAPUA", 2022, 0.399),
+    ], "gini_ratio"))
+
+
+def test_csv_titik_koma():
+    pd.testing.assert_frame_equal(parse_file(CSV), _tabel([
+        ("ACEH", 2022, 14.64), ("ACEH", 2023, 14.45),
+        ("DKI JAKARTA", 2022, 4.61), ("DKI JAKARTA", 2023, 4.44),
+        ("PAPUA", 2022, 26.56),
+    ], "persentase_penduduk_miskin"))
+
+
+@pytest.mark.parametrize("path, nama", [
+    (XLSX, "gini_ratio_menurut_provinsi_dan_daerah"),
+    (CSV, "persentase_penduduk_miskin_persen"),
+])
+def test_nama_indikator_dari_judul(path, nama):
+    assert parse_file(path, name_from="title").columns[-1] == nama
+
+
+@pytest.mark.parametrize("ejaan, kunci", [
+    ("Aceh", "ACEH"),
+    ("Nanggroe Aceh Darussalam", "ACEH"),
+    ("D.I. Yogyakarta", "DI YOGYAKARTA"),
+    ("DI Yogyakarta", "DI YOGYAKARTA"),
+    ("D.K.I. Jakarta", "DKI JAKARTA"),
+    ("Kep. Bangka Belitung", "KEPULAUAN BANGKA BELITUNG"),
+    ("Provinsi Papua Barat", "PAPUA BARAT"),
+])
+def test_province_key(ejaan, kunci):
+    assert province_key(ejaan) == kunci
+
+
+def test_gabung_folder_tanpa_dataset_dasar():
+    paths, merged = ingest_directory(FIXTURES, base=None, workers=1)
+    assert [os.path.basename(p) for p in paths] == [
+        "Gini_Ratio.xlsx", "Persentase_Penduduk_Miskin.csv"
+    ]
+    assert list(merged.columns) == ["provinsi", "tahun", "gini_ratio", "persentase_penduduk_miskin"]
+    aceh = merged.set_index(["provinsi", "tahun"]).loc[("ACEH", 2022)]
+    assert aceh.tolist() == [0.311, 14.64]
@@ -0,0 +1,50 @@
+import pytest
+
+from core import cache
+
+
+@pytest.fixture
+def registri(monkeypatch):
+    monkeypatch.setitem(cache.POLICY, "uji_hasil", (cache.HASIL, 8, None, "uji"))
+    monkeypatch.setitem(cache.POLICY, "uji_resource", (cache.RESOURCE, 8, None, "uji"))
+    monkeypatch.setattr(cache, "_registry", {})
+    dibangun = []
+
+    @cache.cached_result("uji_hasil")
+    def hasil(version, x):
+        return (version, x)
+
+    @cache.cached_resource("uji_resource")
+    def resource(version):
+        dibangun.append(version)
+        return [version]
+
+    yield hasil, resource, dibangun
+    resource.clear()
+
+
+def test_clear_per_versi_hanya_versi_itu(registri):
+    hasil, _, _ = registri
+    for v in ("v1", "v2"):
+        hasil(v, 1)
+        hasil(v, 2)
+    cache.result_cache("uji_hasil").clear("v1")
+    assert cache.result_cache("uji_hasil").stats()["entries"] == 2
+
+
+def test_invalidate_melewati_resource_per_versi(registri):
+    hasil, resource, dibangun = registri
+    hasil("v1", 1)
+    resource("v1")
+
+    # Per versi: cache resource tidak bisa, jadi dilewati dan tidak dilaporkan
+    assert cache.invalidate(["uji_hasil", "uji_resource"], version="v1") == ["uji_hasil"]
+    resource("v1")
+    assert dibangun == ["v1"]
+    with pytest.raises(ValueError):
+        cache._registry["uji_resource"].clear("v1")
+
+    # Semua entri: keduanya dikosongkan
+    assert set(cache.invalidate(["uji_hasil", "uji_resource"])) == {"uji_hasil", "uji_resource"}
+    resource("v1")
+    assert dibangun == ["v1", "v1"]
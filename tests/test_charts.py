@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from core.charts import GL_SERIES, lttb, plotly_line_spec
+
+
+def test_lttb_titik_ujung_dan_jumlah():
+    rng = np.random.default_rng(0)
+    x = np.arange(1000.0)
+    y = np.cumsum(rng.normal(size=1000))
+    idx = lttb(x, y, 100)
+    assert len(idx) == 100
+    assert idx[0] == 0 and idx[-1] == 999
+    assert (np.diff(idx) > 0).all()
+
+
+def test_lttb_mempertahankan_puncak():
+    x = np.arange(500.0)
+    y = np.zeros(500)
+    y[237] = 10.0
+    assert 237 in lttb(x, y, 50)
+
+
+def test_lttb_tanpa_downsampling():
+    np.testing.assert_array_equal(lttb(np.arange(10.0), np.arange(10.0), 20), np.arange(10))
+
+
+def test_grafik_webgl_untuk_banyak_seri():
+    n = GL_SERIES + 1
+    df = pd.DataFrame({
+        "Provinsi": np.repeat([f"P{i}" for i in range(n)], 5),
+        "Tahun": np.tile(np.arange(2019, 2024), n),
+        "IPM": np.arange(n * 5, dtype=float),
+    })
+    spec = plotly_line_spec(df, "IPM", (2019, 2023))
+    assert {t["type"] for t in spec["data"]} == {"scattergl"}
+    assert len(spec["data"]) == n
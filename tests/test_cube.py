@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.cube import Cube
+
+KOLOM = ["IPM", "AHH", "TPT"]
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    # Beberapa baris per (provinsi, tahun), sebagian tahun kosong, NaN acak
+    rows = [
+        (p, t) for p in ["Aceh", "Bali", "Papua", "Riau"] for t in range(2015, 2023)
+        for _ in range(int(rng.integers(0, 3)))
+    ]
+    df = pd.DataFrame(rows, columns=["Provinsi", "Tahun"])
+    for c in KOLOM:
+        df[c] = rng.normal(50, 10, len(df))
+        df.loc[rng.random(len(df)) < 0.25, c] = np.nan
+    df.loc[df["Provinsi"] == "Riau", "TPT"] = np.nan    # kolom kosong penuh
+    return df
+
+
+def _agregat(df):
+    agg = df.groupby(["Provinsi", "Tahun"]).agg(
+        __rows=("Provinsi", "size"),
+        **{f"s_{c}": (c, "sum") for c in KOLOM},
+        **{f"c_{c}": (c, "count") for c in KOLOM},
+    )
+    return agg.reset_index()
+
+
+@pytest.fixture(scope="module", params=["baris", "agregat"])
+def cube(request, data):
+    if request.param == "baris":
+        return Cube(data, "Provinsi", "Tahun", KOLOM)
+    return Cube.from_aggregates(_agregat(data), "Provinsi", "Tahun", KOLOM)
+
+
+FILTER = [
+    (["Aceh", "Bali", "Papua", "Riau"], (2015, 2022)),
+    (["Bali", "Riau"], (2017, 2020)),
+    (["Papua"], (2010, 2016)),
+]
+
+
+def _sub(df, provinsi, tahun):
+    return df[df["Provinsi"].isin(provinsi) & df["Tahun"].between(*tahun)]
+
+
+@pytest.mark.parametrize("provinsi, tahun", FILTER)
+def test_mean(cube, data, provinsi, tahun):
+    ref = _sub(data, provinsi, tahun)[KOLOM].mean()
+    pd.testing.assert_series_equal(cube.mean(provinsi, tahun), ref)
+
+
+@pytest.mark.parametrize("provinsi, tahun", FILTER)
+def test_prov_means(cube, data, provinsi, tahun):
+    for col in KOLOM:
+        ref = _sub(data, provinsi, tahun).groupby("Provinsi")[col].mean().reset_index()
+        pd.testing.assert_frame_equal(cube.prov_means(provinsi, tahun, col), ref)
+
+
+@pytest.mark.parametrize("provinsi, tahun", FILTER)
+def test_year_means(cube, data, provinsi, tahun):
+    ref = _sub(data, provinsi, tahun).groupby("Tahun")[KOLOM].mean()
+    pd.testing.assert_frame_equal(cube.year_means(provinsi, tahun), ref, check_index_type=False)
+
+
+@pytest.mark.parametrize("provinsi, tahun", FILTER)
+def test_year_prov_means(cube, data, provinsi, tahun):
+    for col in KOLOM:
+        ref = (
+            _sub(data, provinsi, tahun).groupby(["Tahun", "Provinsi"])[col].mean()
+            .reset_index()
+        )
+        pd.testing.assert_frame_equal(
+            cube.year_prov_means(provinsi, tahun, col), ref, check_dtype=False
+        )
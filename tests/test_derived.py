@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backend import PandasBackend
+from core.dataset import Dataset, normalize
+from core.derived import DerivedBackend, derived_name, with_derived
+
+NAN = np.nan
+
+# Panel kecil yang dihitung tangan: Aceh tidak punya baris 2020 (tahun
+# bolong), Bali punya baris 2018 tetapi IPM-nya kosong.
+PANEL = [
+    ("Aceh", 2018, 100.0, 5.0),
+    ("Aceh", 2019, 110.0, 6.0),
+    ("Aceh", 2021, 121.0, 7.0),
+    ("Aceh", 2022, 133.1, 8.0),
+    ("Bali", 2018, NAN, 1.0),
+    ("Bali", 2019, 50.0, 2.0),
+    ("Bali", 2020, 60.0, 3.0),
+    ("Bali", 2021, 45.0, 4.0),
+    ("Bali", 2022, 90.0, 5.0),
+]
+
+# (provinsi, tahun) -> nilai yang diharapkan per turunan IPM
+HARAPAN = {
+    "(YoY %)": {
+        ("Aceh", 2018): NAN, ("Aceh", 2019): 10.0,
+        ("Aceh", 2021): NAN,                       # 2020 kosong
+        ("Aceh", 2022): 10.0,
+        ("Bali", 2018): NAN, ("Bali", 2019): NAN,  # 2018 kosong
+        ("Bali", 2020): 20.0, ("Bali", 2021): -25.0, ("Bali", 2022): 100.0,
+    },
+    "(MA-3)": {
+        # Tiap jendela Aceh mulai 2020 menyentuh tahun bolong
+        ("Aceh", 2018): NAN, ("Aceh", 2019): NAN, ("Aceh", 2021): NAN, ("Aceh", 2022): NAN,
+        ("Bali", 2018): NAN, ("Bali", 2019): NAN, ("Bali", 2020): NAN,
+        ("Bali", 2021): (50 + 60 + 45) / 3, ("Bali", 2022): (60 + 45 + 90) / 3,
+    },
+    "(Indeks)": {
+        ("Aceh", 2018): 100.0, ("Aceh", 2019): 110.0, ("Aceh", 2021): 121.0,
+        ("Aceh", 2022): 133.1,
+        # Tahun dasar Bali = 2019, tahun pertama yang terisi
+        ("Bali", 2018): NAN, ("Bali", 2019): 100.0, ("Bali", 2020): 120.0,
+        ("Bali", 2021): 90.0, ("Bali", 2022): 180.0,
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def be():
+    df, schema = normalize(pd.DataFrame(PANEL, columns=["Provinsi", "Tahun", "ipm", "tpt"]))
+    return PandasBackend(Dataset(df, schema, "uji-turunan"))
+
+
+@pytest.mark.parametrize("tag", list(HARAPAN))
+def test_nilai_turunan_dihitung_tangan(be, tag):
+    nama = derived_name("ipm", tag)
+    df = with_derived(be, [nama]).filter(["Aceh", "Bali"], (2018, 2022))
+    hasil = dict(zip(zip(df["Provinsi"], df["Tahun"]), df[nama]))
+    assert hasil.keys() == HARAPAN[tag].keys()
+    for kunci, nilai in HARAPAN[tag].items():
+        if np.isnan(nilai):
+            assert np.isnan(hasil[kunci]), kunci
+        else:
+            assert hasil[kunci] == pytest.approx(nilai), kunci
+
+
+def test_hanya_kolom_yang_diminta(be):
+    nama = [derived_name("ipm", "(YoY %)"), derived_name("tpt", "(Indeks)")]
+    dbe = with_derived(be, nama + ["ipm"])
+    assert isinstance(dbe, DerivedBackend)
+    assert dbe.names == tuple(nama)
+    assert dbe.schema.indikator == ("ipm", "tpt", *nama)
+    assert list(dbe.cube.kolom) == ["ipm", "tpt", *nama]
+
+    df = dbe.filter(["Aceh", "Bali"], (2018, 2022))
+    assert list(df.columns) == ["Provinsi", "Tahun", "ipm", "tpt", *nama]
+    halaman, total = dbe.table_page(["Aceh"], (2018, 2022), [nama[0]], [False], "", 0, 10)
+    assert list(halaman.columns) == list(df.columns)
+    assert total == 4
+
+    # Tanpa nama turunan backend dasar dikembalikan apa adanya
+    assert with_derived(be, ["ipm"]) is be
@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from core import export
+from core.export import _write_csv, _write_xlsx
+
+
+def _frame():
+    return pd.DataFrame({
+        "Provinsi": pd.Categorical(["Aceh", "Bali"]),
+        "Tahun": np.array([2023, 2024], dtype=np.int16),
+        "IPM": np.array([69.7, np.nan], dtype=np.float32),
+        "AHH": np.array([66.48, 72.155], dtype=np.float32),
+    })
+
+
+def test_xlsx_menulis_nilai_float32_seperti_sumber(tmp_path):
+    path = tmp_path / "data.xlsx"
+    _write_xlsx(_frame(), path)
+    rows = list(load_workbook(path).active.iter_rows(values_only=True))
+    assert rows == [
+        ("Provinsi", "Tahun", "IPM", "AHH"),
+        ("Aceh", 2023, 69.7, 66.48),
+        ("Bali", 2024, None, 72.155),
+    ]
+
+
+def test_csv_menulis_nilai_float32_seperti_sumber(tmp_path):
+    path = tmp_path / "data.csv"
+    _write_csv(_frame(), path)
+    assert path.read_text().splitlines()[1] == "Aceh,2023,69.7,66.48"
+
+
+def test_prune_melewati_tmp_dan_file_yang_hilang(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(export, "MAX_FILES", 2)
+    for i in range(4):
+        path = tmp_path / f"f{i}.csv"
+        path.write_text("x")
+        os.utime(path, (i, i))
+    (tmp_path / "f9.csv.123.tmp").write_text("sedang ditulis")
+
+    getmtime = os.path.getmtime
+
+    def hilang(path):
+        # f0 dihapus proses lain setelah listdir
+        if path.endswith("f0.csv"):
+            raise FileNotFoundError(path)
+        return getmtime(path)
+
+    monkeypatch.setattr(export.os.path, "getmtime", hilang)
+    export._prune()
+    assert sorted(os.listdir(tmp_path)) == ["f0.csv", "f2.csv", "f3.csv", "f9.csv.123.tmp"]
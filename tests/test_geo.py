@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from core.geo import TOLERANSI, _dp_mask, simplify_geometry
+
+
+def _lingkaran(n=400, r=1.0, cx=110.0, cy=-7.0, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    rr = r * (1 + 0.05 * rng.normal(size=n))
+    ring = np.column_stack([cx + rr * np.cos(t), cy + rr * np.sin(t)])
+    return np.vstack([ring, ring[:1]]).tolist()        # tertutup
+
+
+@pytest.mark.parametrize("tol", [0.0, *TOLERANSI.values(), 0.5])
+def test_dp_mempertahankan_titik_ujung(tol):
+    pts = np.asarray(_lingkaran())
+    keep = _dp_mask(pts, tol)
+    assert keep[0] and keep[-1]
+    if tol == 0.0:
+        assert keep.all()
+
+
+def test_dp_garis_lurus_tinggal_dua_titik():
+    pts = np.column_stack([np.linspace(0, 1, 50), np.linspace(0, 2, 50)])
+    assert _dp_mask(pts, 1e-9).sum() == 2
+
+
+@pytest.mark.parametrize("tol", TOLERANSI.values())
+def test_ring_tetap_tertutup(tol):
+    geom = {"type": "Polygon", "coordinates": [_lingkaran(), _lingkaran(r=0.3, seed=1)]}
+    out = simplify_geometry(geom, tol)
+    assert out["type"] == "MultiPolygon"
+    for polygon in out["coordinates"]:
+        for ring in polygon:
+            assert len(ring) >= 4
+            assert ring[0] == ring[-1]
+
+
+def test_pulau_kecil_dibuang_tapi_provinsi_tetap_ada():
+    besar = [_lingkaran(r=1.0)]
+    kecil = [_lingkaran(n=8, r=0.001, cx=120.0)]
+    out = simplify_geometry({"type": "MultiPolygon", "coordinates": [besar, kecil]}, 0.05)
+    assert len(out["coordinates"]) == 1
+
+
+def test_fallback_tidak_pernah_none():
+    # Ring kolinear (sliver): tinggal 3 titik bahkan pada toleransi 0
+    kecil = [[[100.0, 1.0], [100.5, 1.0], [101.0, 1.0], [100.5, 1.0], [100.0, 1.0]]]
+    out = simplify_geometry({"type": "Polygon", "coordinates": kecil}, 0.05)
+    assert out["coordinates"] and None not in out["coordinates"]
+    ring = out["coordinates"][0][0]
+    assert ring[0] == ring[-1]
@@ -0,0 +1,81 @@
+import os
+
+import pandas as pd
+import pytest
+
+from core import ingest
+
+
+@pytest.fixture
+def sumber(tmp_path, monkeypatch):
+    monkeypatch.setattr(ingest, "CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "data.csv"
+    path.write_text("Provinsi,Tahun,IPM\nAceh,2023,73.4\nBali,2023,78.0\n")
+    return str(path)
+
+
+@pytest.fixture
+def parse(monkeypatch):
+    # Hitung berapa kali file sumber benar-benar di-parse
+    calls = []
+    asli = ingest._read_source
+    monkeypatch.setattr(ingest, "_read_source", lambda p: calls.append(p) or asli(p))
+    return calls
+
+
+def _sentuh(path, detik=10):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + detik * 10**9))
+
+
+def test_cache_dipakai_ulang_bila_tidak_berubah(sumber, parse):
+    pertama = ingest.ingest(sumber)
+    assert ingest.ingest(sumber) == pertama
+    assert len(parse) == 1
+    assert pd.read_parquet(pertama["parquet"])["IPM"].tolist() == [73.4, 78.0]
+
+
+def test_mtime_berubah_isi_sama_tidak_parse_ulang(sumber, parse):
+    pertama = ingest.ingest(sumber)
+    _sentuh(sumber)
+    kedua = ingest.ingest(sumber)
+    assert len(parse) == 1
+    assert kedua["sha256"] == pertama["sha256"]
+    assert kedua["mtime_ns"] != pertama["mtime_ns"]
+
+
+def test_isi_berubah_dibangun_ulang(sumber, parse):
+    pertama = ingest.ingest(sumber)
+    with open(sumber, "a") as f:
+        f.write("Banten,2023,75.8\n")
+    _sentuh(sumber)
+    kedua = ingest.ingest(sumber)
+    assert len(parse) == 2
+    assert kedua["sha256"] != pertama["sha256"]
+    assert len(ingest.load_table(sumber)) == 3
+
+
+def test_versi_pipeline_berubah_dibangun_ulang(sumber, parse, monkeypatch):
+    ingest.ingest(sumber)
+    monkeypatch.setattr(ingest, "PIPELINE", ingest.PIPELINE + 1)
+    manifest = ingest.ingest(sumber)
+    assert len(parse) == 2
+    assert manifest["pipeline"] == ingest.PIPELINE
+
+
+def test_karantina_dimuat_sekali_per_versi(sumber, monkeypatch):
+    from core import dataset
+
+    with open(sumber, "a") as f:
+        f.write("Riau,2023,-\n")
+    dibaca = []
+    monkeypatch.setattr(
+        dataset, "load_quarantine", lambda p: dibaca.append(p) or ingest.load_quarantine(p)
+    )
+    versi = ingest.ingest(sumber)["sha256"][:16]
+    for _ in range(3):
+        dataset.render_quarantine(sumber, versi)
+    assert len(dibaca) == 1
+    assert len(dataset._karantina(versi, sumber)) == 1
+    dataset.render_quarantine(sumber, versi + "-baru")
+    assert len(dibaca) == 2
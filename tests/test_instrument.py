@@ -0,0 +1,54 @@
+import json
+import logging
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+
+def _halaman():
+    import types
+
+    from core import instrument
+    from core.instrument import begin_rerun, end_rerun, fragment, stage
+
+    @fragment
+    def bagian():
+        with stage("table"):
+            pass
+
+    begin_rerun()
+    with stage("load"):
+        pass
+    end_rerun("Halaman")
+
+    # Simulasikan rerun khusus fragment setelah rerun halaman selesai
+    asli = instrument.get_script_run_ctx
+    instrument.get_script_run_ctx = lambda: types.SimpleNamespace(fragment_ids_this_run=["f"])
+    try:
+        bagian()
+    finally:
+        instrument.get_script_run_ctx = asli
+
+
+@pytest.fixture
+def records(monkeypatch):
+    monkeypatch.setenv("KELOMPOK1_PROFILE", "1")
+    hasil = []
+    handler = logging.Handler()
+    handler.emit = lambda r: hasil.append(json.loads(r.getMessage()))
+    logger = logging.getLogger("kelompok1.timing")
+    level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield hasil
+    logger.removeHandler(handler)
+    logger.setLevel(level)
+
+
+def test_fragment_mencatat_record_sendiri(records):
+    at = AppTest.from_function(_halaman).run()
+    assert not at.exception
+    halaman, bagian = records
+    assert "fragment" not in halaman and set(halaman["stages"]) == {"load"}
+    assert bagian["page"] == "Halaman" and bagian["fragment"] == "bagian"
+    assert set(bagian["stages"]) == {"table"}
@@ -0,0 +1,66 @@
+import logging
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from core import export
+from core.filters import KEY_HASIL, KEY_STATE, FilterState
+
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+
+def _run(page, state=None):
+    at = AppTest.from_file(page, default_timeout=60)
+    if state is not None:
+        at.session_state[KEY_STATE] = state
+    return at.run()
+
+
+@pytest.mark.parametrize("page", ["pages/page2.py", "pages/page3.py"])
+def test_halaman_tanpa_provinsi(page):
+    at = _run(page, FilterState((), (2000, 2100)))
+    assert not at.exception
+    assert any("provinsi" in i.value.lower() for i in at.info)
+
+
+def test_grafik_page2_default():
+    at = _run("pages/page2.py")
+    assert not at.exception
+    assert at.get("plotly_chart")
+
+
+def test_ekspor_page3_berupa_tautan_statis(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_DIR", str(tmp_path))
+    at = _run("pages/page3.py")
+    siapkan = [b for b in at.button if b.label.startswith("Siapkan File")]
+    siapkan[0].click().run()
+    assert not at.exception
+    assert any("app/static/export/" in m.value for m in at.markdown)
+    # Rerun berikutnya hanya merender tautan; file tidak dibaca ulang
+    at.run()
+    assert not [b for b in at.button if b.label.startswith("Siapkan File")]
+
+
+def test_cache_sesi_tidak_menyimpan_frame_baris():
+    at = _run("pages/page2.py", FilterState(("ACEH", "BALI", "PAPUA"), (2018, 2022)))
+    assert not at.exception
+    hasil = at.session_state[KEY_HASIL]
+    seleksi = [v for k, v in hasil.items() if k[1] == "selection"]
+    assert seleksi and all(isinstance(v, tuple) for v in seleksi)
+    assert not any(k[1] == "filter" for k in hasil)
+
+
+def test_warmup_memanaskan_tampilan_pertama_page2():
+    from core.charts import chart_cache
+    from core.warmup import _steps
+
+    chart_cache().clear()
+    for _, fn in _steps():
+        fn()
+    sebelum = chart_cache().stats()
+    at = _run("pages/page2.py")
+    assert not at.exception
+    sesudah = chart_cache().stats()
+    # Grafik tampilan pertama (filter bersama default) sudah ada di cache
+    assert sesudah["misses"] == sebelum["misses"]
+    assert sesudah["hits"] > sebelum["hits"]
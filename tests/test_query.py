@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.query import ProvinceYearIndex
+
+PROVINSI = [f"P{i:02d}" for i in range(12)]
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    rows = [
+        (p, t) for p in PROVINSI for t in range(2010, 2025)
+        if rng.random() > 0.15                 # sebagian tahun kosong per provinsi
+    ]
+    df = pd.DataFrame(rows, columns=["Provinsi", "Tahun"])
+    df["IPM"] = rng.normal(70, 3, len(df))
+    return df, ProvinceYearIndex(df, "Provinsi", "Tahun")
+
+
+def _mask(df, provinsi, tahun):
+    m = df["Provinsi"].isin(provinsi) & df["Tahun"].between(*tahun)
+    return df[m]
+
+
+def _seleksi(n=50, seed=1):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        k = int(rng.integers(0, len(PROVINSI) + 1))
+        awal, akhir = sorted(rng.integers(2008, 2027, 2).tolist())
+        yield rng.choice(PROVINSI, k, replace=False).tolist(), (awal, akhir)
+
+
+def test_sama_dengan_mask_boolean(data):
+    df, idx = data
+    for provinsi, tahun in _seleksi():
+        pd.testing.assert_frame_equal(idx.filter(provinsi, tahun), _mask(df, provinsi, tahun))
+        np.testing.assert_array_equal(
+            idx.positions(provinsi, tahun),
+            np.flatnonzero(df.index.isin(_mask(df, provinsi, tahun).index)),
+        )
+
+
+@pytest.mark.parametrize("provinsi, tahun", [
+    (["P03", "P04", "P05"], (2000, 2030)),     # provinsi berurutan, semua tahun
+    (["P07"], (2012, 2018)),
+])
+def test_rentang_bersambung_berupa_slice(data, provinsi, tahun):
+    df, idx = data
+    starts, _ = idx.ranges(provinsi, tahun)
+    assert len(starts) == 1
+    hasil = idx.filter(provinsi, tahun)
+    assert np.shares_memory(hasil["IPM"].to_numpy(), df["IPM"].to_numpy())
+    pd.testing.assert_frame_equal(hasil, _mask(df, provinsi, tahun))
+
+
+@pytest.mark.parametrize("provinsi, tahun", [
+    ([], (2010, 2024)),
+    (["P01"], (2030, 2031)),
+    (["Tidak Ada"], (2010, 2024)),
+])
+def test_seleksi_kosong(data, provinsi, tahun):
+    df, idx = data
+    assert idx.filter(provinsi, tahun).empty
+    assert len(idx.positions(provinsi, tahun)) == 0
+
+
+def test_menolak_data_tidak_terurut(data):
+    df, _ = data
+    with pytest.raises(ValueError):
+        ProvinceYearIndex(df.iloc[::-1], "Provinsi", "Tahun")
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from core import report
+
+
+def test_cli_dua_provinsi(tmp_path, capsys):
+    report.main([
+        "--output", str(tmp_path), "--provinsi", "Aceh", "bali",
+        "--tahun", "2020", "2023", "--indikator", "ipm", "--workers", "1",
+    ])
+    assert "2 laporan" in capsys.readouterr().out
+    assert sorted(os.listdir(tmp_path)) == ["aceh.html", "bali.html", "index.html"]
+
+    index = (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert "href='aceh.html'" in index
+    assert "href='bali.html'" in index
+    assert "2020–2023" in index
+    assert "ipm" in (tmp_path / "aceh.html").read_text(encoding="utf-8").lower()
+
+
+def test_cli_indikator_tidak_dikenal(tmp_path, capsys):
+    with pytest.raises(SystemExit) as err:
+        report.main(["--output", str(tmp_path), "--indikator", "bukan_indikator"])
+    assert err.value.code == 2
+    assert "indikator tidak dikenal: bukan_indikator" in capsys.readouterr().err
+    assert not os.listdir(tmp_path)
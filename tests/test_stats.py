@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.stats import MODEL_FE, MODEL_POOLED, fit_panel, ols_batch
+
+
+def _panel(seed=0, n_prov=6, n_tahun=8):
+    rng = np.random.default_rng(seed)
+    prov = np.repeat([f"P{i}" for i in range(n_prov)], n_tahun)
+    efek = np.repeat(rng.normal(0, 3, n_prov), n_tahun)
+    x1, x2 = rng.normal(size=(2, len(prov)))
+    y = 1.5 + 2.0 * x1 - 0.5 * x2 + efek + rng.normal(0, 0.3, len(prov))
+    df = pd.DataFrame({"prov": prov, "x1": x1, "x2": x2, "y": y})
+    df.loc[rng.random(len(df)) < 0.1, "x2"] = np.nan
+    return df
+
+
+def _lstsq(y, X):
+    beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+    resid = y - X @ beta
+    sigma2 = resid @ resid / (len(y) - X.shape[1])
+    se = np.sqrt(np.diag(np.linalg.inv(X.T @ X)) * sigma2)
+    return beta, se
+
+
+def test_pooled_sama_dengan_lstsq():
+    df = _panel().dropna()
+    X = df[["x1", "x2"]].to_numpy()
+    res = ols_batch(df["y"].to_numpy()[None], X[None])
+    beta, se = _lstsq(df["y"].to_numpy(), np.column_stack([np.ones(len(df)), X]))
+    np.testing.assert_allclose(res["coef"][0], beta[1:])
+    np.testing.assert_allclose(res["se"][0], se[1:])
+
+
+def test_efek_tetap_sama_dengan_dummy_provinsi():
+    df = _panel(1)
+    out = fit_panel(df, "prov", [("y", ("x1", "x2"))], MODEL_FE)
+    ref = df.dropna()
+    dummy = pd.get_dummies(ref["prov"], dtype=float).to_numpy()
+    beta, se = _lstsq(ref["y"].to_numpy(), np.column_stack([ref[["x1", "x2"]], dummy]))
+    np.testing.assert_allclose(out["Koefisien"], beta[:2])
+    np.testing.assert_allclose(out["Std. Error"], se[:2])
+    assert (out["n"] == len(ref)).all()
+
+
+@pytest.mark.parametrize("model", [MODEL_POOLED, MODEL_FE])
+def test_batch_sama_dengan_model_tunggal(model):
+    df = _panel(2)
+    specs = [("y", ("x1",)), ("y", ("x2",)), ("x1", ("x2",))]
+    batch = fit_panel(df, "prov", specs, model)
+    for i, spec in enumerate(specs):
+        tunggal = fit_panel(df, "prov", [spec], model)
+        np.testing.assert_allclose(
+            batch.iloc[i][["Koefisien", "Std. Error", "R²"]].astype(float),
+            tunggal.iloc[0][["Koefisien", "Std. Error", "R²"]].astype(float),
+        )
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from core.backend import PandasBackend
+from core.dataset import dataset_interaktif
+from core.filters import KEY_STATE, FilterState
+
+
+@pytest.fixture(scope="module")
+def be():
+    return PandasBackend(dataset_interaktif())
+
+
+def _referensi(be, provinsi, tahun, by, ascending, cari):
+    df = be.filter(provinsi, tahun)
+    if cari:
+        df = df[df["Provinsi"].astype(str).str.casefold().str.contains(cari.casefold())]
+    if by:
+        df = df.sort_values(by, ascending=ascending, kind="stable", na_position="last")
+    return df
+
+
+@pytest.mark.parametrize("by, ascending", [
+    (None, None),
+    (["IPM"], [False]),
+    (["Tahun", "TPT"], [True, False]),
+    (["Provinsi"], [False]),
+])
+@pytest.mark.parametrize("cari", ["", "sumatera", "JAWA"])
+def test_urut_cari_dan_halaman(be, by, ascending, cari):
+    provinsi, tahun = be.provinces, (be.year_min + 1, be.year_max)
+    ref = _referensi(be, provinsi, tahun, by, ascending, cari)
+    for awal in (0, 10, len(ref) - 5):
+        halaman, total = be.table_page(provinsi, tahun, by, ascending, cari, awal, 10)
+        assert total == len(ref)
+        pd.testing.assert_frame_equal(halaman, ref.iloc[max(awal, 0):awal + 10])
+
+
+def _halaman_tabel(at):
+    return at.number_input(key="tabel_interaktif_hal")
+
+
+def test_halaman_kembali_ke_1_saat_hasil_kosong():
+    at = AppTest.from_file("pages/page2.py", default_timeout=60).run()
+    _halaman_tabel(at).set_value(3).run()
+    assert _halaman_tabel(at).value == 3
+
+    semua = at.session_state[KEY_STATE]
+    at.session_state[KEY_STATE] = FilterState((), semua.tahun)
+    at.run()
+    assert not at.exception
+    assert _halaman_tabel(at).value == 1
+
+    at.session_state[KEY_STATE] = semua
+    at.run()
+    assert not at.exception
+    assert _halaman_tabel(at).value == 1
+    assert _halaman_tabel(at).label != "Halaman (dari 1)"
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.validate import (
+    ALASAN_BUKAN_ANGKA,
+    ALASAN_KOSONG,
+    ALASAN_PROVINSI,
+    ALASAN_TAHUN,
+    KOLOM_KARANTINA,
+    coerce_numeric,
+    validate_table,
+)
+
+# (nilai mentah, float yang diharapkan atau NaN, alasan penolakan)
+KASUS = [
+    ("12,5", 12.5, None),                       # desimal koma
+    ("1.234,5", 1234.5, None),                  # ribuan titik + desimal koma
+    ("1.234.567,25", 1234567.25, None),
+    ("1,234.5", 1234.5, None),                  # ribuan koma + desimal titik
+    ("12.5", 12.5, None),
+    (" 7 ", 7.0, None),
+    ("12,5*", 12.5, None),                      # catatan kaki
+    ("12.5¹", 12.5, None),
+    ("12,5 a)", 12.5, None),
+    ("12.5(r)", 12.5, None),
+    ("1.234,5**", 1234.5, None),
+    ("-", np.nan, ALASAN_KOSONG),               # penanda kosong BPS
+    ("…", np.nan, ALASAN_KOSONG),
+    ("...", np.nan, ALASAN_KOSONG),
+    ("n.a", np.nan, ALASAN_KOSONG),
+    ("N/A", np.nan, ALASAN_KOSONG),
+    ("abc", np.nan, ALASAN_BUKAN_ANGKA),
+    ("12,5,3x", np.nan, ALASAN_BUKAN_ANGKA),
+]
+
+
+@pytest.mark.parametrize("mentah, harapan, alasan", KASUS)
+def test_coerce_numeric(mentah, harapan, alasan):
+    # Dicampur dengan angka biasa agar jalur teks dan numerik sama-sama lewat
+    nilai, ditolak = coerce_numeric(pd.Series([mentah, 3.0], dtype=object))
+    if np.isnan(harapan):
+        assert np.isnan(nilai[0])
+    else:
+        assert nilai[0] == pytest.approx(harapan)
+    assert pd.isna(ditolak[0]) if alasan is None else ditolak[0] == alasan
+    assert nilai[1] == 3.0 and pd.isna(ditolak[1])
+
+
+def test_coerce_numeric_kolom_angka_apa_adanya():
+    nilai, ditolak = coerce_numeric(pd.Series([1, 2, np.nan]))
+    assert nilai.dtype == np.float64
+    assert ditolak.isna().all()
+
+
+@pytest.fixture
+def tabel():
+    return pd.DataFrame({
+        "Provinsi": ["Aceh", "Bali", None, "  ", "Riau", "Jambi", "Papua"],
+        "Tahun": ["2020", "2021", "2020", "2021", "20x0", "2020.5", "2022"],
+        "IPM": ["70,5", "-", "71", "72", "73", "74", "1.234,5"],
+        "TPT": ["5,1*", "6", "7", "8", "9", "10", "abc"],
+    })
+
+
+def test_validate_table_baris_bersih(tabel):
+    bersih, _ = validate_table(tabel)
+    # Provinsi kosong, tahun tak terbaca dan tahun pecahan dibuang
+    assert bersih["Provinsi"].tolist() == ["Aceh", "Bali", "Papua"]
+    assert bersih["Tahun"].tolist() == [2020, 2021, 2022]
+    assert bersih["Tahun"].dtype == np.int64
+    np.testing.assert_array_equal(bersih["IPM"], [70.5, np.nan, 1234.5])
+    np.testing.assert_array_equal(bersih["TPT"], [5.1, 6.0, np.nan])
+
+
+def test_validate_table_karantina(tabel):
+    _, karantina = validate_table(tabel)
+    assert list(karantina.columns) == KOLOM_KARANTINA
+    # (baris di file sumber = indeks + 2 karena header, kolom, nilai, alasan)
+    harapan = {
+        (4, "Provinsi", ALASAN_PROVINSI),
+        (5, "Provinsi", ALASAN_PROVINSI),
+        (6, "Tahun", ALASAN_TAHUN),
+        (7, "Tahun", ALASAN_TAHUN),
+        (3, "IPM", ALASAN_KOSONG),
+        (8, "TPT", ALASAN_BUKAN_ANGKA),
+    }
+    assert set(zip(karantina["baris"], karantina["kolom"], karantina["alasan"])) == harapan
+    assert karantina["baris"].dtype == np.int64
+
+    baris = karantina.set_index(["baris", "kolom"])
+    assert baris.loc[(3, "IPM"), "nilai"] == "-"
+    assert baris.loc[(3, "IPM"), "provinsi"] == "Bali"
+    assert baris.loc[(6, "Tahun"), "nilai"] == "20x0"
+    assert baris.loc[(8, "TPT"), "tahun"] == "2022"
+
+
+def test_validate_table_tanpa_penolakan():
+    bersih, karantina = validate_table(pd.DataFrame({
+        "Provinsi": ["Aceh"], "Tahun": [2020], "IPM": [70.5],
+    }))
+    assert len(bersih) == 1
+    assert karantina.empty
+    assert list(karantina.columns) == KOLOM_KARANTINA